@@ -1,8 +1,11 @@
 from .functions import (
     # Discovery & Creation
     create_video,
+    acreate_video,
     generate_ideas,
+    generate_ideas_batch,
     list_projects,
+    count_projects,
     # Inspection
     get_project_status,
     get_script,
@@ -12,6 +15,7 @@ from .functions import (
     update_script_section,
     remove_footage,
     replace_footage,
+    replace_footage_batch,
     change_voice,
     change_music,
     regenerate_voiceover,
@@ -20,11 +24,15 @@ from .functions import (
     approve_video,
     kill_video,
 )
+from .jobs import get_render_status, wait_for_render
 
 __all__ = [
     "create_video",
+    "acreate_video",
     "generate_ideas",
+    "generate_ideas_batch",
     "list_projects",
+    "count_projects",
     "get_project_status",
     "get_script",
     "get_footage_list",
@@ -32,10 +40,13 @@ __all__ = [
     "update_script_section",
     "remove_footage",
     "replace_footage",
+    "replace_footage_batch",
     "change_voice",
     "change_music",
     "regenerate_voiceover",
     "render_preview",
     "approve_video",
     "kill_video",
+    "get_render_status",
+    "wait_for_render",
 ]
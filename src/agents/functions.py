@@ -4,15 +4,48 @@ These functions are designed to be called by Claude Code or other AI agents
 to create, modify, and manage video projects.
 """
 
+import asyncio
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
-from ..core.config import get_niche_config, get_voice_config
+from ..core.config import get_niche_config, resolve_voice, settings
 from ..core.database import get_db
 from ..core.project import FootageClip, Project, ProjectStatus
-from ..generators import generate_metadata, generate_script, generate_video_ideas, generate_voiceover
-from ..media import download_clip, get_footage_for_script
+from ..generators import (
+    agenerate_script_and_metadata,
+    generate_video_ideas_batch,
+    generate_voiceover,
+)
+from ..media import adownload_clips, download_clips, get_footage_for_script
 from ..media.assembler import render_final, render_preview as _render_preview
+from ..media.footage import find_replacement_footage
+from .jobs import submit_render_job
+
+
+# Built-in music moods accepted by change_music()
+_MUSIC_MOODS: frozenset[str] = frozenset({"energetic", "calm", "dramatic"})
+
+# Status strings accepted by list_projects()
+_VALID_STATUSES: frozenset[str] = frozenset(status.value for status in ProjectStatus)
+
+# Loaded projects, reused across calls while project.json is unchanged on disk
+_project_cache: dict[str, Project] = {}
+
+
+def _load_project(project_id: str) -> Optional[Project]:
+    """Load a project, reusing the cached instance if its state file is unchanged."""
+    project = _project_cache.get(project_id)
+    if project is not None and not project.is_stale():
+        return project
+
+    project = Project.load(project_id)
+    if project is None:
+        _project_cache.pop(project_id, None)
+    else:
+        _project_cache[project_id] = project
+    return project
 
 
 # ============================================================================
@@ -25,23 +58,55 @@ def create_video(
     niche: Optional[str] = None,
     voice_key: Optional[str] = None,
     auto_generate: bool = True,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Create a new video project.
 
     This creates a project, generates script, fetches footage, generates voiceover,
-    and leaves it ready for review.
+    and leaves it ready for review. Call acreate_video() instead from code that
+    is already running an event loop.
 
     Args:
         topic: The video topic (e.g., "5 budgeting tips for beginners")
         niche: Optional niche for style customization (e.g., "finance")
         voice_key: Optional voice key from voices.yaml (e.g., "adam")
         auto_generate: If True, automatically generate all components
+        use_cache: If False, regenerate the script and metadata instead of
+            reusing cached results for the same inputs
+
+    Returns:
+        Dict with project info and status
+    """
+    return asyncio.run(acreate_video(topic, niche, voice_key, auto_generate, use_cache))
+
+
+async def acreate_video(
+    topic: str,
+    niche: Optional[str] = None,
+    voice_key: Optional[str] = None,
+    auto_generate: bool = True,
+    use_cache: bool = True,
+) -> dict[str, Any]:
+    """Async version of create_video().
+
+    The script and metadata come from one async LLM call, voiceover and
+    footage generation run concurrently, and all footage downloads are
+    multiplexed on one async HTTP client.
+
+    Args:
+        topic: The video topic (e.g., "5 budgeting tips for beginners")
+        niche: Optional niche for style customization (e.g., "finance")
+        voice_key: Optional voice key from voices.yaml (e.g., "adam")
+        auto_generate: If True, automatically generate all components
+        use_cache: If False, regenerate the script and metadata instead of
+            reusing cached results for the same inputs
 
     Returns:
         Dict with project info and status
     """
     # Create project
     project = Project.create(topic, niche)
+    _project_cache[project.id] = project
 
     db = get_db()
     db.create_project(project.id, topic, niche)
@@ -57,89 +122,118 @@ def create_video(
     if not auto_generate:
         return result
 
-    try:
-        # Generate script
-        script_result = generate_script(topic, niche)
-        project.set_script(script_result["script"])
-        project._state.hook_text = script_result["hook"]
-        project.save_state()
-        result["steps_completed"].append("script")
-
-        # Set voice
-        if voice_key:
-            voice_config = get_voice_config(voice_key)
-            project.set_voice(voice_config.get("voice_id", ""), voice_key)
-        else:
-            # Use niche default
+    # Persist project.json once for the whole pipeline instead of per step
+    with project.batched_writes():
+        try:
+            # Generate script and metadata in one LLM call
+            script_result = await agenerate_script_and_metadata(
+                topic, niche, use_cache=use_cache
+            )
+            project.set_script(script_result["script"])
+            project._state.hook_text = script_result["hook"]
+            project.save_state()
+            result["steps_completed"].append("script")
+
             niche_config = get_niche_config(niche)
-            default_voice_key = niche_config.get("voice", {}).get("voice_key", "sam")
-            voice_config = get_voice_config(default_voice_key)
-            project.set_voice(voice_config.get("voice_id", ""), default_voice_key)
-
-        # Get music mood from niche
-        niche_config = get_niche_config(niche)
-        music_mood = niche_config.get("music_mood", "calm")
-        project.set_music("", music_mood)
-
-        # Generate voiceover
-        voice_result = generate_voiceover(
-            script_result["script"],
-            project.voiceover_path,
-            voice_key=voice_key or niche_config.get("voice", {}).get("voice_key"),
-            niche=niche,
-        )
-        result["steps_completed"].append("voiceover")
-        result["duration"] = voice_result["duration"]
-
-        # Fetch footage
-        from ..core.config import settings
-        clips_needed = settings.video.clips_per_video
-        footage_list = get_footage_for_script(script_result["script"], niche, clips_needed=clips_needed)
-
-        for i, footage in enumerate(footage_list):
-            filename = f"{i + 1:03d}_{footage['matched_keyword'].replace(' ', '-')[:20]}.mp4"
-            clip_path = download_clip(footage, project.footage_dir, filename)
-
-            clip = FootageClip(
-                filename=filename,
-                pexels_id=footage["pexels_id"],
-                keyword=footage["matched_keyword"],
-                duration=footage["duration"],
-                url=footage["url"],
+
+            # Set voice (explicit key, else the niche default)
+            voice_id, resolved_voice_key, _ = resolve_voice(niche, voice_key)
+            project.set_voice(voice_id, resolved_voice_key)
+
+            # Get music mood from niche
+            music_mood = niche_config.get("music_mood", "calm")
+            project.set_music("", music_mood)
+
+            # Voiceover (ElevenLabs) and footage (Pexels) only depend on the
+            # script, so run the network-bound steps concurrently.
+            # Project state is only mutated here, on the event loop thread.
+            voice_result, downloaded = await asyncio.gather(
+                asyncio.to_thread(
+                    generate_voiceover,
+                    script_result["script"],
+                    project.voiceover_path,
+                    voice_key=resolved_voice_key,
+                    niche=niche,
+                ),
+                _afetch_footage(script_result["script"], niche, project.footage_dir),
             )
-            project.add_footage(clip)
+
+            result["steps_completed"].append("voiceover")
+            result["duration"] = voice_result["duration"]
+
+            for footage, filename in downloaded:
+                clip = FootageClip(
+                    filename=filename,
+                    pexels_id=footage["pexels_id"],
+                    keyword=footage["matched_keyword"],
+                    duration=footage["duration"],
+                    url=footage["url"],
+                )
+                project.add_footage(clip)
 
             # Track in database
-            db.add_footage_usage(
+            db.add_footage_usages(
                 project.id,
-                footage["pexels_id"],
-                footage["matched_keyword"],
-                filename,
+                [
+                    {
+                        "pexels_video_id": footage["pexels_id"],
+                        "keyword": footage["matched_keyword"],
+                        "filename": filename,
+                    }
+                    for footage, filename in downloaded
+                ],
             )
 
-        result["steps_completed"].append("footage")
-        result["footage_count"] = len(footage_list)
+            result["steps_completed"].append("footage")
+            result["footage_count"] = len(downloaded)
 
-        # Generate metadata
-        metadata = generate_metadata(topic, script_result["script"], niche)
-        project.set_metadata(metadata)
-        result["steps_completed"].append("metadata")
+            project.set_metadata(script_result["metadata"])
+            result["steps_completed"].append("metadata")
 
-        # Update status
-        project.set_status(ProjectStatus.DRAFT)
-        db.update_project(project.id, status="draft", script=script_result["script"])
-        db.add_topic_to_history(topic, niche)
+            # Update status
+            project.set_status(ProjectStatus.DRAFT)
+            db.update_project(
+                project.id,
+                status="draft",
+                script=script_result["script"],
+                duration=project.state.duration,
+            )
+            db.add_topic_to_history(topic, niche)
 
-        result["status"] = "draft"
-        result["message"] = f"Video project created successfully. Run render_preview('{project.id}') to generate preview."
+            result["status"] = "draft"
+            result["message"] = f"Video project created successfully. Run render_preview('{project.id}') to generate preview."
 
-    except Exception as e:
-        result["status"] = "error"
-        result["error"] = str(e)
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = str(e)
 
     return result
 
 
+async def _afetch_footage(
+    script: str,
+    niche: Optional[str],
+    footage_dir: Path,
+) -> list[tuple[dict, str]]:
+    """Find and download footage for a script.
+
+    Returns:
+        List of (footage_info, filename) pairs in timeline order
+    """
+    clips_needed = settings.video.clips_per_video
+    footage_list = await asyncio.to_thread(
+        get_footage_for_script, script, niche, clips_needed=clips_needed
+    )
+
+    filenames = [
+        f"{i + 1:03d}_{footage['matched_keyword'].replace(' ', '-')[:20]}.mp4"
+        for i, footage in enumerate(footage_list)
+    ]
+    downloads = list(zip(footage_list, filenames))
+    await adownload_clips(downloads, footage_dir)
+    return downloads
+
+
 def generate_ideas(
     niche: Optional[str] = None,
     count: int = 5,
@@ -153,26 +247,82 @@ def generate_ideas(
     Returns:
         List of dicts with 'topic' and 'hook' keys
     """
-    return generate_video_ideas(niche, count)
+    try:
+        ideas = _cached_ideas(niche, count, date.today().isoformat())
+    except ValueError:
+        # Unparsable answer (not cached); ask again, accepting the raw fallback
+        return generate_video_ideas_batch([niche], count)[niche]
+    return [dict(idea) for idea in ideas]
+
+
+@lru_cache(maxsize=32)
+def _cached_ideas(niche: Optional[str], count: int, day: str) -> tuple[dict[str, str], ...]:
+    """Ideas for a niche, cached per day (`day` only buckets the cache key).
+
+    Raises on an unparsable response so the fallback is never cached.
+    """
+    return tuple(generate_video_ideas_batch([niche], count, strict=True)[niche])
+
+
+def generate_ideas_batch(
+    niches: list[str],
+    count: int = 5,
+) -> dict[str, list[dict[str, str]]]:
+    """Generate video topic ideas for several niches in one request.
+
+    Args:
+        niches: Niches to generate ideas for (e.g., ["finance", "fitness"])
+        count: Number of ideas to generate per niche
+
+    Returns:
+        Dict mapping each niche to a list of dicts with 'topic' and 'hook' keys
+    """
+    return generate_video_ideas_batch(niches, count)
 
 
 def list_projects(
     status: Optional[str] = None,
+    detailed: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> list[dict[str, Any]]:
-    """List all video projects.
+    """List all video projects, newest first.
 
     Args:
         status: Filter by status ("draft", "preview", "approved", "killed")
+        detailed: If True, load each project for full summaries (slower)
+        limit: Maximum number of projects to return (None for all)
+        offset: Number of projects to skip (for paging)
 
     Returns:
         List of project summaries
     """
     status_enum = None
     if status:
+        if status not in _VALID_STATUSES:
+            raise ValueError(
+                f"Invalid status '{status}'. Expected one of: {', '.join(sorted(_VALID_STATUSES))}"
+            )
         status_enum = ProjectStatus(status)
 
+    if not detailed:
+        return get_db().list_project_summaries(status, limit=limit, offset=offset)
+
     projects = Project.list_all(status_enum)
-    return [p.get_summary() for p in projects]
+    end = None if limit is None else offset + limit
+    return [p.get_summary() for p in projects[offset:end]]
+
+
+def count_projects(status: Optional[str] = None) -> int:
+    """Count video projects, optionally filtered by status.
+
+    Args:
+        status: Filter by status ("draft", "preview", "approved", "killed")
+
+    Returns:
+        Number of matching projects
+    """
+    return get_db().count_projects(status)
 
 
 # ============================================================================
@@ -189,7 +339,7 @@ def get_project_status(project_id: str) -> dict[str, Any]:
     Returns:
         Detailed project information
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
@@ -205,7 +355,7 @@ def get_script(project_id: str) -> dict[str, Any]:
     Returns:
         Dict with script text and metadata
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
@@ -228,7 +378,7 @@ def get_footage_list(project_id: str) -> dict[str, Any]:
     Returns:
         Dict with footage list and details
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
@@ -255,11 +405,12 @@ def update_script(project_id: str, new_script: str) -> dict[str, Any]:
     Returns:
         Status dict
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
     project.set_script(new_script)
+    _sync_script_to_db(project)
 
     return {
         "project_id": project_id,
@@ -270,6 +421,11 @@ def update_script(project_id: str, new_script: str) -> dict[str, Any]:
     }
 
 
+def _sync_script_to_db(project: Project):
+    """Mirror the script and estimated duration into the database summary row."""
+    get_db().update_project(project.id, script=project.get_script(), duration=project.state.duration)
+
+
 def update_script_section(
     project_id: str,
     find: str,
@@ -285,13 +441,14 @@ def update_script_section(
     Returns:
         Status dict
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
     success = project.update_script_section(find, replace)
 
     if success:
+        _sync_script_to_db(project)
         return {
             "project_id": project_id,
             "status": "updated",
@@ -318,7 +475,7 @@ def remove_footage(
     Returns:
         Status dict
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
@@ -359,31 +516,26 @@ def replace_footage(
     Returns:
         Status dict
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
     # Find the clip to replace
-    clip_to_replace = None
-    clip_index = None
-    for i, clip in enumerate(project.state.footage_clips):
-        if clip.filename == clip_name_or_keyword or clip_name_or_keyword.lower() in clip.keyword.lower():
-            clip_to_replace = clip
-            clip_index = i
-            break
-
-    if not clip_to_replace:
+    match = project.find_footage(clip_name_or_keyword)
+
+    if not match:
         return {
             "project_id": project_id,
             "status": "not_found",
             "message": f"No footage found matching '{clip_name_or_keyword}'",
         }
 
+    clip_index, clip_to_replace = match
+
     # Get IDs to exclude
     exclude_ids = [c.pexels_id for c in project.state.footage_clips]
 
     # Find replacement
-    from ..media.footage import find_replacement_footage
     new_footage = find_replacement_footage(new_keyword, exclude_ids, project.state.niche)
 
     if not new_footage:
@@ -393,22 +545,24 @@ def replace_footage(
             "message": f"Could not find replacement footage for '{new_keyword}'",
         }
 
-    # Download new clip
-    filename = f"{clip_index + 1:03d}_{new_keyword.replace(' ', '-')[:20]}.mp4"
-    download_clip(new_footage, project.footage_dir, filename)
-
-    # Remove old clip
-    project.remove_footage(filename=clip_to_replace.filename)
-
-    # Add new clip
-    new_clip = FootageClip(
-        filename=filename,
-        pexels_id=new_footage["pexels_id"],
-        keyword=new_keyword,
-        duration=new_footage["duration"],
-        url=new_footage["url"],
-    )
-    project.add_footage(new_clip)
+    # Download the new clip before touching the old one
+    filename = _replacement_filename(clip_index, new_keyword)
+    download_name = _download_target(project, filename)
+    _download_replacements(project, [(new_footage, download_name)])
+
+    with project.batched_writes():
+        project.remove_footage(filename=clip_to_replace.filename)
+        _finish_download(project, download_name, filename)
+
+        # Add new clip
+        new_clip = FootageClip(
+            filename=filename,
+            pexels_id=new_footage["pexels_id"],
+            keyword=new_keyword,
+            duration=new_footage["duration"],
+            url=new_footage["url"],
+        )
+        project.add_footage(new_clip)
 
     return {
         "project_id": project_id,
@@ -419,6 +573,111 @@ def replace_footage(
     }
 
 
+def replace_footage_batch(
+    project_id: str,
+    replacements: list[tuple[str, str]],
+) -> dict[str, Any]:
+    """Replace several footage clips, downloading all replacements concurrently.
+
+    Args:
+        project_id: The project ID
+        replacements: List of (clip_name_or_keyword, new_keyword) pairs
+
+    Returns:
+        Status dict with per-replacement results
+    """
+    project = _load_project(project_id)
+    if not project:
+        return {"error": f"Project not found: {project_id}"}
+
+    exclude_ids = [c.pexels_id for c in project.state.footage_clips]
+    planned = []  # (old clip, new footage, new keyword, filename, download name)
+    planned_indexes = set()
+    failed = []
+
+    for clip_name_or_keyword, new_keyword in replacements:
+        match = project.find_footage(clip_name_or_keyword)
+        if not match or match[0] in planned_indexes:
+            failed.append({"clip": clip_name_or_keyword, "status": "not_found"})
+            continue
+
+        clip_index, clip_to_replace = match
+        new_footage = find_replacement_footage(new_keyword, exclude_ids, project.state.niche)
+        if not new_footage:
+            failed.append({"clip": clip_name_or_keyword, "status": "no_replacement"})
+            continue
+
+        # Keep later searches from picking the same video
+        exclude_ids.append(new_footage["pexels_id"])
+        planned_indexes.add(clip_index)
+
+        filename = _replacement_filename(clip_index, new_keyword)
+        download_name = _download_target(project, filename)
+        planned.append((clip_to_replace, new_footage, new_keyword, filename, download_name))
+
+    # Download every replacement concurrently before removing any old clip
+    _download_replacements(
+        project,
+        [(new_footage, download_name) for _, new_footage, _, _, download_name in planned],
+    )
+
+    replaced = []
+    with project.batched_writes():
+        for clip_to_replace, *_ in planned:
+            project.remove_footage(filename=clip_to_replace.filename)
+        for clip_to_replace, new_footage, new_keyword, filename, download_name in planned:
+            _finish_download(project, download_name, filename)
+            project.add_footage(
+                FootageClip(
+                    filename=filename,
+                    pexels_id=new_footage["pexels_id"],
+                    keyword=new_keyword,
+                    duration=new_footage["duration"],
+                    url=new_footage["url"],
+                )
+            )
+            replaced.append({"old_keyword": clip_to_replace.keyword, "new_keyword": new_keyword})
+
+    return {
+        "project_id": project_id,
+        "status": "replaced" if replaced else "no_replacement",
+        "replaced": replaced,
+        "failed": failed,
+        "message": f"Replaced {len(replaced)} of {len(replacements)} clips",
+    }
+
+
+def _replacement_filename(clip_index: int, new_keyword: str) -> str:
+    """Filename for a replacement clip at the given timeline position."""
+    return f"{clip_index + 1:03d}_{new_keyword.replace(' ', '-')[:20]}.mp4"
+
+
+def _download_target(project: Project, filename: str) -> str:
+    """Name to download to so an existing clip isn't overwritten before it's removed."""
+    if (project.footage_dir / filename).exists():
+        return f"{filename}.part"
+    return filename
+
+
+def _download_replacements(project: Project, downloads: list[tuple[dict, str]]):
+    """Download replacement clips, deleting all of them if any download fails.
+
+    The project is left untouched on failure; the error is re-raised.
+    """
+    try:
+        download_clips(downloads, project.footage_dir)
+    except Exception:
+        for _, download_name in downloads:
+            (project.footage_dir / download_name).unlink(missing_ok=True)
+        raise
+
+
+def _finish_download(project: Project, download_name: str, filename: str):
+    """Move a clip downloaded under a temporary name into place."""
+    if download_name != filename:
+        (project.footage_dir / download_name).replace(project.footage_dir / filename)
+
+
 def change_voice(
     project_id: str,
     voice_key: str,
@@ -432,15 +691,19 @@ def change_voice(
     Returns:
         Status dict
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
-    voice_config = get_voice_config(voice_key)
-    if not voice_config:
+    # Only accept the key if it resolves to itself; an unknown key must not
+    # silently fall back to the niche default.
+    voice_id, resolved_voice_key, voice_config = resolve_voice(
+        project.state.niche, voice_key
+    )
+    if not voice_config or resolved_voice_key != voice_key:
         return {"error": f"Unknown voice: {voice_key}"}
 
-    project.set_voice(voice_config.get("voice_id", ""), voice_key)
+    project.set_voice(voice_id, resolved_voice_key)
 
     return {
         "project_id": project_id,
@@ -463,12 +726,12 @@ def change_music(
     Returns:
         Status dict
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
     # Check if it's a mood or a path
-    if mood_or_track in ["energetic", "calm", "dramatic"]:
+    if mood_or_track in _MUSIC_MOODS:
         project.set_music("", mood_or_track)
     else:
         project.set_music(mood_or_track, None)
@@ -490,7 +753,7 @@ def regenerate_voiceover(project_id: str) -> dict[str, Any]:
     Returns:
         Status dict
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
@@ -522,19 +785,23 @@ def regenerate_voiceover(project_id: str) -> dict[str, Any]:
 # ============================================================================
 
 
-def render_preview(project_id: str) -> dict[str, Any]:
+def render_preview(project_id: str, background: bool = False) -> dict[str, Any]:
     """Render a preview video for review.
 
     Args:
         project_id: The project ID
+        background: If True, queue the render and return a job ID immediately
 
     Returns:
-        Status dict with preview path
+        Status dict with preview path (or job ID when backgrounded)
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
+    if background:
+        return _queue_render(project, "preview")
+
     try:
         preview_path = _render_preview(project)
         project.set_status(ProjectStatus.PREVIEW)
@@ -556,19 +823,23 @@ def render_preview(project_id: str) -> dict[str, Any]:
         }
 
 
-def approve_video(project_id: str) -> dict[str, Any]:
+def approve_video(project_id: str, background: bool = False) -> dict[str, Any]:
     """Approve a video and render the final version.
 
     Args:
         project_id: The project ID
+        background: If True, queue the render and return a job ID immediately
 
     Returns:
-        Status dict with final video path
+        Status dict with final video path (or job ID when backgrounded)
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
+    if background:
+        return _queue_render(project, "final")
+
     try:
         # Render final version
         final_path = render_final(project)
@@ -593,6 +864,24 @@ def approve_video(project_id: str) -> dict[str, Any]:
         }
 
 
+def _queue_render(project: Project, kind: str) -> dict[str, Any]:
+    """Submit a background render and describe how to poll it."""
+    project_id = project.id
+
+    # Jobs reference the project row; register projects that predate the database
+    db = get_db()
+    if db.get_project(project_id) is None:
+        db.create_project(project_id, project.state.topic, project.state.niche)
+
+    job_id = submit_render_job(project_id, kind)
+    return {
+        "project_id": project_id,
+        "job_id": job_id,
+        "status": "queued",
+        "message": f"Render queued. Poll get_render_status('{job_id}') for progress.",
+    }
+
+
 def kill_video(project_id: str, delete_files: bool = False) -> dict[str, Any]:
     """Kill a video project.
 
@@ -603,12 +892,13 @@ def kill_video(project_id: str, delete_files: bool = False) -> dict[str, Any]:
     Returns:
         Status dict
     """
-    project = Project.load(project_id)
+    project = _load_project(project_id)
     if not project:
         return {"error": f"Project not found: {project_id}"}
 
     if delete_files:
         project.delete()
+        _project_cache.pop(project_id, None)
         db = get_db()
         db.delete_project(project_id)
         return {
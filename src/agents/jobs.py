@@ -0,0 +1,165 @@
+"""Background render jobs for agent-callable functions.
+
+Renders run in worker processes so an agent can queue a preview or final
+render, carry on, and poll get_render_status() for the result.
+
+Jobs are not detached: the workers belong to the process that queued them,
+and interpreter exit waits for queued renders to finish. Long-running hosts
+(an agent session) can poll; short-lived callers should block on
+wait_for_render(). Jobs whose owning process died without finishing them
+are marked as errors the next time jobs are queued or polled.
+"""
+
+import os
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Any, Optional
+
+from ..core.database import get_db
+
+# Concurrent renders (each one already saturates several cores)
+RENDER_WORKERS = 2
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+# Futures of jobs queued by this process, until they finish
+_futures: dict[str, Future] = {}
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        expire_orphaned_jobs()
+        _executor = ProcessPoolExecutor(max_workers=RENDER_WORKERS)
+    return _executor
+
+
+def _process_alive(pid: Optional[int]) -> bool:
+    """Whether a process with this PID is running."""
+    if pid is None:
+        # Queued before owners were recorded
+        return False
+    if os.name == "nt":
+        # os.kill() would terminate the process on Windows; assume it's alive
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _expire_if_orphaned(job) -> bool:
+    """Mark an unfinished job as failed if the process that owned it is gone."""
+    if job.status not in ("queued", "running") or _process_alive(job.owner_pid):
+        return False
+    get_db().update_render_job(
+        job.id, status="error", error="Render process exited before the job finished"
+    )
+    return True
+
+
+def expire_orphaned_jobs() -> int:
+    """Mark queued or running jobs whose owning process has exited as failed.
+
+    Returns:
+        Number of jobs marked as failed
+    """
+    return sum(_expire_if_orphaned(job) for job in get_db().list_unfinished_render_jobs())
+
+
+def submit_render_job(project_id: str, kind: str) -> str:
+    """Queue a render in a worker process.
+
+    Args:
+        project_id: The project ID
+        kind: "preview" or "final"
+
+    Returns:
+        The job ID to poll with get_render_status()
+    """
+    executor = _get_executor()
+    job_id = uuid.uuid4().hex
+    get_db().create_render_job(job_id, project_id, kind, owner_pid=os.getpid())
+
+    future = executor.submit(_run_render_job, job_id, project_id, kind)
+    _futures[job_id] = future
+    future.add_done_callback(lambda f: _on_job_done(job_id, f))
+    return job_id
+
+
+def _on_job_done(job_id: str, future: Future):
+    """Record jobs whose worker process died before reporting back."""
+    _futures.pop(job_id, None)
+    error = future.exception()
+    if error is not None:
+        get_db().update_render_job(job_id, status="error", error=str(error))
+
+
+def _run_render_job(job_id: str, project_id: str, kind: str):
+    """Worker entry point: run the synchronous render and record the outcome."""
+    from .functions import approve_video, render_preview
+
+    db = get_db()
+    db.update_render_job(job_id, status="running")
+
+    if kind == "preview":
+        result = render_preview(project_id)
+    else:
+        result = approve_video(project_id)
+
+    if "error" in result:
+        db.update_render_job(job_id, status="error", error=result["error"])
+    else:
+        output_path = result.get("preview_path") or result.get("final_path")
+        db.update_render_job(job_id, status="done", output_path=output_path)
+
+
+def get_render_status(job_id: str) -> dict[str, Any]:
+    """Get the status of a background render.
+
+    Args:
+        job_id: Job ID returned by render_preview/approve_video with background=True
+
+    Returns:
+        Status dict ("queued", "running", "done" or "error")
+    """
+    db = get_db()
+    job = db.get_render_job(job_id)
+    if not job:
+        return {"error": f"Render job not found: {job_id}"}
+    if _expire_if_orphaned(job):
+        job = db.get_render_job(job_id)
+
+    result = {
+        "job_id": job.id,
+        "project_id": job.project_id,
+        "kind": job.kind,
+        "status": job.status,
+    }
+    if job.output_path:
+        result["output_path"] = job.output_path
+    if job.error:
+        result["error"] = job.error
+    return result
+
+
+def wait_for_render(job_id: str, timeout: Optional[float] = None) -> dict[str, Any]:
+    """Block until a background render finishes, then return its status.
+
+    Only jobs queued by this process can be waited on; for others (or after
+    `timeout` seconds) the current status is returned right away.
+
+    Args:
+        job_id: Job ID returned by render_preview/approve_video with background=True
+        timeout: Maximum seconds to wait (None waits until the job is done)
+
+    Returns:
+        Status dict, as from get_render_status()
+    """
+    future = _futures.get(job_id)
+    if future is not None:
+        wait([future], timeout=timeout)
+    return get_render_status(job_id)
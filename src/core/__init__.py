@@ -1,4 +1,4 @@
-from .config import settings, get_niche_config, get_voice_config
+from .config import settings, clear_config_cache, get_niche_config, get_voice_config, resolve_voice
 from .database import Database, get_db
 from .project import Project, ProjectStatus
 
@@ -6,6 +6,8 @@ __all__ = [
     "settings",
     "get_niche_config",
     "get_voice_config",
+    "resolve_voice",
+    "clear_config_cache",
     "Database",
     "get_db",
     "Project",
@@ -0,0 +1,117 @@
+"""Disk-backed memoization for expensive generation steps."""
+
+import functools
+import hashlib
+import inspect
+import os
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+from . import jsonio
+from .config import get_cache_dir
+
+
+def _cache_key(
+    func: Callable, args: tuple, kwargs: dict, key: Optional[Callable[..., Any]] = None
+) -> str:
+    """Hash a function's qualified name and arguments (or `key` of them) into a cache key."""
+    if key is not None:
+        parts = key(*args, **kwargs)
+    else:
+        parts = [func.__module__, func.__qualname__, list(args), sorted(kwargs.items())]
+    return hashlib.blake2b(jsonio.dumps(parts), digest_size=16).hexdigest()
+
+
+def disk_cache(
+    namespace: str,
+    encode: Optional[Callable[[Any], Any]] = None,
+    decode: Optional[Callable[[Any], Any]] = None,
+    max_age: Optional[float] = None,
+    key: Optional[Callable[..., Any]] = None,
+):
+    """Cache a function's JSON-serializable result under <cache dir>/<namespace>/.
+
+    The wrapped function accepts an extra `use_cache` keyword argument;
+    pass use_cache=False to skip the lookup and overwrite the stored result.
+    Coroutine functions are supported and stay awaitable. Hit and miss
+    counts are kept in the wrapper's `cache_stats` dict.
+
+    Args:
+        namespace: Subdirectory of the cache dir for this function
+        encode: Optional conversion of the result to a JSON-serializable value
+        decode: Optional inverse of `encode`, applied when reading from cache
+        max_age: Seconds after which a stored result is ignored (None = never)
+        key: Optional function of the call's arguments returning the
+            JSON-serializable value to key results on, instead of the
+            function's name and arguments (lets functions share entries)
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        stats = {"hits": 0, "misses": 0}
+
+        def cache_path_for(args: tuple, kwargs: dict) -> Path:
+            return get_cache_dir() / namespace / f"{_cache_key(func, args, kwargs, key)}.json"
+
+        def is_fresh(cache_path: Path) -> bool:
+            try:
+                mtime = cache_path.stat().st_mtime
+            except FileNotFoundError:
+                stats["misses"] += 1
+                return False
+            fresh = max_age is None or time.time() - mtime < max_age
+            stats["hits" if fresh else "misses"] += 1
+            return fresh
+
+        def load(cache_path: Path) -> Any:
+            data = jsonio.loads(cache_path.read_bytes())
+            return decode(data) if decode else data
+
+        def store(cache_path: Path, result: Any):
+            # Unique per writer: threads and processes may store the same key
+            tmp_path = cache_path.with_name(
+                f".{cache_path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+            )
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_bytes(jsonio.dumps(encode(result) if encode else result))
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                # The result is already computed; a failed write only costs a
+                # cache miss next time
+                tmp_path.unlink(missing_ok=True)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, use_cache: bool = True, **kwargs):
+                cache_path = cache_path_for(args, kwargs)
+                if use_cache and is_fresh(cache_path):
+                    return load(cache_path)
+
+                result = await func(*args, **kwargs)
+                store(cache_path, result)
+                return result
+
+            async_wrapper.cache_stats = stats
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, use_cache: bool = True, **kwargs):
+            cache_path = cache_path_for(args, kwargs)
+            if use_cache and is_fresh(cache_path):
+                return load(cache_path)
+
+            result = func(*args, **kwargs)
+            store(cache_path, result)
+            return result
+
+        wrapper.cache_stats = stats
+        return wrapper
+
+    return decorator
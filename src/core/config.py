@@ -1,12 +1,22 @@
 """Configuration management for AutoClips."""
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class VideoSettings(BaseModel):
     duration_min: int = 30
@@ -15,6 +25,16 @@ class VideoSettings(BaseModel):
     height: int = 1920
     fps: int = 30
     clips_per_video: int = 10
+    # Encode the final video from an up-to-date preview instead of rendering
+    # the edit again (much faster, but inherits the preview's encoding loss)
+    reuse_preview: bool = False
+    # Keep a frame-sized copy of each footage clip so later renders skip
+    # scaling (the first render re-encodes every clip, which takes time and
+    # adds a generation of encoding loss)
+    cache_resized_footage: bool = False
+    # Encode this many parts of the video in parallel FFmpeg processes and
+    # join them without re-encoding (1 = one process for the whole video)
+    render_segments: int = 1
 
 
 class CaptionSettings(BaseModel):
@@ -47,6 +67,15 @@ class AISettings(BaseModel):
     anthropic_model: str = "claude-sonnet-4-20250514"
     openai_model: str = "gpt-4o"
     temperature: float = 0.8
+    # Days to keep responses to call_llm(..., cache=True)
+    cache_ttl_days: int = 7
+    # Concurrent requests per batch of LLM calls, and SDK retries (with
+    # exponential backoff) on rate limits and transient errors
+    max_concurrency: int = 4
+    max_retries: int = 4
+    # Client-side pacing per provider (0 disables)
+    requests_per_minute: int = 50
+    tokens_per_minute: int = 80000
 
 
 class ElevenLabsSettings(BaseModel):
@@ -61,6 +90,10 @@ class PexelsSettings(BaseModel):
     per_page: int = 15
     min_duration: int = 5
     orientation: str = "portrait"
+    # Keep downloaded clips (hard-linked into projects) for reuse, dropping
+    # the oldest ones beyond cache_max_mb
+    cache_downloads: bool = True
+    cache_max_mb: int = 2048
 
 
 class DeduplicationSettings(BaseModel):
@@ -73,6 +106,7 @@ class PathSettings(BaseModel):
     output: str = "output"
     assets: str = "assets"
     database: str = "data/autoclips.db"
+    cache: str = "data/cache"
 
 
 class Settings(BaseSettings):
@@ -113,7 +147,7 @@ class Settings(BaseSettings):
         config_path = Path("config/settings.yaml")
         if config_path.exists():
             with open(config_path) as f:
-                yaml_config = yaml.safe_load(f) or {}
+                yaml_config = yaml.load(f, Loader=_YamlLoader) or {}
 
             # Update nested settings from YAML
             if "video" in yaml_config:
@@ -142,50 +176,114 @@ class Settings(BaseSettings):
 settings = Settings.load()
 
 
-def get_niche_config(niche: str | None = None) -> dict[str, Any]:
+@dataclass
+class ConfigRegistry:
+    """In-memory copy of the niche and voice YAML files.
+
+    The config tree is small, so every file is parsed once up front and
+    lookups are served from memory. Call reload() after editing the YAML
+    files in a long-running process.
+    """
+
+    config_dir: Path = Path("config")
+    niches: dict[str, Mapping[str, Any]] = field(default_factory=dict)
+    voices: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+    def reload(self):
+        """Re-read all niche configs and voices.yaml from disk."""
+        niches = {}
+        for niche_path in sorted((self.config_dir / "niches").glob("*.yaml")):
+            with open(niche_path) as f:
+                niches[niche_path.stem] = MappingProxyType(yaml.load(f, Loader=_YamlLoader) or {})
+
+        voices_path = self.config_dir / "voices.yaml"
+        voices = {}
+        if voices_path.exists():
+            with open(voices_path) as f:
+                voices = yaml.load(f, Loader=_YamlLoader) or {}
+
+        self.niches = niches
+        self.voices = MappingProxyType(voices)
+
+
+def _load_registry() -> ConfigRegistry:
+    registry = ConfigRegistry()
+    registry.reload()
+    return registry
+
+
+# Global config registry
+registry = _load_registry()
+
+
+def get_niche_config(niche: str | None = None) -> Mapping[str, Any]:
     """Load niche-specific configuration.
 
     Args:
         niche: Niche name (e.g., 'finance'). If None, uses _default.
 
     Returns:
-        Niche configuration dictionary.
+        Read-only niche configuration mapping.
     """
-    niche = niche or "_default"
-    niche_path = Path(f"config/niches/{niche}.yaml")
-
     # Fall back to default if niche not found
-    if not niche_path.exists():
-        niche_path = Path("config/niches/_default.yaml")
-
-    if not niche_path.exists():
-        return {}
-
-    with open(niche_path) as f:
-        return yaml.safe_load(f) or {}
+    default = registry.niches.get("_default", MappingProxyType({}))
+    return registry.niches.get(niche or "_default", default)
 
 
-def get_voice_config(voice_key: str | None = None) -> dict[str, Any]:
+def get_voice_config(voice_key: str | None = None) -> Mapping[str, Any]:
     """Load voice configuration from voices.yaml.
 
     Args:
         voice_key: Voice key (e.g., 'adam'). If None, returns all voices.
 
     Returns:
-        Voice configuration dictionary.
+        Read-only voice configuration mapping.
     """
-    voices_path = Path("config/voices.yaml")
-    if not voices_path.exists():
-        return {}
+    if voice_key is None:
+        return registry.voices
 
-    with open(voices_path) as f:
-        voices_config = yaml.safe_load(f) or {}
+    voices = registry.voices.get("voices", {})
+    return MappingProxyType(voices.get(voice_key, {}))
 
-    if voice_key is None:
-        return voices_config
 
-    voices = voices_config.get("voices", {})
-    return voices.get(voice_key, {})
+@lru_cache(maxsize=64)
+def resolve_voice(
+    niche: str | None = None,
+    voice_key: str | None = None,
+) -> tuple[str, str, Mapping[str, Any]]:
+    """Resolve the effective voice for a niche and optional explicit key.
+
+    Tries the explicit key, then the niche's voice, then the generic default
+    from voices.yaml, and returns the first one with a voice ID.
+
+    Args:
+        niche: Niche name (e.g., 'finance'). If None, uses _default.
+        voice_key: Explicit voice key from voices.yaml (e.g., 'adam')
+
+    Returns:
+        Tuple of (voice_id, voice_key, voice_config); voice_id is "" if no
+        candidate is configured.
+    """
+    candidates = [
+        voice_key,
+        get_niche_config(niche).get("voice", {}).get("voice_key"),
+        registry.voices.get("defaults", {}).get("generic"),
+        "sam",
+    ]
+    candidates = [key for key in dict.fromkeys(candidates) if key]
+
+    for key in candidates:
+        voice_config = get_voice_config(key)
+        if voice_config.get("voice_id"):
+            return voice_config["voice_id"], key, voice_config
+
+    return "", candidates[0], MappingProxyType({})
+
+
+def clear_config_cache():
+    """Re-read niche and voice YAML files into the config registry."""
+    registry.reload()
+    resolve_voice.cache_clear()
 
 
 def get_project_root() -> Path:
@@ -211,3 +309,8 @@ def get_assets_dir() -> Path:
 def get_database_path() -> Path:
     """Get the database file path."""
     return get_project_root() / settings.paths.database
+
+
+def get_cache_dir() -> Path:
+    """Get the generation cache directory path."""
+    return get_project_root() / settings.paths.cache
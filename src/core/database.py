@@ -1,8 +1,12 @@
 """SQLite database for tracking videos, topics, and footage usage."""
 
+import functools
+import hashlib
+import os
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from sqlalchemy import (
     Boolean,
@@ -10,12 +14,25 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     create_engine,
+    event,
+    exists,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.orm import (
+    Session,
+    declarative_base,
+    load_only,
+    relationship,
+    scoped_session,
+    sessionmaker,
 )
-from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
 
 from .config import get_database_path, settings
 
@@ -30,18 +47,27 @@ class VideoProject(Base):
     id = Column(String, primary_key=True)  # UUID-style ID
     topic = Column(Text, nullable=False)
     niche = Column(String, nullable=True)
-    status = Column(String, default="draft")  # draft, preview, approved, killed
+    status = Column(String, default="draft", index=True)  # draft, preview, approved, killed
     script = Column(Text, nullable=True)
     voice_id = Column(String, nullable=True)
     music_track = Column(String, nullable=True)
     duration = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     approved_at = Column(DateTime, nullable=True)
 
     # Relationships
-    footage_clips = relationship("FootageUsage", back_populates="project")
-    video_metadata = relationship("VideoMetadata", back_populates="project", uselist=False)
+    # Child rows are removed by ON DELETE CASCADE in SQLite
+    footage_clips = relationship(
+        "FootageUsage", back_populates="project", cascade="all, delete-orphan", passive_deletes=True
+    )
+    video_metadata = relationship(
+        "VideoMetadata",
+        back_populates="project",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
 
 class FootageUsage(Base):
@@ -50,13 +76,15 @@ class FootageUsage(Base):
     __tablename__ = "footage_usage"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    project_id = Column(String, ForeignKey("video_projects.id"), nullable=False)
-    pexels_video_id = Column(Integer, nullable=False)
+    project_id = Column(
+        String, ForeignKey("video_projects.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    pexels_video_id = Column(Integer, nullable=False, index=True)
     keyword = Column(String, nullable=True)
     filename = Column(String, nullable=True)
     start_time = Column(Float, nullable=True)  # When clip starts in video
     duration = Column(Float, nullable=True)
-    used_at = Column(DateTime, default=datetime.utcnow)
+    used_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     project = relationship("VideoProject", back_populates="footage_clips")
 
@@ -67,7 +95,7 @@ class VideoMetadata(Base):
     __tablename__ = "video_metadata"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    project_id = Column(String, ForeignKey("video_projects.id"), nullable=False)
+    project_id = Column(String, ForeignKey("video_projects.id", ondelete="CASCADE"), nullable=False)
     title = Column(Text, nullable=True)
     description = Column(Text, nullable=True)
     tags = Column(Text, nullable=True)  # JSON array stored as text
@@ -83,12 +111,80 @@ class TopicHistory(Base):
     """Tracks topics used to prevent repetition."""
 
     __tablename__ = "topic_history"
+    __table_args__ = (
+        # Covers the hash + cooldown-window lookup in is_topic_recently_used
+        Index("ix_topic_hash_created", "topic_hash", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     topic = Column(Text, nullable=False)
     niche = Column(String, nullable=True)
-    topic_hash = Column(String, nullable=False)  # For faster lookups
+    topic_hash = Column(String(16), nullable=False)  # For faster lookups
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class RenderJob(Base):
+    """Tracks background preview/final renders."""
+
+    __tablename__ = "render_jobs"
+
+    id = Column(String, primary_key=True)  # UUID hex
+    project_id = Column(String, ForeignKey("video_projects.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String, nullable=False)  # preview, final
+    status = Column(String, default="queued")  # queued, running, done, error
+    owner_pid = Column(Integer, nullable=True)  # Process whose worker pool runs the job
+    output_path = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection.
+
+    WAL lets readers run alongside a writer (e.g. background render workers),
+    and synchronous=NORMAL is durable under WAL while avoiding an fsync per commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-16000")  # 16 MB page cache
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _transactional(method):
+    """Run a Database method inside this thread's session.
+
+    The session is passed as the first argument after self, committed when
+    the method returns, rolled back if it raises, and closed either way.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        session = self.get_session()
+        try:
+            result = method(self, session, *args, **kwargs)
+            session.commit()
+            return result
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    return wrapper
+
+
+# Hex length of _topic_hash() digests
+TOPIC_HASH_LENGTH = 16
+
+
+def _topic_hash(topic: str) -> str:
+    """Hash a normalized topic for duplicate lookups (64-bit BLAKE2b)."""
+    normalized = topic.lower().strip().encode()
+    return hashlib.blake2b(normalized, digest_size=TOPIC_HASH_LENGTH // 2).hexdigest()
 
 
 class Database:
@@ -98,75 +194,226 @@ class Database:
         self.db_path = db_path or get_database_path()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+        self.engine = create_engine(
+            f"sqlite:///{self.db_path}",
+            echo=False,
+            # Wait for other processes' writes instead of failing immediately;
+            # pooled connections may be handed to any thread
+            connect_args={"timeout": 30, "check_same_thread": False},
+            pool_pre_ping=True,
+            # Room for every distinct statement the Database methods issue
+            query_cache_size=1200,
+        )
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        self._add_cascade_foreign_keys()
+        self._add_missing_columns()
+        self._create_missing_indexes()
+        # One session per thread, reused across calls (closed, not discarded,
+        # after each method). Objects stay loaded after commit so callers can
+        # read returned rows without a new query.
+        self.SessionLocal = scoped_session(
+            sessionmaker(bind=self.engine, expire_on_commit=False)
+        )
+        self._rehash_topics()
+
+    def _add_cascade_foreign_keys(self):
+        """Rebuild child tables created before their foreign keys cascaded.
+
+        SQLite cannot alter a constraint in place, so affected tables are
+        copied into a fresh table with the current schema.
+        """
+        child_tables = [FootageUsage.__table__, VideoMetadata.__table__, RenderJob.__table__]
+
+        with self.engine.connect() as conn:
+            stale = [
+                table
+                for table in child_tables
+                if any(
+                    fk[6].upper() != "CASCADE"  # on_delete column
+                    for fk in conn.exec_driver_sql(f"PRAGMA foreign_key_list({table.name})")
+                )
+            ]
+            if not stale:
+                return
+
+            # Must be switched off outside a transaction, before the rebuild
+            conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            try:
+                for table in stale:
+                    old_name = f"_old_{table.name}"
+                    columns = ", ".join(column.name for column in table.columns)
+                    conn.exec_driver_sql(f"ALTER TABLE {table.name} RENAME TO {old_name}")
+                    for index in table.indexes:
+                        conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+                    table.create(conn)
+                    conn.exec_driver_sql(
+                        f"INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {old_name}"
+                    )
+                    conn.exec_driver_sql(f"DROP TABLE {old_name}")
+                conn.commit()
+            finally:
+                conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+    def _add_missing_columns(self):
+        """Add nullable columns declared after a table was first created."""
+        with self.engine.connect() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {
+                    row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table.name})")
+                }
+                for column in table.columns:
+                    if column.name not in existing and column.nullable:
+                        column_type = column.type.compile(dialect=self.engine.dialect)
+                        conn.exec_driver_sql(
+                            f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                        )
+            conn.commit()
+
+    def _create_missing_indexes(self):
+        """Add indexes declared after a table was first created.
+
+        create_all() skips tables that already exist, so databases created by
+        older versions would otherwise never get new indexes.
+        """
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
+    @_transactional
+    def _rehash_topics(self, session: Session):
+        """Recompute topic hashes written by older versions (32-char MD5)."""
+        stale = (
+            session.query(TopicHistory)
+            .filter(func.length(TopicHistory.topic_hash) != TOPIC_HASH_LENGTH)
+            .all()
+        )
+        for history in stale:
+            history.topic_hash = _topic_hash(history.topic)
 
     def get_session(self) -> Session:
-        """Get a new database session."""
+        """Get this thread's database session."""
         return self.SessionLocal()
 
     # Project operations
+    @_transactional
     def create_project(
         self,
+        session: Session,
         project_id: str,
         topic: str,
         niche: Optional[str] = None,
     ) -> VideoProject:
         """Create a new video project."""
-        with self.get_session() as session:
-            project = VideoProject(
-                id=project_id,
-                topic=topic,
-                niche=niche,
-                status="draft",
-            )
-            session.add(project)
-            session.commit()
-            session.refresh(project)
-            return project
-
-    def get_project(self, project_id: str) -> Optional[VideoProject]:
+        project = VideoProject(
+            id=project_id,
+            topic=topic,
+            niche=niche,
+            status="draft",
+        )
+        session.add(project)
+        return project
+
+    @_transactional
+    def get_project(self, session: Session, project_id: str) -> Optional[VideoProject]:
         """Get a project by ID."""
-        with self.get_session() as session:
-            return session.query(VideoProject).filter_by(id=project_id).first()
+        return session.query(VideoProject).filter_by(id=project_id).first()
 
-    def update_project(self, project_id: str, **kwargs) -> Optional[VideoProject]:
+    @_transactional
+    def update_project(self, session: Session, project_id: str, **kwargs) -> Optional[VideoProject]:
         """Update project fields."""
-        with self.get_session() as session:
-            project = session.query(VideoProject).filter_by(id=project_id).first()
-            if project:
-                for key, value in kwargs.items():
-                    if hasattr(project, key):
-                        setattr(project, key, value)
-                session.commit()
-                session.refresh(project)
-            return project
-
-    def list_projects(self, status: Optional[str] = None) -> list[VideoProject]:
-        """List projects, optionally filtered by status."""
-        with self.get_session() as session:
-            query = session.query(VideoProject)
-            if status:
-                query = query.filter_by(status=status)
-            return query.order_by(VideoProject.created_at.desc()).all()
-
-    def delete_project(self, project_id: str) -> bool:
-        """Delete a project and its related records."""
-        with self.get_session() as session:
-            project = session.query(VideoProject).filter_by(id=project_id).first()
-            if project:
-                # Delete related records
-                session.query(FootageUsage).filter_by(project_id=project_id).delete()
-                session.query(VideoMetadata).filter_by(project_id=project_id).delete()
-                session.delete(project)
-                session.commit()
-                return True
-            return False
+        project = session.query(VideoProject).filter_by(id=project_id).first()
+        if project:
+            for key, value in kwargs.items():
+                if hasattr(project, key):
+                    setattr(project, key, value)
+        return project
+
+    @_transactional
+    def list_projects(self, session: Session, status: Optional[str] = None) -> list[VideoProject]:
+        """List projects, optionally filtered by status.
+
+        Only the summary columns are loaded; large fields such as `script`
+        are not available on the returned (detached) rows.
+        """
+        query = session.query(VideoProject).options(
+            load_only(
+                VideoProject.id,
+                VideoProject.topic,
+                VideoProject.niche,
+                VideoProject.status,
+                VideoProject.duration,
+                VideoProject.created_at,
+            )
+        )
+        if status:
+            query = query.filter_by(status=status)
+        return query.order_by(VideoProject.created_at.desc()).all()
+
+    @_transactional
+    def list_project_summaries(
+        self,
+        session: Session,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """List lightweight project summaries in one query, newest first.
+
+        Pass `limit`/`offset` to fetch a single page instead of every row.
+        """
+        query = session.query(
+            VideoProject.id,
+            VideoProject.topic,
+            VideoProject.niche,
+            VideoProject.status,
+            VideoProject.duration,
+            VideoProject.created_at,
+        )
+        if status:
+            query = query.filter(VideoProject.status == status)
+        query = query.order_by(VideoProject.created_at.desc())
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        rows = query.all()
+
+        return [
+            {
+                "id": row.id,
+                "topic": row.topic,
+                "niche": row.niche,
+                "status": row.status,
+                "estimated_duration": row.duration,
+                "created_at": row.created_at.isoformat() if row.created_at else "",
+            }
+            for row in rows
+        ]
+
+    @_transactional
+    def count_projects(self, session: Session, status: Optional[str] = None) -> int:
+        """Count projects, optionally filtered by status."""
+        query = session.query(func.count(VideoProject.id))
+        if status:
+            query = query.filter(VideoProject.status == status)
+        return query.scalar()
+
+    @_transactional
+    def delete_project(self, session: Session, project_id: str) -> bool:
+        """Delete a project; related records go with it via ON DELETE CASCADE."""
+        deleted = (
+            session.query(VideoProject)
+            .filter_by(id=project_id)
+            .delete(synchronize_session=False)
+        )
+        return deleted > 0
 
     # Footage tracking
+    @_transactional
     def add_footage_usage(
         self,
+        session: Session,
         project_id: str,
         pexels_video_id: int,
         keyword: Optional[str] = None,
@@ -175,106 +422,212 @@ class Database:
         duration: Optional[float] = None,
     ) -> FootageUsage:
         """Record footage usage for a project."""
-        with self.get_session() as session:
-            usage = FootageUsage(
-                project_id=project_id,
-                pexels_video_id=pexels_video_id,
-                keyword=keyword,
-                filename=filename,
-                start_time=start_time,
-                duration=duration,
-            )
-            session.add(usage)
-            session.commit()
-            session.refresh(usage)
-            return usage
-
-    def is_footage_recently_used(self, pexels_video_id: int) -> bool:
+        usage = FootageUsage(
+            project_id=project_id,
+            pexels_video_id=pexels_video_id,
+            keyword=keyword,
+            filename=filename,
+            start_time=start_time,
+            duration=duration,
+        )
+        session.add(usage)
+        return usage
+
+    @_transactional
+    def add_footage_usages(
+        self, session: Session, project_id: str, rows: list[dict[str, Any]]
+    ) -> int:
+        """Record several footage clips for a project in one INSERT.
+
+        Args:
+            project_id: The project ID
+            rows: Dicts with pexels_video_id and optional keyword, filename,
+                start_time and duration
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        session.execute(
+            insert(FootageUsage),
+            [{"project_id": project_id, **row} for row in rows],
+        )
+        return len(rows)
+
+    @_transactional
+    def is_footage_recently_used(self, session: Session, pexels_video_id: int) -> bool:
         """Check if footage was used within the cooldown period."""
         cooldown = settings.deduplication.footage_cooldown_count
-        with self.get_session() as session:
-            recent_usage = (
-                session.query(FootageUsage)
+        recent = (
+            select(FootageUsage.pexels_video_id)
+            .order_by(FootageUsage.used_at.desc())
+            .limit(cooldown)
+            .subquery()
+        )
+        return session.scalar(
+            select(exists().where(recent.c.pexels_video_id == pexels_video_id))
+        )
+
+    @_transactional
+    def get_recently_used_footage_ids(self, session: Session) -> set[int]:
+        """Get the Pexels IDs of all footage within the cooldown period."""
+        cooldown = settings.deduplication.footage_cooldown_count
+        return set(
+            session.scalars(
+                select(FootageUsage.pexels_video_id)
                 .order_by(FootageUsage.used_at.desc())
                 .limit(cooldown)
-                .all()
             )
-            return any(u.pexels_video_id == pexels_video_id for u in recent_usage)
+        )
 
-    def get_footage_for_project(self, project_id: str) -> list[FootageUsage]:
+    @_transactional
+    def get_footage_for_project(self, session: Session, project_id: str) -> list[FootageUsage]:
         """Get all footage clips for a project."""
-        with self.get_session() as session:
-            return (
-                session.query(FootageUsage)
-                .filter_by(project_id=project_id)
-                .order_by(FootageUsage.start_time)
-                .all()
-            )
-
+        return (
+            session.query(FootageUsage)
+            .filter_by(project_id=project_id)
+            .order_by(FootageUsage.start_time)
+            .all()
+        )
+
+    @_transactional
     def remove_footage_from_project(
-        self, project_id: str, filename: Optional[str] = None, keyword: Optional[str] = None
+        self,
+        session: Session,
+        project_id: str,
+        filename: Optional[str] = None,
+        keyword: Optional[str] = None,
     ) -> bool:
         """Remove footage from a project by filename or keyword."""
-        with self.get_session() as session:
-            query = session.query(FootageUsage).filter_by(project_id=project_id)
-            if filename:
-                query = query.filter_by(filename=filename)
-            elif keyword:
-                query = query.filter(FootageUsage.keyword.ilike(f"%{keyword}%"))
-            else:
-                return False
-
-            deleted = query.delete(synchronize_session=False)
-            session.commit()
-            return deleted > 0
+        query = session.query(FootageUsage).filter_by(project_id=project_id)
+        if filename:
+            query = query.filter_by(filename=filename)
+        elif keyword:
+            query = query.filter(FootageUsage.keyword.ilike(f"%{keyword}%"))
+        else:
+            return False
+
+        deleted = query.delete(synchronize_session=False)
+        return deleted > 0
 
     # Topic history
-    def add_topic_to_history(self, topic: str, niche: Optional[str] = None) -> TopicHistory:
+    @_transactional
+    def add_topic_to_history(
+        self, session: Session, topic: str, niche: Optional[str] = None
+    ) -> TopicHistory:
         """Add a topic to the history."""
-        import hashlib
-
-        topic_hash = hashlib.md5(topic.lower().strip().encode()).hexdigest()
-
-        with self.get_session() as session:
-            history = TopicHistory(
-                topic=topic,
-                niche=niche,
-                topic_hash=topic_hash,
-            )
-            session.add(history)
-            session.commit()
-            session.refresh(history)
-            return history
-
-    def is_topic_recently_used(self, topic: str) -> bool:
+        topic_hash = _topic_hash(topic)
+
+        history = TopicHistory(
+            topic=topic,
+            niche=niche,
+            topic_hash=topic_hash,
+        )
+        session.add(history)
+        return history
+
+    @_transactional
+    def is_topic_recently_used(self, session: Session, topic: str) -> bool:
         """Check if a similar topic was used within the cooldown period."""
-        import hashlib
-
-        topic_hash = hashlib.md5(topic.lower().strip().encode()).hexdigest()
+        topic_hash = _topic_hash(topic)
         cooldown_days = settings.deduplication.topic_cooldown_days
         cutoff = datetime.utcnow() - timedelta(days=cooldown_days)
 
-        with self.get_session() as session:
-            return (
-                session.query(TopicHistory)
-                .filter(TopicHistory.topic_hash == topic_hash, TopicHistory.created_at > cutoff)
-                .first()
-                is not None
-            )
+        return (
+            session.query(TopicHistory)
+            .filter(TopicHistory.topic_hash == topic_hash, TopicHistory.created_at > cutoff)
+            .first()
+            is not None
+        )
 
-    def get_recent_topics(self, limit: int = 50) -> list[TopicHistory]:
+    @_transactional
+    def get_recent_topics(self, session: Session, limit: int = 50) -> list[TopicHistory]:
         """Get recently used topics."""
-        with self.get_session() as session:
-            return (
-                session.query(TopicHistory)
+        return (
+            session.query(TopicHistory)
+            .order_by(TopicHistory.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+
+    @_transactional
+    def get_recent_topic_strings(self, session: Session, limit: int = 50) -> list[str]:
+        """Get the text of recently used topics, newest first."""
+        return list(
+            session.scalars(
+                select(TopicHistory.topic)
                 .order_by(TopicHistory.created_at.desc())
                 .limit(limit)
-                .all()
             )
+        )
+
+    @_transactional
+    def get_similar_topics(self, session: Session, text: str, limit: int = 10) -> list[str]:
+        """Get topics among the `limit` most recent that contain `text` (case-insensitive)."""
+        recent = (
+            select(TopicHistory.topic, TopicHistory.created_at)
+            .order_by(TopicHistory.created_at.desc())
+            .limit(limit)
+            .subquery()
+        )
+        return list(
+            session.scalars(
+                select(recent.c.topic)
+                .where(func.lower(recent.c.topic).contains(text.lower(), autoescape=True))
+                .order_by(recent.c.created_at.desc())
+            )
+        )
+
+    # Render jobs
+    @_transactional
+    def create_render_job(
+        self,
+        session: Session,
+        job_id: str,
+        project_id: str,
+        kind: str,
+        owner_pid: Optional[int] = None,
+    ) -> RenderJob:
+        """Record a newly queued render job."""
+        job = RenderJob(
+            id=job_id, project_id=project_id, kind=kind, status="queued", owner_pid=owner_pid
+        )
+        session.add(job)
+        return job
+
+    @_transactional
+    def update_render_job(self, session: Session, job_id: str, **kwargs) -> Optional[RenderJob]:
+        """Update render job fields, stamping finished_at on completion."""
+        job = session.query(RenderJob).filter_by(id=job_id).first()
+        if job:
+            for key, value in kwargs.items():
+                if hasattr(job, key):
+                    setattr(job, key, value)
+            if job.status in ("done", "error") and job.finished_at is None:
+                job.finished_at = datetime.utcnow()
+        return job
+
+    @_transactional
+    def get_render_job(self, session: Session, job_id: str) -> Optional[RenderJob]:
+        """Get a render job by ID."""
+        return session.query(RenderJob).filter_by(id=job_id).first()
+
+    @_transactional
+    def list_unfinished_render_jobs(self, session: Session) -> list[RenderJob]:
+        """Get render jobs still queued or running."""
+        return (
+            session.query(RenderJob)
+            .filter(RenderJob.status.in_(("queued", "running")))
+            .all()
+        )
 
     # Metadata operations
+    @_transactional
     def save_metadata(
         self,
+        session: Session,
         project_id: str,
         title: Optional[str] = None,
         description: Optional[str] = None,
@@ -282,43 +635,55 @@ class Database:
         hashtags: Optional[str] = None,
     ) -> VideoMetadata:
         """Save or update metadata for a project."""
-        with self.get_session() as session:
-            metadata = session.query(VideoMetadata).filter_by(project_id=project_id).first()
-            if metadata:
-                if title:
-                    metadata.title = title
-                if description:
-                    metadata.description = description
-                if tags:
-                    metadata.tags = tags
-                if hashtags:
-                    metadata.hashtags = hashtags
-            else:
-                metadata = VideoMetadata(
-                    project_id=project_id,
-                    title=title,
-                    description=description,
-                    tags=tags,
-                    hashtags=hashtags,
-                )
-                session.add(metadata)
-            session.commit()
-            session.refresh(metadata)
-            return metadata
+        metadata = session.query(VideoMetadata).filter_by(project_id=project_id).first()
+        if metadata:
+            if title:
+                metadata.title = title
+            if description:
+                metadata.description = description
+            if tags:
+                metadata.tags = tags
+            if hashtags:
+                metadata.hashtags = hashtags
+        else:
+            metadata = VideoMetadata(
+                project_id=project_id,
+                title=title,
+                description=description,
+                tags=tags,
+                hashtags=hashtags,
+            )
+            session.add(metadata)
+        return metadata
 
-    def get_metadata(self, project_id: str) -> Optional[VideoMetadata]:
+    @_transactional
+    def get_metadata(self, session: Session, project_id: str) -> Optional[VideoMetadata]:
         """Get metadata for a project."""
-        with self.get_session() as session:
-            return session.query(VideoMetadata).filter_by(project_id=project_id).first()
+        return session.query(VideoMetadata).filter_by(project_id=project_id).first()
 
 
-# Global database instance
-_db: Optional[Database] = None
+# Database instances by process ID. A forked child must not reuse its
+# parent's pooled SQLite connections, so each process opens its own.
+_dbs: dict[int, Database] = {}
+_db_lock = threading.Lock()
 
 
 def get_db() -> Database:
-    """Get or create the global database instance."""
-    global _db
-    if _db is None:
-        _db = Database()
-    return _db
+    """Get or create this process's database instance."""
+    pid = os.getpid()
+    db = _dbs.get(pid)
+    if db is None:
+        with _db_lock:
+            db = _dbs.get(pid)
+            if db is None:
+                db = _dbs[pid] = Database()
+    return db
+
+
+def _reset_lock_after_fork():
+    # The lock may have been held by another thread at fork time
+    global _db_lock
+    _db_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_lock_after_fork)
@@ -0,0 +1,33 @@
+"""JSON encoding helpers.
+
+Uses orjson when it is installed (several times faster than the stdlib
+encoder and decoder) and falls back to the json module otherwise. Output is
+UTF-8 bytes, compact unless indent=True.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+# Raised by loads() for invalid input (orjson's error subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize `obj` to JSON bytes (two-space indented if `indent`)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
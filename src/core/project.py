@@ -1,14 +1,17 @@
 """Project state management for video generation pipeline."""
 
-import json
+import os
+import re
 import shutil
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from .config import get_output_dir, get_projects_dir
 
@@ -32,6 +35,11 @@ class FootageClip(BaseModel):
     start_time: Optional[float] = None  # When it starts in the video
     url: Optional[str] = None
 
+    @cached_property
+    def keyword_lower(self) -> str:
+        """Case-folded keyword, computed once for matching."""
+        return self.keyword.lower()
+
 
 class TimelineEntry(BaseModel):
     """Entry in the video timeline."""
@@ -90,6 +98,28 @@ class ProjectMetadata(BaseModel):
     instagram_caption: Optional[str] = None
 
 
+# Slug patterns for project IDs
+_SLUG_NONWORD = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS = re.compile(r"[-\s]+")
+
+# Prebuilt validators/serializers for the files a project reads and writes
+_STATE_ADAPTER = TypeAdapter(ProjectState)
+_TIMELINE_ADAPTER = TypeAdapter(list[TimelineEntry])
+_METADATA_ADAPTER = TypeAdapter(ProjectMetadata)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write a file in one call via a temp file, so readers never see a partial write."""
+    # Unique per writer: render jobs in other processes may save the same project
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class Project:
     """Manages a single video project's files and state."""
 
@@ -97,6 +127,19 @@ class Project:
         self.id = project_id
         self.path = get_projects_dir() / project_id
         self._state: Optional[ProjectState] = None
+        # (mtime_ns, size) of project.json when last loaded or saved
+        self._state_stamp: Optional[tuple[int, int]] = None
+        # ((mtime_ns, size), contents) of script.txt when last read or written,
+        # so edits made outside the app are picked up
+        self._script_cache: Optional[tuple[tuple[int, int], str]] = None
+
+        # Deferred saves while inside batched_writes() (nesting depth)
+        self._batching = 0
+        self._dirty = False
+
+        # Footage lookup indexes (position in state.footage_clips)
+        self._by_filename: dict[str, int] = {}
+        self._keyword_index: dict[str, list[int]] = {}
 
     @classmethod
     def create(cls, topic: str, niche: Optional[str] = None) -> "Project":
@@ -116,6 +159,7 @@ class Project:
             topic=topic,
             niche=niche,
         )
+        project._reindex_footage()
         project.save_state()
 
         return project
@@ -131,31 +175,43 @@ class Project:
 
     @classmethod
     def list_all(cls, status: Optional[ProjectStatus] = None) -> list["Project"]:
-        """List all projects, optionally filtered by status."""
+        """List all projects, optionally filtered by status, newest first.
+
+        Projects known to the database come from one query and their state is
+        only read from disk when first accessed. Project directories without
+        a database row (older projects, failed inserts) are loaded from disk.
+        """
+        from .database import get_db
+
         projects_dir = get_projects_dir()
         if not projects_dir.exists():
             return []
+        on_disk = {
+            path.name for path in projects_dir.iterdir() if (path / "project.json").exists()
+        }
 
-        projects = []
-        for path in projects_dir.iterdir():
-            if path.is_dir() and (path / "project.json").exists():
-                project = cls.load(path.name)
-                if project:
-                    if status is None or project.state.status == status:
-                        projects.append(project)
+        status_value = ProjectStatus(status).value if status else None
+        rows = get_db().list_projects()
+        listed = [
+            (row.created_at, cls(row.id))
+            for row in rows
+            if row.id in on_disk and (status_value is None or row.status == status_value)
+        ]
+
+        for project_id in on_disk.difference(row.id for row in rows):
+            project = cls.load(project_id)
+            if project and (status is None or project.state.status == status):
+                listed.append((project.state.created_at, project))
 
-        # Sort by creation date, newest first
-        projects.sort(key=lambda p: p.state.created_at, reverse=True)
-        return projects
+        listed.sort(key=lambda item: item[0], reverse=True)
+        return [project for _, project in listed]
 
     @staticmethod
     def _slugify(text: str) -> str:
         """Convert text to a URL-friendly slug."""
-        import re
-
         text = text.lower().strip()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[-\s]+", "-", text)
+        text = _SLUG_NONWORD.sub("", text)
+        text = _SLUG_SEPARATORS.sub("-", text)
         return text.strip("-")
 
     def _create_directory_structure(self):
@@ -165,11 +221,23 @@ class Project:
 
     def _load_state(self):
         """Load state from project.json."""
-        state_path = self.path / "project.json"
+        state_path = self.state_path
         if state_path.exists():
-            with open(state_path) as f:
-                data = json.load(f)
-            self._state = ProjectState(**data)
+            self._state = _STATE_ADAPTER.validate_json(state_path.read_bytes())
+            self._state_stamp = self._read_state_stamp()
+            self._reindex_footage()
+
+    def _read_state_stamp(self) -> Optional[tuple[int, int]]:
+        """Get (mtime_ns, size) of project.json, or None if missing."""
+        try:
+            stat = self.state_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def is_stale(self) -> bool:
+        """Check whether project.json changed on disk since this instance read or wrote it."""
+        return self._state_stamp is None or self._read_state_stamp() != self._state_stamp
 
     @property
     def state(self) -> ProjectState:
@@ -181,13 +249,40 @@ class Project:
         return self._state
 
     def save_state(self):
-        """Save state to project.json."""
+        """Save state to project.json (deferred inside batched_writes())."""
+        if self._batching:
+            self._dirty = True
+            return
+        self._write_state_now()
+
+    def _write_state_now(self):
+        """Write project.json immediately."""
         self.state.updated_at = datetime.utcnow()
-        state_path = self.path / "project.json"
-        with open(state_path, "w") as f:
-            json.dump(self.state.model_dump(mode="json"), f, indent=2, default=str)
+        _write_atomic(self.state_path, _STATE_ADAPTER.dump_json(self.state))
+        self._state_stamp = self._read_state_stamp()
+
+    @contextmanager
+    def batched_writes(self):
+        """Defer save_state() calls and write project.json once on exit.
+
+        Blocks may be nested; the write happens when the outermost one exits.
+        The pending state is written even if the block raises, so partial
+        progress is never lost.
+        """
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            if not self._batching and self._dirty:
+                self._dirty = False
+                self._write_state_now()
 
     # File paths
+    @property
+    def state_path(self) -> Path:
+        return self.path / "project.json"
+
     @property
     def script_path(self) -> Path:
         return self.path / "script.txt"
@@ -219,13 +314,21 @@ class Project:
     # Script operations
     def get_script(self) -> Optional[str]:
         """Get the current script."""
-        if self.script_path.exists():
-            return self.script_path.read_text(encoding="utf-8")
-        return self.state.script
+        try:
+            stat = self.script_path.stat()
+        except FileNotFoundError:
+            return self.state.script
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._script_cache is None or self._script_cache[0] != stamp:
+            self._script_cache = (stamp, self.script_path.read_text(encoding="utf-8"))
+        return self._script_cache[1]
 
     def set_script(self, script: str):
         """Set the script content."""
         self.script_path.write_text(script, encoding="utf-8")
+        stat = self.script_path.stat()
+        self._script_cache = ((stat.st_mtime_ns, stat.st_size), script)
         self._state.script = script
 
         # Calculate word count and estimated duration
@@ -246,35 +349,78 @@ class Project:
         return False
 
     # Footage operations
+    def _reindex_footage(self):
+        """Rebuild the filename and keyword lookup indexes."""
+        self._by_filename = {}
+        self._keyword_index = {}
+        for i, clip in enumerate(self.state.footage_clips):
+            self._index_clip(i, clip)
+
+    def _index_clip(self, index: int, clip: FootageClip):
+        """Add a single clip to the lookup indexes."""
+        self._by_filename[clip.filename] = index
+        self._keyword_index.setdefault(clip.keyword_lower, []).append(index)
+
+    def _match_keyword(self, keyword: str) -> list[int]:
+        """Get clip positions whose keyword contains `keyword` (case-insensitive)."""
+        needle = keyword.lower()
+        return sorted(
+            i for kw, indices in self._keyword_index.items() if needle in kw for i in indices
+        )
+
+    def find_footage(self, name_or_keyword: str) -> Optional[tuple[int, FootageClip]]:
+        """Find a clip by exact filename, falling back to a keyword match.
+
+        Returns:
+            (position, clip) of the first match, or None
+        """
+        index = self._by_filename.get(name_or_keyword)
+        if index is None:
+            matches = self._match_keyword(name_or_keyword)
+            if not matches:
+                return None
+            index = matches[0]
+        return index, self.state.footage_clips[index]
+
     def add_footage(self, clip: FootageClip):
         """Add a footage clip to the project."""
         self._state.footage_clips.append(clip)
+        self._index_clip(len(self._state.footage_clips) - 1, clip)
         self.save_state()
 
     def remove_footage(self, filename: Optional[str] = None, keyword: Optional[str] = None) -> bool:
         """Remove footage by filename or keyword."""
-        removed = False
-        new_clips = []
+        to_remove: set[int] = set()
+        if filename and filename in self._by_filename:
+            to_remove.add(self._by_filename[filename])
+        if keyword:
+            to_remove.update(self._match_keyword(keyword))
 
-        for clip in self.state.footage_clips:
-            should_remove = False
-            if filename and clip.filename == filename:
-                should_remove = True
-            elif keyword and keyword.lower() in clip.keyword.lower():
-                should_remove = True
-
-            if should_remove:
+        new_clips = []
+        for i, clip in enumerate(self.state.footage_clips):
+            if i in to_remove:
                 # Delete the file if it exists
                 clip_path = self.footage_dir / clip.filename
                 if clip_path.exists():
                     clip_path.unlink()
-                removed = True
+                self._remove_resized_footage(clip_path)
             else:
                 new_clips.append(clip)
 
         self._state.footage_clips = new_clips
+        self._reindex_footage()
         self.save_state()
-        return removed
+        return bool(to_remove)
+
+    def _remove_resized_footage(self, clip_path: Path):
+        """Delete the frame-sized render copies of a footage clip."""
+        resized = re.compile(rf"\.?{re.escape(clip_path.stem)}_\d+x\d+\.mp4")
+        resized_dir = self.footage_dir / ".resized"
+        if not resized_dir.is_dir():
+            return
+        for cached in resized_dir.iterdir():
+            if resized.fullmatch(cached.name):
+                cached.unlink(missing_ok=True)
 
     def get_footage_list(self) -> list[dict[str, Any]]:
         """Get a list of footage clips with details."""
@@ -293,31 +439,25 @@ class Project:
         """Set the video timeline."""
         self._state.timeline = timeline
         # Save timeline to JSON file for easy inspection
-        with open(self.timeline_path, "w") as f:
-            json.dump([t.model_dump() for t in timeline], f, indent=2)
+        _write_atomic(self.timeline_path, _TIMELINE_ADAPTER.dump_json(timeline, indent=2))
         self.save_state()
 
     def get_timeline(self) -> list[TimelineEntry]:
         """Get the current timeline."""
         if self.timeline_path.exists():
-            with open(self.timeline_path) as f:
-                data = json.load(f)
-            return [TimelineEntry(**entry) for entry in data]
+            return _TIMELINE_ADAPTER.validate_json(self.timeline_path.read_bytes())
         return self.state.timeline
 
     # Metadata operations
     def get_metadata(self) -> Optional[ProjectMetadata]:
         """Get project metadata."""
         if self.metadata_path.exists():
-            with open(self.metadata_path) as f:
-                data = json.load(f)
-            return ProjectMetadata(**data)
+            return _METADATA_ADAPTER.validate_json(self.metadata_path.read_bytes())
         return None
 
     def set_metadata(self, metadata: ProjectMetadata):
         """Set project metadata."""
-        with open(self.metadata_path, "w") as f:
-            json.dump(metadata.model_dump(), f, indent=2)
+        _write_atomic(self.metadata_path, _METADATA_ADAPTER.dump_json(metadata, indent=2))
 
     # Voice and music
     def set_voice(self, voice_id: str, voice_name: Optional[str] = None):
@@ -374,14 +514,13 @@ class Project:
     # Summary for agent inspection
     def get_summary(self) -> dict[str, Any]:
         """Get a summary of the project for agent inspection."""
+        script = self.get_script()
         return {
             "id": self.id,
             "topic": self.state.topic,
             "niche": self.state.niche,
             "status": self.state.status,
-            "script_preview": (self.get_script() or "")[:200] + "..."
-            if self.get_script()
-            else None,
+            "script_preview": script[:200] + "..." if script else None,
             "word_count": self.state.word_count,
             "estimated_duration": self.state.duration,
             "footage_count": len(self.state.footage_clips),
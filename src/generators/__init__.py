@@ -1,12 +1,60 @@
-from .ideas import generate_video_ideas
-from .metadata import generate_metadata
-from .script import generate_script, extract_hook
-from .voice import generate_voiceover
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ideas import generate_video_ideas, generate_video_ideas_batch
+    from .metadata import agenerate_metadata, generate_metadata
+    from .script import (
+        agenerate_script,
+        agenerate_script_and_metadata,
+        agenerate_scripts_batch,
+        extract_hook,
+        generate_script,
+        generate_script_and_metadata,
+        generate_scripts_batch,
+    )
+    from .voice import generate_voiceover
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# one generator (e.g. .llm) doesn't pull in the ElevenLabs SDK and friends.
+_LAZY = {
+    "generate_video_ideas": "ideas",
+    "generate_video_ideas_batch": "ideas",
+    "generate_metadata": "metadata",
+    "agenerate_metadata": "metadata",
+    "generate_script": "script",
+    "agenerate_script": "script",
+    "generate_script_and_metadata": "script",
+    "agenerate_script_and_metadata": "script",
+    "generate_scripts_batch": "script",
+    "agenerate_scripts_batch": "script",
+    "extract_hook": "script",
+    "generate_voiceover": "voice",
+}
 
 __all__ = [
     "generate_video_ideas",
+    "generate_video_ideas_batch",
     "generate_script",
+    "agenerate_script",
+    "generate_script_and_metadata",
+    "agenerate_script_and_metadata",
+    "generate_scripts_batch",
+    "agenerate_scripts_batch",
     "extract_hook",
     "generate_voiceover",
     "generate_metadata",
+    "agenerate_metadata",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+from ..core import jsonio
 from ..core.config import get_niche_config, settings
 from ..core.database import get_db
 from .llm import call_llm
@@ -22,24 +23,62 @@ def generate_video_ideas(
     Returns:
         List of dicts with 'topic' and 'hook' keys
     """
-    niche_config = get_niche_config(niche)
-    niche_name = niche_config.get("display_name", niche or "general content")
+    return generate_video_ideas_batch([niche], count, exclude_recent)[niche]
+
+
+def generate_video_ideas_batch(
+    niches: list[Optional[str]],
+    count: int = 5,
+    exclude_recent: bool = True,
+    strict: bool = False,
+) -> dict[Optional[str], list[dict[str, str]]]:
+    """Generate video topic ideas for several niches in a single LLM call.
+
+    Args:
+        niches: Niches to generate ideas for (None for general content)
+        count: Number of ideas to generate per niche
+        exclude_recent: Whether to check against recently used topics
+        strict: Raise if the response can't be parsed, instead of returning
+            the raw response as a single topic per niche
+
+    Returns:
+        Dict mapping each niche to a list of dicts with 'topic' and 'hook' keys
+
+    Raises:
+        ValueError: If `strict` and the response isn't the expected JSON
+    """
+    niches = list(dict.fromkeys(niches))
+    if not niches:
+        return {}
+
+    # Key each niche by a distinct, stable label the model echoes back
+    labels = {}
+    for niche in niches:
+        label = niche or "general"
+        if label in labels.values():
+            label = f"{label} ({len(labels) + 1})"
+        labels[niche] = label
+
+    niche_lines = []
+    for niche, label in labels.items():
+        niche_config = get_niche_config(niche)
+        niche_name = niche_config.get("display_name", niche or "general content")
+        niche_lines.append(f'- "{label}": {niche_name}')
 
     # Get recent topics to avoid
     recent_topics = []
     if exclude_recent:
-        db = get_db()
-        recent = db.get_recent_topics(limit=30)
-        recent_topics = [t.topic for t in recent]
+        recent_topics = get_db().get_recent_topic_strings(limit=20)
 
     recent_topics_text = ""
     if recent_topics:
         recent_topics_text = f"""
 Avoid these recently used topics:
-{chr(10).join(f'- {t}' for t in recent_topics[:20])}
+{chr(10).join(f'- {t}' for t in recent_topics)}
 """
 
-    prompt = f"""Generate {count} unique, engaging video topic ideas for {niche_name} content.
+    prompt = f"""Generate {count} unique, engaging video topic ideas for each of these niches:
+{chr(10).join(niche_lines)}
 
 Each topic should:
 1. Be specific enough to create a 30-70 second video
@@ -47,31 +86,38 @@ Each topic should:
 3. Provide clear value to viewers
 4. Be different from generic, overused topics
 {recent_topics_text}
-Format your response as a JSON array with objects containing 'topic' and 'hook' keys:
-[
-  {{"topic": "The 50/30/20 budgeting rule explained", "hook": "You're probably budgeting wrong..."}},
-  {{"topic": "Why you should never pay minimums on credit cards", "hook": "Banks don't want you to know this..."}}
-]
+Format your response as a JSON object keyed by the quoted niche labels above, each mapping to an array of objects containing 'topic' and 'hook' keys:
+{{
+  "finance": [
+    {{"topic": "The 50/30/20 budgeting rule explained", "hook": "You're probably budgeting wrong..."}},
+    {{"topic": "Why you should never pay minimums on credit cards", "hook": "Banks don't want you to know this..."}}
+  ]
+}}
 
-Return ONLY the JSON array, no other text."""
+Return ONLY the JSON object, no other text."""
 
     response = call_llm(prompt, temperature=0.9)
 
     # Parse the JSON response
     try:
-        import json
-
         # Clean up response if needed
         response = response.strip()
         if response.startswith("```"):
             response = response.split("\n", 1)[1]
             response = response.rsplit("```", 1)[0]
 
-        ideas = json.loads(response)
-        return ideas[:count]
-    except (json.JSONDecodeError, IndexError):
+        ideas_by_label = jsonio.loads(response)
+        if not isinstance(ideas_by_label, dict):
+            raise ValueError("expected a JSON object")
+        return {
+            niche: list(ideas_by_label.get(label, []))[:count]
+            for niche, label in labels.items()
+        }
+    except (jsonio.JSONDecodeError, IndexError, ValueError):
+        if strict:
+            raise
         # Fallback: return raw topics
-        return [{"topic": response, "hook": ""}]
+        return {niche: [{"topic": response, "hook": ""}] for niche in niches}
 
 
 def check_topic_uniqueness(topic: str) -> dict[str, any]:
@@ -90,8 +136,7 @@ def check_topic_uniqueness(topic: str) -> dict[str, any]:
 
     if is_recent:
         # Get similar topics for context
-        recent = db.get_recent_topics(limit=10)
-        similar = [t.topic for t in recent if topic.lower()[:20] in t.topic.lower()]
+        similar = db.get_similar_topics(topic.lower()[:20], limit=10)
 
         return {
             "is_unique": False,
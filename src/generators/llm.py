@@ -1,8 +1,21 @@
 """LLM interface for AI text generation."""
 
-from typing import Optional
+import asyncio
+import weakref
+from collections.abc import Iterator
+from functools import cache
+from typing import Any, Optional
 
+from ..core import jsonio
+from ..core.cache import disk_cache
 from ..core.config import settings
+from .rate_limiter import TokenBucket, estimate_tokens
+
+# Async SDK clients by event loop; their connection pools can't be shared
+# across loops (asyncio.run() creates a new loop per call)
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def call_llm(
@@ -11,6 +24,7 @@ def call_llm(
     temperature: float = 0.8,
     max_tokens: int = 2000,
     provider: Optional[str] = None,
+    cache: bool = False,
 ) -> str:
     """Call the configured LLM provider.
 
@@ -20,12 +34,275 @@ def call_llm(
         temperature: Sampling temperature
         max_tokens: Maximum tokens to generate
         provider: Override the default provider ('anthropic' or 'openai')
+        cache: Reuse the response to an identical earlier request (stored on
+            disk for settings.ai.cache_ttl_days); for calls whose answer
+            should not vary between runs
 
     Returns:
         Generated text response
     """
     provider = provider or settings.ai_provider or settings.ai.default_provider
 
+    if cache:
+        return _cached_complete(
+            provider, _model_name(provider), prompt, system_prompt, temperature, max_tokens
+        )
+    return _complete(provider, prompt, system_prompt, temperature, max_tokens)
+
+
+async def acall_llm(
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.8,
+    max_tokens: int = 2000,
+    provider: Optional[str] = None,
+    cache: bool = False,
+) -> str:
+    """Async version of call_llm().
+
+    Uses the providers' async SDK clients, so independent calls can be
+    awaited together (e.g. with asyncio.gather) instead of one after another.
+    Shares its response cache with call_llm().
+
+    Args:
+        prompt: The user prompt
+        system_prompt: Optional system prompt
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        provider: Override the default provider ('anthropic' or 'openai')
+        cache: Reuse the response to an identical earlier request
+
+    Returns:
+        Generated text response
+    """
+    provider = provider or settings.ai_provider or settings.ai.default_provider
+
+    if cache:
+        return await _acached_complete(
+            provider, _model_name(provider), prompt, system_prompt, temperature, max_tokens
+        )
+    return await _acomplete(provider, prompt, system_prompt, temperature, max_tokens)
+
+
+def call_llm_json(
+    prompt: str,
+    schema: dict[str, Any],
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.8,
+    max_tokens: int = 2000,
+    provider: Optional[str] = None,
+) -> dict[str, Any]:
+    """Call the configured LLM provider for a JSON object.
+
+    Anthropic is forced to answer through a tool whose input schema is
+    `schema`, so the SDK returns the object already parsed; OpenAI uses
+    JSON mode (the prompt must mention JSON).
+
+    Args:
+        prompt: The user prompt
+        schema: JSON Schema of the expected object
+        system_prompt: Optional system prompt
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        provider: Override the default provider ('anthropic' or 'openai')
+
+    Returns:
+        The parsed object
+
+    Raises:
+        jsonio.JSONDecodeError: If OpenAI returns invalid JSON (e.g. when
+            the response is cut off at max_tokens)
+    """
+    provider = provider or settings.ai_provider or settings.ai.default_provider
+    requests, tokens = _rate_limits(provider)
+    requests.acquire()
+    tokens.acquire(estimate_tokens(prompt, system_prompt) + max_tokens)
+
+    if provider == "anthropic":
+        request = _anthropic_request(prompt, system_prompt, temperature, max_tokens)
+        response = _anthropic_client().messages.create(**request, **_json_tool(schema))
+        return _tool_input(response)
+    elif provider == "openai":
+        request = _openai_request(prompt, system_prompt, temperature, max_tokens)
+        response = _openai_client().chat.completions.create(
+            **request, response_format={"type": "json_object"}
+        )
+        return jsonio.loads(response.choices[0].message.content)
+    else:
+        raise ValueError(f"Unknown AI provider: {provider}")
+
+
+async def acall_llm_json(
+    prompt: str,
+    schema: dict[str, Any],
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.8,
+    max_tokens: int = 2000,
+    provider: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async version of call_llm_json().
+
+    Args:
+        prompt: The user prompt
+        schema: JSON Schema of the expected object
+        system_prompt: Optional system prompt
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        provider: Override the default provider ('anthropic' or 'openai')
+
+    Returns:
+        The parsed object
+    """
+    provider = provider or settings.ai_provider or settings.ai.default_provider
+    requests, tokens = _rate_limits(provider)
+    await requests.aacquire()
+    await tokens.aacquire(estimate_tokens(prompt, system_prompt) + max_tokens)
+
+    if provider == "anthropic":
+        request = _anthropic_request(prompt, system_prompt, temperature, max_tokens)
+        response = await _async_client("anthropic").messages.create(
+            **request, **_json_tool(schema)
+        )
+        return _tool_input(response)
+    elif provider == "openai":
+        request = _openai_request(prompt, system_prompt, temperature, max_tokens)
+        response = await _async_client("openai").chat.completions.create(
+            **request, response_format={"type": "json_object"}
+        )
+        return jsonio.loads(response.choices[0].message.content)
+    else:
+        raise ValueError(f"Unknown AI provider: {provider}")
+
+
+def call_llm_stream(
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.8,
+    max_tokens: int = 2000,
+    provider: Optional[str] = None,
+) -> Iterator[str]:
+    """Call the configured LLM provider and yield the response as it arrives.
+
+    Streamed responses bypass the response cache. Callers that parse the
+    result (e.g. as JSON) should only do so once the stream is exhausted.
+
+    Args:
+        prompt: The user prompt
+        system_prompt: Optional system prompt
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        provider: Override the default provider ('anthropic' or 'openai')
+
+    Yields:
+        Text chunks of the generated response
+    """
+    provider = provider or settings.ai_provider or settings.ai.default_provider
+    requests, tokens = _rate_limits(provider)
+    requests.acquire()
+    tokens.acquire(estimate_tokens(prompt, system_prompt) + max_tokens)
+
+    if provider == "anthropic":
+        request = _anthropic_request(prompt, system_prompt, temperature, max_tokens)
+        with _anthropic_client().messages.stream(**request) as stream:
+            yield from stream.text_stream
+    elif provider == "openai":
+        request = _openai_request(prompt, system_prompt, temperature, max_tokens)
+        for chunk in _openai_client().chat.completions.create(**request, stream=True):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    else:
+        raise ValueError(f"Unknown AI provider: {provider}")
+
+
+async def acall_llm_batch(
+    prompts: list[str],
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.8,
+    max_tokens: int = 2000,
+    provider: Optional[str] = None,
+    poll_interval: float = 10.0,
+) -> list[str]:
+    """Run many independent prompts, using the provider's batch API when available.
+
+    With Anthropic, all prompts go into one Message Batch (half the price
+    of regular calls, outside the per-minute rate limits) that is polled
+    until it ends; results can take minutes to arrive. Requests that fail
+    in the batch are retried as regular calls. Other providers get
+    concurrent acall_llm() calls, at most settings.ai.max_concurrency at once.
+
+    Args:
+        prompts: The user prompts
+        system_prompt: Optional system prompt shared by every request
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate per response
+        provider: Override the default provider ('anthropic' or 'openai')
+        poll_interval: Seconds between batch status checks
+
+    Returns:
+        Generated text responses, in the same order as `prompts`
+    """
+    provider = provider or settings.ai_provider or settings.ai.default_provider
+    responses: list[Optional[str]] = [None] * len(prompts)
+
+    if provider == "anthropic" and prompts:
+        client = _async_client("anthropic")
+        batch = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": f"request-{index}",
+                    "params": _anthropic_request(prompt, system_prompt, temperature, max_tokens),
+                }
+                for index, prompt in enumerate(prompts)
+            ]
+        )
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_interval)
+            batch = await client.messages.batches.retrieve(batch.id)
+
+        async for entry in await client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                index = int(entry.custom_id.removeprefix("request-"))
+                responses[index] = entry.result.message.content[0].text
+
+    semaphore = asyncio.Semaphore(settings.ai.max_concurrency)
+
+    async def fill(index: int):
+        async with semaphore:
+            responses[index] = await acall_llm(
+                prompts[index], system_prompt, temperature, max_tokens, provider
+            )
+
+    await asyncio.gather(
+        *(fill(index) for index, response in enumerate(responses) if response is None)
+    )
+    return responses
+
+
+def llm_cache_stats() -> dict[str, int]:
+    """Get hit/miss counts for the LLM response cache in this process."""
+    return {
+        key: _cached_complete.cache_stats[key] + _acached_complete.cache_stats[key]
+        for key in ("hits", "misses")
+    }
+
+
+def _model_name(provider: str) -> str:
+    """Get the configured model for a provider (part of the response cache key)."""
+    return settings.ai.openai_model if provider == "openai" else settings.ai.anthropic_model
+
+
+def _complete(
+    provider: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Send one request to a provider."""
+    requests, tokens = _rate_limits(provider)
+    requests.acquire()
+    tokens.acquire(estimate_tokens(prompt, system_prompt) + max_tokens)
+
     if provider == "anthropic":
         return _call_anthropic(prompt, system_prompt, temperature, max_tokens)
     elif provider == "openai":
@@ -34,17 +311,76 @@ def call_llm(
         raise ValueError(f"Unknown AI provider: {provider}")
 
 
-def _call_anthropic(
+async def _acomplete(
+    provider: str,
     prompt: str,
     system_prompt: Optional[str],
     temperature: float,
     max_tokens: int,
 ) -> str:
-    """Call Anthropic's Claude API."""
-    import anthropic
+    """Send one request to a provider without blocking the event loop."""
+    requests, tokens = _rate_limits(provider)
+    await requests.aacquire()
+    await tokens.aacquire(estimate_tokens(prompt, system_prompt) + max_tokens)
+
+    if provider == "anthropic":
+        return await _acall_anthropic(prompt, system_prompt, temperature, max_tokens)
+    elif provider == "openai":
+        return await _acall_openai(prompt, system_prompt, temperature, max_tokens)
+    else:
+        raise ValueError(f"Unknown AI provider: {provider}")
+
+
+def _completion_key(
+    provider: str,
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> list:
+    """Response cache key, shared by the sync and async completions."""
+    return ["completion", provider, model, system_prompt, prompt, temperature, max_tokens]
+
+
+_response_cache = disk_cache(
+    "llm", max_age=settings.ai.cache_ttl_days * 86400, key=_completion_key
+)
+
+
+@_response_cache
+def _cached_complete(
+    provider: str,
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """_complete(), cached on disk per provider, model and request."""
+    return _complete(provider, prompt, system_prompt, temperature, max_tokens)
 
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
 
+@_response_cache
+async def _acached_complete(
+    provider: str,
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """_acomplete(), cached on disk per provider, model and request."""
+    return await _acomplete(provider, prompt, system_prompt, temperature, max_tokens)
+
+
+def _anthropic_request(
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> dict[str, Any]:
+    """Build the keyword arguments for an Anthropic messages.create() call."""
     kwargs = {
         "model": settings.ai.anthropic_model,
         "max_tokens": max_tokens,
@@ -53,9 +389,111 @@ def _call_anthropic(
     }
 
     if system_prompt:
-        kwargs["system"] = system_prompt
+        # Mark the (per-niche, static) system prompt as a prompt-cache prefix
+        kwargs["system"] = [
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ]
+
+    return kwargs
+
+
+def _json_tool(schema: dict[str, Any]) -> dict[str, Any]:
+    """Anthropic tool definition and tool_choice that force a reply matching `schema`."""
+    return {
+        "tools": [
+            {
+                "name": "respond",
+                "description": "Return the requested data.",
+                "input_schema": schema,
+            }
+        ],
+        "tool_choice": {"type": "tool", "name": "respond"},
+    }
+
+
+def _tool_input(response) -> dict[str, Any]:
+    """Get the forced tool call's input from an Anthropic response."""
+    return next(block.input for block in response.content if block.type == "tool_use")
+
+
+def _openai_request(
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> dict[str, Any]:
+    """Build the keyword arguments for an OpenAI chat.completions.create() call."""
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+
+    return {
+        "model": settings.ai.openai_model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+
+
+@cache
+def _rate_limits(provider: str) -> tuple[TokenBucket, TokenBucket]:
+    """Get the shared (requests, tokens) per-minute limiters for a provider."""
+    return (
+        TokenBucket(settings.ai.requests_per_minute),
+        TokenBucket(settings.ai.tokens_per_minute),
+    )
+
+
+@cache
+def _anthropic_client():
+    """Get the shared Anthropic client (keeps its connections alive between calls)."""
+    import anthropic
+
+    return anthropic.Anthropic(
+        api_key=settings.anthropic_api_key, max_retries=settings.ai.max_retries
+    )
+
+
+@cache
+def _openai_client():
+    """Get the shared OpenAI client (keeps its connections alive between calls)."""
+    import openai
+
+    return openai.OpenAI(api_key=settings.openai_api_key, max_retries=settings.ai.max_retries)
+
+
+def _async_client(provider: str):
+    """Get the async client for a provider, shared within the running event loop."""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    if provider not in clients:
+        if provider == "anthropic":
+            import anthropic
+
+            clients[provider] = anthropic.AsyncAnthropic(
+                api_key=settings.anthropic_api_key, max_retries=settings.ai.max_retries
+            )
+        else:
+            import openai
+
+            clients[provider] = openai.AsyncOpenAI(
+                api_key=settings.openai_api_key, max_retries=settings.ai.max_retries
+            )
+    return clients[provider]
+
+
+def _call_anthropic(
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Call Anthropic's Claude API."""
+    client = _anthropic_client()
 
-    response = client.messages.create(**kwargs)
+    response = client.messages.create(
+        **_anthropic_request(prompt, system_prompt, temperature, max_tokens)
+    )
     return response.content[0].text
 
 
@@ -66,20 +504,37 @@ def _call_openai(
     max_tokens: int,
 ) -> str:
     """Call OpenAI's GPT API."""
-    import openai
+    client = _openai_client()
 
-    client = openai.OpenAI(api_key=settings.openai_api_key)
+    response = client.chat.completions.create(
+        **_openai_request(prompt, system_prompt, temperature, max_tokens)
+    )
 
-    messages = []
-    if system_prompt:
-        messages.append({"role": "system", "content": system_prompt})
-    messages.append({"role": "user", "content": prompt})
+    return response.choices[0].message.content
 
-    response = client.chat.completions.create(
-        model=settings.ai.openai_model,
-        messages=messages,
-        temperature=temperature,
-        max_tokens=max_tokens,
+
+async def _acall_anthropic(
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Call Anthropic's Claude API without blocking the event loop."""
+    response = await _async_client("anthropic").messages.create(
+        **_anthropic_request(prompt, system_prompt, temperature, max_tokens)
+    )
+    return response.content[0].text
+
+
+async def _acall_openai(
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Call OpenAI's GPT API without blocking the event loop."""
+    response = await _async_client("openai").chat.completions.create(
+        **_openai_request(prompt, system_prompt, temperature, max_tokens)
     )
 
     return response.choices[0].message.content
@@ -1,35 +1,113 @@
 """Generate video metadata (titles, descriptions, tags) using AI."""
 
+import asyncio
 from typing import Optional
 
-from ..core.config import get_niche_config
+from ..core import jsonio
+from ..core.cache import disk_cache
+from ..core.config import get_niche_config, settings
 from ..core.project import ProjectMetadata
-from .llm import call_llm
+from .llm import acall_llm, acall_llm_json, call_llm, call_llm_json
+
+# Shape of the metadata object requested from the LLM
+_METADATA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "description": {"type": "string"},
+        "hashtags": {"type": "array", "items": {"type": "string"}},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["title", "description", "hashtags", "tags"],
+}
+
+# Disk cache for generated metadata, stored as plain dicts
+_metadata_cache = disk_cache(
+    "metadata",
+    encode=lambda metadata: metadata.model_dump(),
+    decode=lambda data: ProjectMetadata(**data),
+)
 
 
 def generate_metadata(
     topic: str,
     script: str,
     niche: Optional[str] = None,
+    use_cache: bool = True,
 ) -> ProjectMetadata:
     """Generate metadata for a video.
 
+    Results are cached on disk per (topic, script, niche); pass
+    use_cache=False to generate fresh metadata.
+
+    Args:
+        topic: The video topic
+        script: The video script
+        niche: Niche for style customization
+        use_cache: Pass False to skip the cache and generate fresh metadata
+
+    Returns:
+        ProjectMetadata object
+    """
+    try:
+        return _cached_metadata(topic, script, niche, use_cache=use_cache)
+    except jsonio.JSONDecodeError:
+        return _fallback_metadata(topic, niche)
+
+
+async def agenerate_metadata(
+    topic: str,
+    script: str,
+    niche: Optional[str] = None,
+    use_cache: bool = True,
+) -> ProjectMetadata:
+    """Async version of generate_metadata().
+
     Args:
         topic: The video topic
         script: The video script
         niche: Niche for style customization
+        use_cache: Pass False to skip the cache and generate fresh metadata
 
     Returns:
         ProjectMetadata object
     """
+    try:
+        return await _acached_metadata(topic, script, niche, use_cache=use_cache)
+    except jsonio.JSONDecodeError:
+        return _fallback_metadata(topic, niche)
+
+
+@_metadata_cache
+def _cached_metadata(topic: str, script: str, niche: Optional[str]) -> ProjectMetadata:
+    """Metadata from the LLM, cached on disk.
+
+    Raises on an unparsable response so the fallback is never cached.
+    """
+    data = call_llm_json(
+        _build_metadata_prompt(topic, script, niche), _METADATA_SCHEMA, temperature=0.7
+    )
+    return _metadata_from_data(data, topic, niche)
+
+
+@_metadata_cache
+async def _acached_metadata(topic: str, script: str, niche: Optional[str]) -> ProjectMetadata:
+    """Async version of _cached_metadata()."""
+    data = await acall_llm_json(
+        _build_metadata_prompt(topic, script, niche), _METADATA_SCHEMA, temperature=0.7
+    )
+    return _metadata_from_data(data, topic, niche)
+
+
+def _build_metadata_prompt(topic: str, script: str, niche: Optional[str]) -> str:
+    """Build the prompt for generate_metadata()."""
     niche_config = get_niche_config(niche)
     metadata_config = niche_config.get("metadata", {})
 
     title_style = metadata_config.get("title_style", "curiosity")
     hashtag_count = metadata_config.get("hashtag_count", 8)
-    default_hashtags = metadata_config.get("default_hashtags", [])
 
-    prompt = f"""Generate metadata for a short-form video.
+    return f"""Generate metadata for a short-form video.
 
 Topic: {topic}
 
@@ -63,39 +141,37 @@ Format your response as JSON:
 
 Return ONLY the JSON, no other text."""
 
-    response = call_llm(prompt, temperature=0.7)
 
-    # Parse JSON response
-    try:
-        import json
-
-        response = response.strip()
-        if response.startswith("```"):
-            response = response.split("\n", 1)[1]
-            response = response.rsplit("```", 1)[0]
-
-        data = json.loads(response)
-
-        # Merge default hashtags
-        hashtags = data.get("hashtags", [])
-        for tag in default_hashtags:
-            if tag not in hashtags:
-                hashtags.append(tag)
-
-        return ProjectMetadata(
-            title=data.get("title", topic),
-            description=data.get("description", ""),
-            hashtags=hashtags,
-            tags=data.get("tags", []),
-        )
-    except (json.JSONDecodeError, KeyError):
-        # Fallback metadata
-        return ProjectMetadata(
-            title=topic,
-            description=f"Learn about {topic} in this quick video!",
-            hashtags=default_hashtags or ["#shorts", "#viral"],
-            tags=[topic],
-        )
+def _metadata_from_data(data: dict, topic: str, niche: Optional[str]) -> ProjectMetadata:
+    """Build ProjectMetadata from parsed LLM fields, merging the niche's default hashtags."""
+    default_hashtags = get_niche_config(niche).get("metadata", {}).get("default_hashtags", [])
+
+    # Merge default hashtags
+    hashtags = data.get("hashtags", [])
+    seen = set(hashtags)
+    for tag in default_hashtags:
+        if tag not in seen:
+            seen.add(tag)
+            hashtags.append(tag)
+
+    return ProjectMetadata(
+        title=data.get("title", topic),
+        description=data.get("description", ""),
+        hashtags=hashtags,
+        tags=data.get("tags", []),
+    )
+
+
+def _fallback_metadata(topic: str, niche: Optional[str]) -> ProjectMetadata:
+    """Metadata used when the LLM response can't be parsed."""
+    default_hashtags = get_niche_config(niche).get("metadata", {}).get("default_hashtags", [])
+
+    return ProjectMetadata(
+        title=topic,
+        description=f"Learn about {topic} in this quick video!",
+        hashtags=default_hashtags or ["#shorts", "#viral"],
+        tags=[topic],
+    )
 
 
 def generate_platform_metadata(
@@ -131,7 +207,7 @@ def generate_platform_metadata(
         return {
             "title": base_metadata.title[:100],  # YouTube title limit
             "description": f"{base_metadata.description}\n\n{' '.join(base_metadata.hashtags[:3])}",
-            "tags": base_metadata.tags + [h.replace("#", "") for h in base_metadata.hashtags],
+            "tags": base_metadata.tags + [h.removeprefix("#") for h in base_metadata.hashtags],
         }
 
     elif platform == "instagram":
@@ -161,9 +237,68 @@ def update_metadata_field(
     Returns:
         Updated metadata
     """
+    new_value = call_llm(_build_field_prompt(metadata, field, instruction), temperature=0.7)
+    return _apply_field_update(metadata, field, new_value)
+
+
+async def aupdate_metadata_field(
+    metadata: ProjectMetadata,
+    field: str,
+    instruction: str,
+) -> ProjectMetadata:
+    """Async version of update_metadata_field().
+
+    Args:
+        metadata: Current metadata
+        field: Field to update (title, description, hashtags, tags)
+        instruction: What to change
+
+    Returns:
+        Updated metadata
+    """
+    new_value = await acall_llm(
+        _build_field_prompt(metadata, field, instruction), temperature=0.7
+    )
+    return _apply_field_update(metadata, field, new_value)
+
+
+async def aupdate_metadata_fields(
+    metadata: ProjectMetadata,
+    updates: dict[str, str],
+) -> ProjectMetadata:
+    """Update several metadata fields at once, one concurrent LLM call per field.
+
+    At most settings.ai.max_concurrency requests are in flight at a time.
+
+    Args:
+        metadata: Current metadata
+        updates: Mapping of field name (title, description, hashtags, tags)
+            to the instruction for that field
+
+    Returns:
+        Updated metadata
+    """
+    semaphore = asyncio.Semaphore(settings.ai.max_concurrency)
+
+    async def fetch(field: str, instruction: str) -> tuple[str, str]:
+        async with semaphore:
+            prompt = _build_field_prompt(metadata, field, instruction)
+            return field, await acall_llm(prompt, temperature=0.7)
+
+    results = await asyncio.gather(
+        *(fetch(field, instruction) for field, instruction in updates.items())
+    )
+
+    for field, new_value in results:
+        metadata = _apply_field_update(metadata, field, new_value)
+    return metadata
+
+
+def _build_field_prompt(metadata: ProjectMetadata, field: str, instruction: str) -> str:
+    """Build the prompt for update_metadata_field()."""
     current_value = getattr(metadata, field, None)
 
-    prompt = f"""Update this {field} based on the instruction.
+    return f"""Update this {field} based on the instruction.
 
 Current {field}: {current_value}
 
@@ -171,21 +306,22 @@ Instruction: {instruction}
 
 Return ONLY the new {field}, nothing else."""
 
-    new_value = call_llm(prompt, temperature=0.7).strip()
+
+def _apply_field_update(metadata: ProjectMetadata, field: str, new_value: str) -> ProjectMetadata:
+    """Parse the LLM's new field value and return updated metadata."""
+    new_value = new_value.strip()
 
     # Handle list fields
     if field in ["hashtags", "tags"]:
-        import json
-
         try:
             if new_value.startswith("["):
-                new_value = json.loads(new_value)
+                new_value = jsonio.loads(new_value)
             else:
                 # Parse comma or space separated
                 new_value = [
                     v.strip() for v in new_value.replace(",", " ").split() if v.strip()
                 ]
-        except json.JSONDecodeError:
+        except jsonio.JSONDecodeError:
             new_value = [new_value]
 
     # Create updated metadata
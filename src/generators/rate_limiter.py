@@ -0,0 +1,57 @@
+"""Client-side rate limiting for provider APIs."""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Token bucket that paces callers to a per-minute budget.
+
+    Callers reserve tokens up front and then sleep until the reservation is
+    covered, so concurrent callers queue up in order instead of racing.
+    Safe to share between threads and event loops.
+    """
+
+    def __init__(self, rate_per_min: float, capacity: Optional[float] = None):
+        """Create a bucket.
+
+        Args:
+            rate_per_min: Tokens added per minute (0 disables limiting)
+            capacity: Maximum burst size (default: one minute's worth)
+        """
+        self.rate = rate_per_min / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_min
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, amount: float) -> float:
+        """Take `amount` tokens and return how long to wait until they're available."""
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, amount: float = 1):
+        """Block the calling thread until `amount` tokens are available."""
+        delay = self._reserve(amount)
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self, amount: float = 1):
+        """Wait without blocking the event loop until `amount` tokens are available."""
+        delay = self._reserve(amount)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def estimate_tokens(*texts: Optional[str]) -> int:
+    """Roughly estimate the token count of some texts (~4 characters per token)."""
+    return sum(len(text) for text in texts if text) // 4 + 1
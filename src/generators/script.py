@@ -1,11 +1,34 @@
 """Generate video scripts using AI."""
 
+import asyncio
+import re
 from typing import Optional
 
+from ..core import jsonio
+from ..core.cache import disk_cache
 from ..core.config import get_niche_config, settings
-from .llm import call_llm
-
-
+from ..core.project import ProjectMetadata
+from .llm import acall_llm, acall_llm_batch, call_llm
+from .metadata import _metadata_from_data, agenerate_metadata, generate_metadata
+
+# Stage directions ([pause], (beat)) and runs of blank lines/spaces
+_BRACKETED = re.compile(r"\[.*?\]")
+_PARENTHESIZED = re.compile(r"\(.*?\)")
+_EXTRA_NEWLINES = re.compile(r"\n{3,}")
+_EXTRA_SPACES = re.compile(r"  +")
+_SENTENCE_END = re.compile(r"[.!?]")
+# Outermost JSON object in a response that may have text around it
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Disk cache for combined script+metadata results (metadata stored as a dict)
+_script_metadata_cache = disk_cache(
+    "script_metadata",
+    encode=lambda result: {**result, "metadata": result["metadata"].model_dump()},
+    decode=lambda data: {**data, "metadata": ProjectMetadata(**data["metadata"])},
+)
+
+
+@disk_cache("script")
 def generate_script(
     topic: str,
     niche: Optional[str] = None,
@@ -13,6 +36,37 @@ def generate_script(
 ) -> dict[str, any]:
     """Generate a video script for a topic.
 
+    Results are cached on disk per (topic, niche, duration_target); pass
+    use_cache=False to generate a fresh variation.
+
+    Args:
+        topic: The video topic
+        niche: Niche for style customization
+        duration_target: Target duration in seconds (default from settings)
+
+    Returns:
+        Dict with 'script', 'hook', 'word_count', 'estimated_duration'
+    """
+    user_prompt, system_prompt = _build_script_prompts(topic, niche, duration_target)
+
+    # Generate the script
+    script = call_llm(
+        user_prompt,
+        system_prompt=system_prompt,
+        temperature=settings.ai.temperature,
+    )
+
+    return _script_result(script)
+
+
+@disk_cache("script")
+async def agenerate_script(
+    topic: str,
+    niche: Optional[str] = None,
+    duration_target: Optional[int] = None,
+) -> dict[str, any]:
+    """Async version of generate_script().
+
     Args:
         topic: The video topic
         niche: Niche for style customization
@@ -21,6 +75,183 @@ def generate_script(
     Returns:
         Dict with 'script', 'hook', 'word_count', 'estimated_duration'
     """
+    user_prompt, system_prompt = _build_script_prompts(topic, niche, duration_target)
+
+    script = await acall_llm(
+        user_prompt,
+        system_prompt=system_prompt,
+        temperature=settings.ai.temperature,
+    )
+
+    return _script_result(script)
+
+
+def generate_script_and_metadata(
+    topic: str,
+    niche: Optional[str] = None,
+    duration_target: Optional[int] = None,
+    use_cache: bool = True,
+) -> dict[str, any]:
+    """Generate a script and its metadata with a single LLM call.
+
+    Falls back to separate generate_script() and generate_metadata() calls
+    if the response doesn't contain usable JSON. Results are cached on disk
+    like generate_script().
+
+    Args:
+        topic: The video topic
+        niche: Niche for style customization
+        duration_target: Target duration in seconds (default from settings)
+        use_cache: Pass False to skip the cache and generate a fresh variation
+
+    Returns:
+        Dict with 'script', 'hook', 'word_count', 'estimated_duration' and
+        'metadata' (ProjectMetadata)
+    """
+    try:
+        return _generate_combined(topic, niche, duration_target, use_cache=use_cache)
+    except jsonio.JSONDecodeError:
+        result = generate_script(topic, niche, duration_target, use_cache=use_cache)
+        result["metadata"] = generate_metadata(
+            topic, result["script"], niche, use_cache=use_cache
+        )
+        return result
+
+
+async def agenerate_script_and_metadata(
+    topic: str,
+    niche: Optional[str] = None,
+    duration_target: Optional[int] = None,
+    use_cache: bool = True,
+) -> dict[str, any]:
+    """Async version of generate_script_and_metadata().
+
+    Args:
+        topic: The video topic
+        niche: Niche for style customization
+        duration_target: Target duration in seconds (default from settings)
+        use_cache: Pass False to skip the cache and generate a fresh variation
+
+    Returns:
+        Dict with 'script', 'hook', 'word_count', 'estimated_duration' and
+        'metadata' (ProjectMetadata)
+    """
+    try:
+        return await _agenerate_combined(topic, niche, duration_target, use_cache=use_cache)
+    except jsonio.JSONDecodeError:
+        result = await agenerate_script(topic, niche, duration_target, use_cache=use_cache)
+        result["metadata"] = await agenerate_metadata(
+            topic, result["script"], niche, use_cache=use_cache
+        )
+        return result
+
+
+@_script_metadata_cache
+def _generate_combined(
+    topic: str,
+    niche: Optional[str],
+    duration_target: Optional[int],
+) -> dict[str, any]:
+    """Cached single-call script+metadata generation.
+
+    Raises on an unparsable response so the fallback is never cached.
+    """
+    user_prompt, system_prompt = _build_combined_prompts(topic, niche, duration_target)
+
+    response = call_llm(
+        user_prompt,
+        system_prompt=system_prompt,
+        temperature=settings.ai.temperature,
+    )
+    return _combined_result(response, topic, niche)
+
+
+@_script_metadata_cache
+async def _agenerate_combined(
+    topic: str,
+    niche: Optional[str],
+    duration_target: Optional[int],
+) -> dict[str, any]:
+    """Async version of _generate_combined()."""
+    user_prompt, system_prompt = _build_combined_prompts(topic, niche, duration_target)
+
+    response = await acall_llm(
+        user_prompt,
+        system_prompt=system_prompt,
+        temperature=settings.ai.temperature,
+    )
+    return _combined_result(response, topic, niche)
+
+
+def _combined_result(response: str, topic: str, niche: Optional[str]) -> dict[str, any]:
+    """Build a generate_script_and_metadata() result from the raw LLM response."""
+    data = _parse_combined_response(response)
+    result = _script_result(data["script"])
+    result["metadata"] = _metadata_from_data(data, topic, niche)
+    return result
+
+
+def generate_scripts_batch(
+    topics: list[str],
+    niche: Optional[str] = None,
+    duration_target: Optional[int] = None,
+    poll_interval: float = 10.0,
+) -> dict[str, dict[str, any]]:
+    """Generate scripts for many topics at once through the provider's batch API.
+
+    Meant for bulk, non-interactive runs: with Anthropic the scripts are
+    billed at batch rates but may take minutes to come back. Results are
+    not cached.
+
+    Args:
+        topics: Video topics
+        niche: Niche for style customization (shared by all topics)
+        duration_target: Target duration in seconds (default from settings)
+        poll_interval: Seconds between batch status checks
+
+    Returns:
+        Dict mapping each topic to a generate_script()-style result
+    """
+    return asyncio.run(agenerate_scripts_batch(topics, niche, duration_target, poll_interval))
+
+
+async def agenerate_scripts_batch(
+    topics: list[str],
+    niche: Optional[str] = None,
+    duration_target: Optional[int] = None,
+    poll_interval: float = 10.0,
+) -> dict[str, dict[str, any]]:
+    """Async version of generate_scripts_batch().
+
+    Args:
+        topics: Video topics
+        niche: Niche for style customization (shared by all topics)
+        duration_target: Target duration in seconds (default from settings)
+        poll_interval: Seconds between batch status checks
+
+    Returns:
+        Dict mapping each topic to a generate_script()-style result
+    """
+    topics = list(dict.fromkeys(topics))
+    prompts = [_build_script_prompts(topic, niche, duration_target) for topic in topics]
+    # The system prompt depends only on the niche, so it's the same for every topic
+    system_prompt = prompts[0][1] if prompts else None
+
+    scripts = await acall_llm_batch(
+        [user_prompt for user_prompt, _ in prompts],
+        system_prompt=system_prompt,
+        temperature=settings.ai.temperature,
+        poll_interval=poll_interval,
+    )
+    return {topic: _script_result(script) for topic, script in zip(topics, scripts)}
+
+
+def _build_script_prompts(
+    topic: str,
+    niche: Optional[str],
+    duration_target: Optional[int],
+) -> tuple[str, str]:
+    """Build the (user prompt, system prompt) pair for script generation."""
     niche_config = get_niche_config(niche)
     prompts = niche_config.get("prompts", {})
 
@@ -40,14 +271,66 @@ def generate_script(
         duration_target=duration_target,
         word_count=word_count_target,
     )
+    return user_prompt, system_prompt
 
-    # Generate the script
-    script = call_llm(
-        user_prompt,
-        system_prompt=system_prompt,
-        temperature=settings.ai.temperature,
-    )
 
+def _build_combined_prompts(
+    topic: str,
+    niche: Optional[str],
+    duration_target: Optional[int],
+) -> tuple[str, str]:
+    """Build the (user prompt, system prompt) pair for a script plus its metadata."""
+    user_prompt, system_prompt = _build_script_prompts(topic, niche, duration_target)
+
+    metadata_config = get_niche_config(niche).get("metadata", {})
+    title_style = metadata_config.get("title_style", "curiosity")
+    hashtag_count = metadata_config.get("hashtag_count", 8)
+
+    user_prompt += f"""
+
+Also write metadata for the video:
+1. A compelling title (max 100 characters) that uses a {title_style} style
+   - curiosity: Creates intrigue, makes people want to know more
+   - direct: Clear, straightforward, tells exactly what they'll learn
+   - question: Poses a question the video answers
+2. A description (2-3 sentences) that summarizes the value, includes
+   relevant keywords and has a soft call-to-action
+3. {hashtag_count} relevant hashtags (mix of popular and niche)
+4. 5-8 SEO tags (keywords for searchability)
+
+Format your response as JSON, with only the spoken words in "script":
+{{
+  "script": "...",
+  "title": "...",
+  "description": "...",
+  "hashtags": ["#tag1", "#tag2", ...],
+  "tags": ["tag1", "tag2", ...]
+}}
+
+Return ONLY the JSON, no other text."""
+    return user_prompt, system_prompt
+
+
+def _parse_combined_response(response: str) -> dict:
+    """Parse the JSON object in a combined script+metadata response.
+
+    The object may be wrapped in a code fence or surrounded by other text.
+
+    Raises:
+        jsonio.JSONDecodeError: If the response has no object with a "script" string
+    """
+    match = _JSON_OBJECT_RE.search(response)
+    if match is None:
+        raise jsonio.JSONDecodeError("No JSON object in response", response, 0)
+
+    data = jsonio.loads(match.group(0))
+    if not isinstance(data, dict) or not isinstance(data.get("script"), str):
+        raise jsonio.JSONDecodeError("No script in response", response, 0)
+    return data
+
+
+def _script_result(script: str) -> dict[str, any]:
+    """Clean a generated script and compute its hook and stats."""
     # Clean up the script
     script = _clean_script(script)
 
@@ -78,16 +361,13 @@ def extract_hook(script: str) -> str:
     if not script:
         return ""
 
-    # Try to get first sentence
-    for end_char in [".", "!", "?"]:
-        if end_char in script:
-            idx = script.index(end_char)
-            # Don't cut too short
-            if idx > 10:
-                return script[: idx + 1].strip()
+    # Try to get first sentence (ending past the first 10 chars, so it isn't cut too short)
+    match = _SENTENCE_END.search(script, 11)
+    if match:
+        return script[: match.end()].strip()
 
     # Fallback: first line or first N words
-    first_line = script.split("\n")[0].strip()
+    first_line = script.partition("\n")[0].strip()
     if len(first_line) > 10:
         return first_line[:100]
 
@@ -111,10 +391,35 @@ def refine_script(
     Returns:
         The refined script
     """
+    refined = call_llm(_build_refine_prompt(script, instruction, niche), temperature=0.7)
+    return _clean_script(refined)
+
+
+async def arefine_script(
+    script: str,
+    instruction: str,
+    niche: Optional[str] = None,
+) -> str:
+    """Async version of refine_script().
+
+    Args:
+        script: The current script
+        instruction: What to change (e.g., "make it more energetic")
+        niche: Niche for style context
+
+    Returns:
+        The refined script
+    """
+    refined = await acall_llm(_build_refine_prompt(script, instruction, niche), temperature=0.7)
+    return _clean_script(refined)
+
+
+def _build_refine_prompt(script: str, instruction: str, niche: Optional[str]) -> str:
+    """Build the prompt for refine_script()."""
     niche_config = get_niche_config(niche)
     style = niche_config.get("prompts", {}).get("style", "conversational")
 
-    prompt = f"""Here is a short-form video script:
+    return f"""Here is a short-form video script:
 
 ---
 {script}
@@ -126,9 +431,6 @@ Please refine this script based on the following instruction:
 Maintain the {style} style. Keep the length similar.
 Return ONLY the refined script, no explanations or labels."""
 
-    refined = call_llm(prompt, temperature=0.7)
-    return _clean_script(refined)
-
 
 def _clean_script(script: str) -> str:
     """Clean up a generated script."""
@@ -148,14 +450,12 @@ def _clean_script(script: str) -> str:
         script = script[1:-1]
 
     # Remove stage directions like [pause], (beat), etc.
-    import re
-
-    script = re.sub(r"\[.*?\]", "", script)
-    script = re.sub(r"\(.*?\)", "", script)
+    script = _BRACKETED.sub("", script)
+    script = _PARENTHESIZED.sub("", script)
 
     # Clean up extra whitespace
-    script = re.sub(r"\n{3,}", "\n\n", script)
-    script = re.sub(r"  +", " ", script)
+    script = _EXTRA_NEWLINES.sub("\n\n", script)
+    script = _EXTRA_SPACES.sub(" ", script)
 
     return script.strip()
 
@@ -1,17 +1,43 @@
 """Generate voiceovers using ElevenLabs API."""
 
-import json
+import atexit
+import base64
+import importlib.util
+from functools import cache
 from pathlib import Path
 from typing import Any, Optional
 
+import httpx
 from elevenlabs import ElevenLabs, VoiceSettings
 
-from ..core.config import get_niche_config, get_voice_config, settings
+try:
+    from mutagen.mp3 import MP3
+except ImportError:  # optional dependency
+    MP3 = None
 
+from ..core import jsonio
+from ..core.config import get_voice_config, resolve_voice, settings
 
+# Negotiate HTTP/2 for TTS requests when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Base64 characters decoded per write (a multiple of 4, so slices decode independently)
+_B64_DECODE_CHUNK = 1 << 20
+
+
+@cache
 def _get_client() -> ElevenLabs:
-    """Get an ElevenLabs client instance."""
-    return ElevenLabs(api_key=settings.elevenlabs_api_key)
+    """Get the shared ElevenLabs client (keeps its connections alive between calls)."""
+    # One pooled connection set for all TTS calls; HTTP/2 multiplexes
+    # concurrent requests over a single connection when h2 is installed
+    http_client = httpx.Client(
+        http2=_HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(240.0, connect=10.0),
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+    atexit.register(http_client.close)
+    return ElevenLabs(api_key=settings.elevenlabs_api_key, httpx_client=http_client)
 
 
 def generate_voiceover(
@@ -38,26 +64,9 @@ def generate_voiceover(
     voice_name = None
 
     if not actual_voice_id:
-        if voice_key:
-            voice_config = get_voice_config(voice_key)
-            actual_voice_id = voice_config.get("voice_id")
-            voice_name = voice_config.get("name", voice_key)
-        elif niche:
-            # Get default voice for niche
-            niche_config = get_niche_config(niche)
-            niche_voice_key = niche_config.get("voice", {}).get("voice_key")
-            if niche_voice_key:
-                voice_config = get_voice_config(niche_voice_key)
-                actual_voice_id = voice_config.get("voice_id")
-                voice_name = voice_config.get("name", niche_voice_key)
-
-    # Fallback to default
-    if not actual_voice_id:
-        voices_config = get_voice_config()
-        default_key = voices_config.get("defaults", {}).get("generic", "sam")
-        voice_config = get_voice_config(default_key)
-        actual_voice_id = voice_config.get("voice_id", "yoZ06aMxZJJ28mfd3POQ")
-        voice_name = voice_config.get("name", "Sam")
+        resolved_id, resolved_key, voice_config = resolve_voice(niche, voice_key)
+        actual_voice_id = resolved_id or "yoZ06aMxZJJ28mfd3POQ"
+        voice_name = voice_config.get("name", resolved_key)
 
     # Get voice settings
     el_settings = settings.elevenlabs
@@ -83,50 +92,26 @@ def generate_voiceover(
     # Save audio file
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # The response contains audio_base_64 and alignment data
-    import base64
-    audio_bytes = base64.b64decode(response.audio_base_64)
-
+    # The response contains audio_base_64 and alignment data; decode it in
+    # slices so the whole MP3 is never held in memory next to its base64 text
+    audio_b64 = response.audio_base_64
     with open(output_path, "wb") as f:
-        f.write(audio_bytes)
+        for offset in range(0, len(audio_b64), _B64_DECODE_CHUNK):
+            f.write(base64.b64decode(audio_b64[offset : offset + _B64_DECODE_CHUNK]))
 
     # Extract word timestamps from alignment data
     word_timestamps = []
     if response.alignment:
-        chars = response.alignment.characters
-        char_starts = response.alignment.character_start_times_seconds
-        char_ends = response.alignment.character_end_times_seconds
-
-        # Build words from characters
-        current_word = ""
-        word_start = None
-        word_end = None
-
-        for i, char in enumerate(chars):
-            if char == " " or i == len(chars) - 1:
-                # End of word
-                if i == len(chars) - 1 and char != " ":
-                    current_word += char
-                    word_end = char_ends[i]
-
-                if current_word.strip():
-                    word_timestamps.append({
-                        "word": current_word.strip(),
-                        "start": word_start,
-                        "end": word_end,
-                    })
-                current_word = ""
-                word_start = None
-            else:
-                if word_start is None:
-                    word_start = char_starts[i]
-                current_word += char
-                word_end = char_ends[i]
+        word_timestamps = _words_from_alignment(
+            response.alignment.characters,
+            response.alignment.character_start_times_seconds,
+            response.alignment.character_end_times_seconds,
+        )
 
     # Save timestamps alongside audio
     timestamps_path = output_path.with_suffix(".timestamps.json")
-    with open(timestamps_path, "w") as f:
-        json.dump(word_timestamps, f, indent=2)
+    # Compact JSON: read back by code, not people
+    timestamps_path.write_bytes(jsonio.dumps(word_timestamps))
 
     # Get audio duration
     duration = get_audio_duration(output_path)
@@ -141,6 +126,41 @@ def generate_voiceover(
     }
 
 
+def _words_from_alignment(
+    chars: list[str],
+    char_starts: list[float],
+    char_ends: list[float],
+) -> list[dict]:
+    """Group ElevenLabs character alignment into word timestamps.
+
+    Words are the runs of characters between spaces; each word starts at
+    its first character's start time and ends at its last character's end.
+    """
+    text = "".join(chars)
+    if len(text) == len(chars):
+        # One code point per entry (the normal case): let str.split() find
+        # the word boundaries instead of walking the characters in Python
+        spans = []
+        pos = 0
+        for piece in text.split(" "):
+            spans.append((pos, pos + len(piece)))
+            pos += len(piece) + 1
+    else:
+        bounds = [-1, *(i for i, char in enumerate(chars) if char == " "), len(chars)]
+        spans = [(prev + 1, stop) for prev, stop in zip(bounds, bounds[1:])]
+
+    word_timestamps = []
+    for first, stop in spans:
+        word = "".join(chars[first:stop]).strip()
+        if word:
+            word_timestamps.append({
+                "word": word,
+                "start": char_starts[first],
+                "end": char_ends[stop - 1],
+            })
+    return word_timestamps
+
+
 def get_audio_duration(audio_path: Path) -> float:
     """Get the duration of an audio file in seconds.
 
@@ -151,6 +171,10 @@ def get_audio_duration(audio_path: Path) -> float:
         Duration in seconds
     """
     try:
+        if MP3 is not None:
+            # Reads only the MP3 headers instead of opening an ffmpeg reader
+            return MP3(str(audio_path)).info.length
+
         from moviepy import AudioFileClip
 
         with AudioFileClip(str(audio_path)) as audio:
@@ -173,8 +197,7 @@ def load_timestamps(audio_path: Path) -> list[dict]:
     """
     timestamps_path = audio_path.with_suffix(".timestamps.json")
     if timestamps_path.exists():
-        with open(timestamps_path) as f:
-            return json.load(f)
+        return jsonio.loads(timestamps_path.read_bytes())
     return []
 
 
@@ -4,24 +4,10 @@ import json
 from typing import Optional
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group
+from rich.markup import escape
 from rich.table import Table
 
-from .agents import (
-    approve_video,
-    create_video,
-    generate_ideas,
-    get_footage_list,
-    get_project_status,
-    get_script,
-    kill_video,
-    list_projects,
-    regenerate_voiceover,
-    remove_footage,
-    render_preview,
-    update_script,
-)
-
 app = typer.Typer(
     name="autoclips",
     help="AI-powered short-form video generation pipeline",
@@ -30,14 +16,26 @@ app = typer.Typer(
 console = Console()
 
 
+def _print_lines(lines: list[str]):
+    """Print several lines of markup with one console.print call.
+
+    Each print call goes through Rich's full render and write path, so
+    commands build their output first and emit it once.
+    """
+    console.print("\n".join(lines))
+
+
 @app.command()
 def create(
     topic: str = typer.Argument(..., help="The video topic"),
     niche: Optional[str] = typer.Option(None, "--niche", "-n", help="Niche for style (e.g., finance)"),
     voice: Optional[str] = typer.Option(None, "--voice", "-v", help="Voice key from voices.yaml"),
     no_generate: bool = typer.Option(False, "--no-generate", help="Create project without generating content"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Regenerate script and metadata instead of reusing cached results"),
 ):
     """Create a new video project."""
+    from .agents import create_video
+
     console.print(f"[bold blue]Creating video:[/] {topic}")
 
     if niche:
@@ -51,21 +49,25 @@ def create(
             niche=niche,
             voice_key=voice,
             auto_generate=not no_generate,
+            use_cache=not no_cache,
         )
 
     if result.get("status") == "error":
         console.print(f"[red]Error: {result.get('error')}[/]")
         raise typer.Exit(1)
 
-    console.print(f"\n[green]Project created: {result['project_id']}[/]")
-    console.print(f"[dim]Steps completed: {', '.join(result.get('steps_completed', []))}[/]")
+    lines = [
+        f"\n[green]Project created: {result['project_id']}[/]",
+        f"[dim]Steps completed: {', '.join(result.get('steps_completed', []))}[/]",
+    ]
 
     if result.get("duration"):
-        console.print(f"[dim]Duration: {result['duration']:.1f}s[/]")
+        lines.append(f"[dim]Duration: {result['duration']:.1f}s[/]")
     if result.get("footage_count"):
-        console.print(f"[dim]Footage clips: {result['footage_count']}[/]")
+        lines.append(f"[dim]Footage clips: {result['footage_count']}[/]")
 
-    console.print(f"\n[yellow]Next: autoclips preview {result['project_id']}[/]")
+    lines.append(f"\n[yellow]Next: autoclips preview {result['project_id']}[/]")
+    _print_lines(lines)
 
 
 @app.command()
@@ -74,48 +76,63 @@ def ideas(
     count: int = typer.Option(5, "--count", "-c", help="Number of ideas"),
 ):
     """Generate video topic ideas."""
+    from .agents import generate_ideas
+
     with console.status("[bold green]Generating ideas..."):
         ideas_list = generate_ideas(niche=niche, count=count)
 
-    console.print(f"\n[bold]Video Ideas{f' ({niche})' if niche else ''}:[/]\n")
+    lines = [f"\n[bold]Video Ideas{f' ({niche})' if niche else ''}:[/]\n"]
 
     for i, idea in enumerate(ideas_list, 1):
-        console.print(f"[cyan]{i}.[/] {idea.get('topic', idea)}")
+        lines.append(f"[cyan]{i}.[/] {idea.get('topic', idea)}")
         if idea.get("hook"):
-            console.print(f"   [dim]Hook: {idea['hook']}[/]")
-        console.print()
+            lines.append(f"   [dim]Hook: {idea['hook']}[/]")
+        lines.append("")
+
+    _print_lines(lines)
 
 
 @app.command("list")
 def list_cmd(
     status: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by status"),
+    limit: int = typer.Option(50, "--limit", "-l", help="Projects per page (0 for all)"),
+    offset: int = typer.Option(0, "--offset", help="Number of projects to skip"),
 ):
-    """List all video projects."""
-    projects = list_projects(status=status)
+    """List video projects, newest first."""
+    from .agents import count_projects, list_projects
+
+    projects = list_projects(status=status, limit=limit or None, offset=offset)
 
     if not projects:
         console.print("[yellow]No projects found.[/]")
         return
 
-    table = Table(title="Video Projects")
-    table.add_column("ID", style="cyan")
+    # Short fixed-format columns are no_wrap so Rich skips wrap measurement on them
+    table = Table(title="Video Projects", show_lines=False, expand=False)
+    table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Topic", max_width=40)
-    table.add_column("Status", style="green")
-    table.add_column("Duration")
-    table.add_column("Created")
+    table.add_column("Status", style="green", no_wrap=True)
+    table.add_column("Duration", no_wrap=True)
+    table.add_column("Created", no_wrap=True)
 
     for p in projects:
         duration = f"{p.get('estimated_duration', 0):.0f}s" if p.get("estimated_duration") else "-"
-        created = p.get("created_at", "")[:10]
+        created = str(p.get("created_at", ""))[:10]
         table.add_row(
             p["id"][:30] + "..." if len(p["id"]) > 30 else p["id"],
-            p.get("topic", "")[:40],
-            p.get("status", ""),
+            str(p.get("topic", ""))[:40],
+            str(p.get("status", "")),
             duration,
             created,
         )
 
-    console.print(table)
+    # Only one page is fetched and rendered; point at the next one
+    total = count_projects(status) if limit else len(projects)
+    shown_to = offset + len(projects)
+    if shown_to < total:
+        console.print(Group(table, f"[dim]Showing {offset + 1}-{shown_to} of {total} (--offset {shown_to} for more)[/]"))
+    else:
+        console.print(table)
 
 
 @app.command()
@@ -123,23 +140,27 @@ def status(
     project_id: str = typer.Argument(..., help="Project ID"),
 ):
     """Get detailed status of a project."""
+    from .agents import get_project_status
+
     result = get_project_status(project_id)
 
     if result.get("error"):
         console.print(f"[red]Error: {result['error']}[/]")
         raise typer.Exit(1)
 
-    console.print(f"\n[bold]Project: {result['id']}[/]\n")
-    console.print(f"Topic: {result.get('topic', 'N/A')}")
-    console.print(f"Niche: {result.get('niche', 'N/A')}")
-    console.print(f"Status: [green]{result.get('status', 'N/A')}[/]")
-    console.print(f"Duration: {result.get('estimated_duration', 0):.1f}s")
-    console.print(f"Word count: {result.get('word_count', 0)}")
-    console.print(f"Footage clips: {result.get('footage_count', 0)}")
-    console.print(f"Voice: {result.get('voice', 'N/A')}")
-    console.print(f"Music: {result.get('music', 'N/A')}")
-    console.print(f"Has preview: {'Yes' if result.get('has_preview') else 'No'}")
-    console.print(f"Has final: {'Yes' if result.get('has_final') else 'No'}")
+    _print_lines([
+        f"\n[bold]Project: {result['id']}[/]\n",
+        f"Topic: {result.get('topic', 'N/A')}",
+        f"Niche: {result.get('niche', 'N/A')}",
+        f"Status: [green]{result.get('status', 'N/A')}[/]",
+        f"Duration: {result.get('estimated_duration', 0):.1f}s",
+        f"Word count: {result.get('word_count', 0)}",
+        f"Footage clips: {result.get('footage_count', 0)}",
+        f"Voice: {result.get('voice', 'N/A')}",
+        f"Music: {result.get('music', 'N/A')}",
+        f"Has preview: {'Yes' if result.get('has_preview') else 'No'}",
+        f"Has final: {'Yes' if result.get('has_final') else 'No'}",
+    ])
 
 
 @app.command()
@@ -147,18 +168,23 @@ def script(
     project_id: str = typer.Argument(..., help="Project ID"),
 ):
     """View the script for a project."""
+    from .agents import get_script
+
     result = get_script(project_id)
 
     if result.get("error"):
         console.print(f"[red]Error: {result['error']}[/]")
         raise typer.Exit(1)
 
-    console.print(f"\n[bold]Script for {project_id}[/]\n")
-    console.print(f"[yellow]Hook:[/] {result.get('hook', 'N/A')}\n")
-    console.print("[dim]─" * 50 + "[/]")
-    console.print(result.get("script", "No script found"))
-    console.print("[dim]─" * 50 + "[/]")
-    console.print(f"\n[dim]Words: {result.get('word_count', 0)} | Duration: {result.get('estimated_duration', 0):.1f}s[/]")
+    _print_lines([
+        f"\n[bold]Script for {project_id}[/]\n",
+        f"[yellow]Hook:[/] {escape(result.get('hook', 'N/A'))}\n",
+        "[dim]" + "─" * 50 + "[/]",
+        # Script text is the user's, not markup
+        escape(result.get("script", "No script found")),
+        "[dim]" + "─" * 50 + "[/]",
+        f"\n[dim]Words: {result.get('word_count', 0)} | Duration: {result.get('estimated_duration', 0):.1f}s[/]",
+    ])
 
 
 @app.command()
@@ -166,29 +192,29 @@ def footage(
     project_id: str = typer.Argument(..., help="Project ID"),
 ):
     """View footage clips for a project."""
+    from .agents import get_footage_list
+
     result = get_footage_list(project_id)
 
     if result.get("error"):
         console.print(f"[red]Error: {result['error']}[/]")
         raise typer.Exit(1)
 
-    console.print(f"\n[bold]Footage for {project_id}[/]\n")
-
-    table = Table()
-    table.add_column("#", style="cyan")
+    table = Table(show_lines=False, expand=False)
+    table.add_column("#", style="cyan", no_wrap=True)
     table.add_column("Filename")
     table.add_column("Keyword")
-    table.add_column("Duration")
+    table.add_column("Duration", no_wrap=True)
 
     for i, clip in enumerate(result.get("clips", []), 1):
         table.add_row(
             str(i),
-            clip.get("filename", ""),
-            clip.get("keyword", ""),
+            str(clip.get("filename", "")),
+            str(clip.get("keyword", "")),
             f"{clip.get('duration', 0):.1f}s",
         )
 
-    console.print(table)
+    console.print(Group(f"\n[bold]Footage for {project_id}[/]\n", table))
 
 
 @app.command()
@@ -196,6 +222,8 @@ def preview(
     project_id: str = typer.Argument(..., help="Project ID"),
 ):
     """Render a preview video."""
+    from .agents import render_preview
+
     console.print(f"[bold blue]Rendering preview for {project_id}...[/]")
 
     with console.status("[bold green]Rendering..."):
@@ -205,9 +233,11 @@ def preview(
         console.print(f"[red]Error: {result['error']}[/]")
         raise typer.Exit(1)
 
-    console.print(f"\n[green][OK] Preview rendered![/]")
-    console.print(f"[dim]Path: {result.get('preview_path')}[/]")
-    console.print(f"\n[yellow]Next: autoclips approve {project_id}[/]")
+    _print_lines([
+        "\n[green][OK] Preview rendered![/]",
+        f"[dim]Path: {result.get('preview_path')}[/]",
+        f"\n[yellow]Next: autoclips approve {project_id}[/]",
+    ])
 
 
 @app.command()
@@ -215,6 +245,8 @@ def approve(
     project_id: str = typer.Argument(..., help="Project ID"),
 ):
     """Approve and render final video."""
+    from .agents import approve_video
+
     console.print(f"[bold blue]Approving {project_id}...[/]")
 
     with console.status("[bold green]Rendering final video..."):
@@ -234,6 +266,8 @@ def kill(
     delete: bool = typer.Option(False, "--delete", "-d", help="Permanently delete files"),
 ):
     """Kill a video project."""
+    from .agents import kill_video
+
     result = kill_video(project_id, delete_files=delete)
 
     if result.get("error"):
@@ -249,6 +283,8 @@ def update_script_cmd(
     script_file: str = typer.Argument(..., help="Path to new script file"),
 ):
     """Update project script from a file."""
+    from .agents import update_script
+
     try:
         with open(script_file) as f:
             new_script = f.read()
@@ -272,6 +308,8 @@ def remove_footage_cmd(
     keyword: str = typer.Argument(..., help="Filename or keyword to match"),
 ):
     """Remove footage from a project."""
+    from .agents import remove_footage
+
     result = remove_footage(project_id, keyword)
 
     if result.get("error"):
@@ -289,6 +327,8 @@ def regen_voice_cmd(
     project_id: str = typer.Argument(..., help="Project ID"),
 ):
     """Regenerate voiceover after script changes."""
+    from .agents import regenerate_voiceover
+
     console.print(f"[bold blue]Regenerating voiceover...[/]")
 
     with console.status("[bold green]Generating..."):
@@ -309,20 +349,21 @@ def voices():
 
     voices_list = list_available_voices()
 
-    table = Table(title="Available Voices")
-    table.add_column("Key", style="cyan")
-    table.add_column("Name")
-    table.add_column("Gender")
-    table.add_column("Tone")
+    table = Table(title="Available Voices", show_lines=False, expand=False)
+    table.add_column("Key", style="cyan", no_wrap=True)
+    table.add_column("Name", no_wrap=True)
+    table.add_column("Gender", no_wrap=True)
+    table.add_column("Tone", no_wrap=True)
     table.add_column("Description", max_width=40)
 
     for v in voices_list:
+        description = str(v.get("description", ""))
         table.add_row(
-            v["key"],
-            v["name"],
-            v["gender"],
-            v["tone"],
-            v["description"][:40] + "..." if len(v.get("description", "")) > 40 else v.get("description", ""),
+            str(v["key"]),
+            str(v["name"]),
+            str(v["gender"]),
+            str(v["tone"]),
+            description[:40] + "..." if len(description) > 40 else description,
         )
 
     console.print(table)
@@ -1,6 +1,33 @@
-from .assembler import assemble_video, render_preview, render_final
-from .captions import generate_word_timestamps, render_captions
-from .footage import search_footage, download_clip, get_footage_for_script
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .assembler import assemble_video, render_final, render_preview
+    from .captions import generate_word_timestamps, render_captions
+    from .footage import (
+        adownload_clip,
+        adownload_clips,
+        download_clip,
+        download_clips,
+        get_footage_for_script,
+        search_footage,
+    )
+
+# Submodules are imported on first attribute access (PEP 562), so commands
+# that never render don't pay for the video stack at startup.
+_LAZY = {
+    "assemble_video": "assembler",
+    "render_preview": "assembler",
+    "render_final": "assembler",
+    "generate_word_timestamps": "captions",
+    "render_captions": "captions",
+    "search_footage": "footage",
+    "download_clip": "footage",
+    "download_clips": "footage",
+    "adownload_clip": "footage",
+    "adownload_clips": "footage",
+    "get_footage_for_script": "footage",
+}
 
 __all__ = [
     "assemble_video",
@@ -10,5 +37,20 @@ __all__ = [
     "render_captions",
     "search_footage",
     "download_clip",
+    "download_clips",
+    "adownload_clip",
+    "adownload_clips",
     "get_footage_for_script",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,64 +1,94 @@
 """Assemble final video from components."""
 
+import hashlib
+import os
 import random
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from moviepy import (
-    AudioFileClip,
-    ColorClip,
-    CompositeAudioClip,
-    CompositeVideoClip,
-    VideoFileClip,
-)
-from moviepy.audio.fx import AudioFadeIn, AudioFadeOut, AudioLoop, MultiplyVolume
-from moviepy.video.fx import Loop
+from typing import TYPE_CHECKING, Optional
 
+from ..core import jsonio
 from ..core.config import get_assets_dir, settings
-from ..core.project import Project, TimelineEntry
-from .captions import generate_word_timestamps, load_word_timestamps, render_captions, render_hook_text
+from ..core.project import FootageClip, Project, TimelineEntry
+from .captions import (
+    caption_clips,
+    caption_track,
+    generate_word_timestamps,
+    hook_overlay_clip,
+    load_word_timestamps,
+)
+from .ffmpeg_assembler import (
+    HW_ENCODERS,
+    cover_size,
+    cuda_available,
+    footage_source,
+    hardware_support,
+    render_video,
+    resize_footage,
+    transcode_video,
+)
+from .probe import probe_media
 
+# MoviePy takes a large part of a second to import, so it is only loaded by
+# the functions that build clips; the CLI and the FFmpeg render path skip it
+if TYPE_CHECKING:
+    from moviepy import AudioClip, AudioFileClip, VideoClip, VideoFileClip
 
-# Cache for GPU availability check
-_gpu_available: Optional[bool] = None
 
+# Cache for the encoder check
+_video_codec: Optional[str] = None
 
-def _check_nvidia_gpu() -> bool:
-    """Check if NVIDIA GPU encoding is available via ffmpeg."""
-    global _gpu_available
 
-    if _gpu_available is not None:
-        return _gpu_available
+def _get_video_codec() -> str:
+    """Get the best available video codec, preferring hardware encoders."""
+    global _video_codec
 
+    if _video_codec is not None:
+        return _video_codec
+
+    _video_codec = "libx264"
     try:
-        # Check if ffmpeg has h264_nvenc encoder
-        result = subprocess.run(
-            ["ffmpeg", "-hide_banner", "-encoders"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        _gpu_available = "h264_nvenc" in result.stdout
-        if _gpu_available:
-            print("[GPU] NVIDIA h264_nvenc encoder detected - using GPU acceleration")
+        encoders = hardware_support()["encoders"]
+        if encoders:
+            _video_codec = encoders[0]
+            print(f"[GPU] {HW_ENCODERS[_video_codec]} encoder ({_video_codec}) detected - using hardware encoding")
         else:
-            print("[GPU] NVIDIA encoder not found - using CPU encoding")
+            print("[GPU] No hardware encoder found - using CPU encoding")
     except Exception:
-        _gpu_available = False
         print("[GPU] Could not detect encoders - using CPU encoding")
 
-    return _gpu_available
-
-
-def _get_video_codec() -> str:
-    """Get the best available video codec."""
-    if _check_nvidia_gpu():
-        return "h264_nvenc"
-    return "libx264"
+    return _video_codec
 
 
-def assemble_video(project: Project) -> CompositeVideoClip:
+def _encoder_params(codec: str, final: bool) -> list[str]:
+    """Get encoder arguments for a preview or final render."""
+    if codec == "h264_nvenc":
+        if final:
+            # NVIDIA GPU encoding - high quality, with lookahead, adaptive
+            # quantization and B-frames so the quality target costs fewer bits
+            return [
+                "-preset", "p5", "-tune", "hq", "-multipass", "qres",
+                "-rc", "vbr", "-cq", "19", "-b:v", "8M", "-maxrate", "12M", "-bufsize", "16M",
+                "-rc-lookahead", "32", "-spatial-aq", "1", "-temporal-aq", "1", "-bf", "3",
+            ]
+        # NVIDIA GPU encoding - fastest preset, constant QP, no frame reordering
+        return [
+            "-preset", "p1", "-tune", "ull", "-rc", "constqp", "-qp", "30",
+            "-bf", "0", "-g", "120", "-zerolatency", "1",
+        ]
+    if codec == "h264_videotoolbox":
+        return ["-b:v", "8M"] if final else ["-b:v", "4M", "-realtime", "1"]
+    if codec == "h264_qsv":
+        return ["-preset", "slower", "-b:v", "8M"] if final else ["-preset", "veryfast"]
+
+    # CPU encoding
+    if final:
+        return ["-preset", "medium", "-b:v", "8M"]
+    return ["-preset", "ultrafast"]
+
+
+def assemble_video(project: Project) -> "VideoClip":
     """Assemble a complete video from project components.
 
     Args:
@@ -67,6 +97,8 @@ def assemble_video(project: Project) -> CompositeVideoClip:
     Returns:
         The assembled video clip
     """
+    from moviepy import AudioFileClip, CompositeVideoClip
+
     # Load voiceover
     if not project.voiceover_path.exists():
         raise FileNotFoundError(f"Voiceover not found: {project.voiceover_path}")
@@ -83,26 +115,28 @@ def assemble_video(project: Project) -> CompositeVideoClip:
         # Fallback to calculated timestamps
         script = project.get_script() or ""
         word_timestamps = generate_word_timestamps(script, total_duration)
-    video = render_captions(video, word_timestamps)
+    # All captions as one overlay layer rather than a layer per caption
+    track = caption_track(caption_clips(word_timestamps, video.w), video.size)
+    overlays = [track] if track is not None else []
 
     # Add hook text
     hook = project.state.hook_text
-    if hook:
-        video = render_hook_text(video, hook)
+    hook_clip = hook_overlay_clip(hook, video.size) if hook else None
+    if hook_clip is not None:
+        overlays.append(hook_clip)
+
+    # Captions and hook go into a single composite over the footage track
+    if overlays:
+        video = CompositeVideoClip([video] + overlays, size=video.size)
 
     # Add background music
     final_audio = _build_audio_track(voiceover, project, total_duration)
 
-    # Combine video and audio
-    final_video = video.with_audio(final_audio)
-
-    # Set duration
-    final_video = final_video.with_duration(total_duration)
-
-    return final_video
+    # Combine video and audio at the voiceover's length
+    return video.with_audio(final_audio).with_duration(total_duration)
 
 
-def _build_video_track(project: Project, duration: float) -> CompositeVideoClip:
+def _build_video_track(project: Project, duration: float) -> "VideoClip":
     """Build the video track from footage clips.
 
     Args:
@@ -110,8 +144,10 @@ def _build_video_track(project: Project, duration: float) -> CompositeVideoClip:
         duration: Total video duration
 
     Returns:
-        Composited video clip
+        Video clip covering the whole duration
     """
+    from moviepy import ColorClip, CompositeVideoClip, concatenate_videoclips
+
     footage_clips = project.state.footage_clips
     video_settings = settings.video
 
@@ -123,55 +159,32 @@ def _build_video_track(project: Project, duration: float) -> CompositeVideoClip:
             duration=duration,
         )
 
-    # Calculate how long each clip should play
-    clip_duration = duration / len(footage_clips)
-    timeline = []
+    # Missing files are skipped up front so the remaining clips fill the whole video
+    footage_clips = [
+        footage for footage in footage_clips
+        if (project.footage_dir / footage.filename).exists()
+    ]
 
-    current_time = 0.0
     video_clips = []
+    timeline = []
 
-    for i, footage in enumerate(footage_clips):
-        clip_path = project.footage_dir / footage.filename
-
-        if not clip_path.exists():
-            continue
-
-        try:
-            clip = VideoFileClip(str(clip_path))
-
-            # Resize to fit our dimensions (crop to fill)
-            clip = _resize_and_crop(clip, video_settings.width, video_settings.height)
-
-            # Set timing
-            clip_end = min(current_time + clip_duration, duration)
-            actual_duration = clip_end - current_time
-
-            # Loop or trim clip to fit
-            if clip.duration < actual_duration:
-                # Loop the clip
-                loops_needed = int(actual_duration / clip.duration) + 1
-                clip = clip.with_effects([Loop(n=loops_needed)])
-
-            clip = clip.subclipped(0, actual_duration)
-            clip = clip.with_start(current_time)
-
-            video_clips.append(clip)
-
-            # Record timeline
-            timeline.append(
-                TimelineEntry(
-                    clip_filename=footage.filename,
-                    start=current_time,
-                    end=clip_end,
-                    keyword=footage.keyword,
-                )
-            )
-
-            current_time = clip_end
-
-        except Exception as e:
-            print(f"Warning: Could not load clip {clip_path}: {e}")
-            continue
+    if footage_clips:
+        # Calculate how long each clip should play
+        clip_duration = duration / len(footage_clips)
+        start_times = [i * clip_duration for i in range(len(footage_clips))]
+
+        # Opening a clip spawns an ffmpeg reader, so overlap the opens
+        with ThreadPoolExecutor(max_workers=min(8, len(footage_clips))) as executor:
+            futures = [
+                executor.submit(_prepare_clip, project, footage, start, clip_duration, duration)
+                for footage, start in zip(footage_clips, start_times)
+            ]
+            for future in futures:
+                prepared = future.result()
+                if prepared:
+                    clip, entry = prepared
+                    video_clips.append(clip)
+                    timeline.append(entry)
 
     # Save timeline
     project.set_timeline(timeline)
@@ -183,42 +196,124 @@ def _build_video_track(project: Project, duration: float) -> CompositeVideoClip:
             duration=duration,
         )
 
+    # Clips fill their slots back to back unless one failed to load, in which
+    # case the gap has to stay where it is and only compositing can do that
+    if len(video_clips) == len(footage_clips):
+        if len(video_clips) == 1:
+            # A single clip already covers the whole duration at full frame size
+            return video_clips[0]
+        return concatenate_videoclips(video_clips, method="chain")
+
     # Composite all clips
     return CompositeVideoClip(video_clips, size=(video_settings.width, video_settings.height))
 
 
+def _prepare_clip(
+    project: Project,
+    footage: FootageClip,
+    start: float,
+    clip_duration: float,
+    total_duration: float,
+) -> Optional[tuple["VideoFileClip", TimelineEntry]]:
+    """Open, resize, loop and trim one footage clip for its slot.
+
+    Args:
+        project: The project with footage
+        footage: The FootageClip to load
+        start: Start time of the clip's slot in the video
+        clip_duration: Length of each clip slot
+        total_duration: Total video duration
+
+    Returns:
+        Tuple of (positioned clip, timeline entry), or None if loading failed
+    """
+    from moviepy import VideoFileClip
+    from moviepy.video.fx import Loop
+
+    clip_path = footage_source(project.footage_dir / footage.filename)
+    video_settings = settings.video
+
+    try:
+        # Plan the fill size from cached headers so ffmpeg scales while decoding
+        info = probe_media(clip_path)
+        decode_size = cover_size(info["width"], info["height"], video_settings.width, video_settings.height)
+        if decode_size == (info["width"], info["height"]):
+            # Only a crop is needed, so don't add a scaler to the reader
+            decode_size = None
+        # Footage sound is never used, so don't start an audio reader for it
+        clip = VideoFileClip(str(clip_path), audio=False, target_resolution=decode_size)
+
+        # Crop to fill our dimensions (already scaled to cover them)
+        clip = _resize_and_crop(clip, video_settings.width, video_settings.height)
+
+        # Set timing
+        clip_end = min(start + clip_duration, total_duration)
+        actual_duration = clip_end - start
+
+        # Loop or trim clip to fit
+        if clip.duration < actual_duration:
+            # Loop the clip for exactly the slot length
+            clip = clip.with_effects([Loop(duration=actual_duration)])
+        else:
+            clip = clip.subclipped(0, actual_duration)
+        clip = clip.with_start(start)
+
+        entry = TimelineEntry(
+            clip_filename=footage.filename,
+            start=start,
+            end=clip_end,
+            keyword=footage.keyword,
+        )
+        return clip, entry
+
+    except Exception as e:
+        print(f"Warning: Could not load clip {clip_path}: {e}")
+        return None
+
+
 def _resize_and_crop(
-    clip: VideoFileClip,
+    clip: "VideoFileClip",
     target_width: int,
     target_height: int,
-) -> VideoFileClip:
+) -> "VideoFileClip":
     """Resize and crop clip to fill target dimensions."""
-    # Calculate scale to fill (cover, not contain)
-    scale_w = target_width / clip.w
-    scale_h = target_height / clip.h
-    scale = max(scale_w, scale_h)
+    import numpy as np
+    from PIL import Image
 
-    # Resize
-    new_width = int(clip.w * scale)
-    new_height = int(clip.h * scale)
-    clip = clip.resized((new_width, new_height))
+    if clip.size == (target_width, target_height):
+        # Pre-resized footage (or footage shot at our size)
+        return clip
 
-    # Crop to center
-    x_center = new_width // 2
-    y_center = new_height // 2
-    x1 = x_center - target_width // 2
-    y1 = y_center - target_height // 2
+    # Size to fill (cover, not contain)
+    cover = cover_size(clip.w, clip.h, target_width, target_height)
 
-    clip = clip.cropped(x1=x1, y1=y1, width=target_width, height=target_height)
+    if cover == tuple(clip.size):
+        # Already decoded at the fill size, a center crop is enough
+        x1 = (clip.w - target_width) // 2
+        y1 = (clip.h - target_height) // 2
+        return clip.cropped(x1=x1, y1=y1, width=target_width, height=target_height)
 
-    return clip
+    # Source region that lands in the frame after scaling, centered
+    scale = cover[0] / clip.w
+    box_width = target_width / scale
+    box_height = target_height / scale
+    left = (clip.w - box_width) / 2
+    top = (clip.h - box_height) / 2
+    box = (left, top, left + box_width, top + box_height)
+
+    def scale_and_crop(frame):
+        # One resample of just the visible region, no full-size intermediate frame
+        image = Image.fromarray(frame.astype("uint8"))
+        return np.asarray(image.resize((target_width, target_height), Image.Resampling.LANCZOS, box=box))
+
+    return clip.image_transform(scale_and_crop)
 
 
 def _build_audio_track(
-    voiceover: AudioFileClip,
+    voiceover: "AudioFileClip",
     project: Project,
     duration: float,
-) -> CompositeAudioClip:
+) -> "AudioClip":
     """Build the audio track with voiceover and music.
 
     Args:
@@ -227,8 +322,11 @@ def _build_audio_track(
         duration: Total duration
 
     Returns:
-        Composited audio clip
+        Composited audio clip, or the voiceover itself when there's no music
     """
+    from moviepy import AudioFileClip, CompositeAudioClip
+    from moviepy.audio.fx import AudioFadeIn, AudioFadeOut, AudioLoop, MultiplyVolume
+
     music_settings = settings.music
     audio_clips = [voiceover]
 
@@ -261,6 +359,9 @@ def _build_audio_track(
             except Exception as e:
                 print(f"Warning: Could not load music: {e}")
 
+    if len(audio_clips) == 1:
+        return voiceover
+
     return CompositeAudioClip(audio_clips)
 
 
@@ -287,16 +388,13 @@ def _get_music_track(project: Project) -> Optional[Path]:
         # Try any music folder
         music_base = get_assets_dir() / "music"
         if music_base.exists():
-            for mood_dir in music_base.iterdir():
-                if mood_dir.is_dir():
-                    music_dir = mood_dir
-                    break
+            music_dir = _first_mood_dir(music_base, music_base.stat().st_mtime_ns) or music_dir
 
     if not music_dir.exists():
         return None
 
-    # Find music files
-    music_files = list(music_dir.glob("*.mp3")) + list(music_dir.glob("*.wav"))
+    # Find music files (the listing is reused until the directory changes)
+    music_files = _list_music_files(music_dir, music_dir.stat().st_mtime_ns)
 
     if not music_files:
         return None
@@ -305,77 +403,213 @@ def _get_music_track(project: Project) -> Optional[Path]:
     return random.choice(music_files)
 
 
+_MUSIC_EXTENSIONS = (".mp3", ".wav")
+
+
+@lru_cache(maxsize=16)
+def _list_music_files(music_dir: Path, mtime_ns: int) -> tuple[Path, ...]:
+    """List the tracks in a music directory (mtime_ns only keys the cache)."""
+    # One directory pass instead of a glob per extension
+    with os.scandir(music_dir) as entries:
+        return tuple(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(_MUSIC_EXTENSIONS) and entry.is_file()
+        )
+
+
+@lru_cache(maxsize=4)
+def _first_mood_dir(music_base: Path, mtime_ns: int) -> Optional[Path]:
+    """Find the first mood folder in the music directory (mtime_ns only keys the cache)."""
+    with os.scandir(music_base) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                return Path(entry.path)
+    return None
+
+
+def _get_render_music(project: Project) -> Optional[Path]:
+    """Get the music track to mix into a render, or None if music is off."""
+    if not settings.music.enabled:
+        return None
+
+    music_path = _get_music_track(project)
+    if music_path and music_path.exists():
+        return music_path
+    return None
+
+
+def _render_edit(project: Project, output_path: Path, codec: str, ffmpeg_params: list[str]):
+    """Render the project's edit to a file.
+
+    FFmpeg renders the whole edit in one filter graph, on the GPU from decode
+    to encode when NVENC and CUDA filters are available. If the GPU graph
+    fails it is retried on the CPU, and if that fails too (e.g. an input the
+    graph can't handle), the MoviePy pipeline is used instead.
+    """
+    music_path = _get_render_music(project)
+
+    if settings.video.cache_resized_footage:
+        _resize_project_footage(project, codec)
+
+    if codec == "h264_nvenc" and cuda_available():
+        try:
+            render_video(project, output_path, codec, ffmpeg_params, music_path, cuda=True)
+            return
+        except RuntimeError as e:
+            print(f"Warning: CUDA render failed, retrying with CPU decoding: {e}")
+
+    try:
+        render_video(project, output_path, codec, ffmpeg_params, music_path)
+        return
+    except RuntimeError as e:
+        print(f"Warning: FFmpeg render failed, falling back to MoviePy: {e}")
+
+    final_video = assemble_video(project)
+    try:
+        final_video.write_videofile(
+            str(output_path),
+            fps=settings.video.fps,
+            codec=codec,
+            audio_codec="aac",
+            ffmpeg_params=ffmpeg_params,
+            threads=4,
+            logger=None,
+        )
+    finally:
+        final_video.close()
+
+
+def _resize_project_footage(project: Project, codec: str):
+    """Make sure every footage clip has an up to date frame-sized copy.
+
+    Copies are encoded at final quality since they feed final renders too.
+    A clip that can't be resized is rendered from the original.
+    """
+    for footage in project.state.footage_clips:
+        clip_path = project.footage_dir / footage.filename
+        if not clip_path.exists():
+            continue
+        try:
+            resize_footage(clip_path, codec, _encoder_params(codec, final=True))
+        except RuntimeError as e:
+            print(f"Warning: Could not resize clip {clip_path}: {e}")
+
+
 def render_preview(project: Project) -> Path:
     """Render a preview video (lower quality for speed).
 
+    The edit is rendered by FFmpeg in a single pass; only the encoder
+    settings differ from render_final. Rendering is skipped when the
+    existing preview was made from the same inputs and settings.
+
     Args:
         project: The project to render
 
     Returns:
         Path to preview video
     """
-    final_video = assemble_video(project)
     output_path = project.preview_path
     codec = _get_video_codec()
 
-    # Build ffmpeg params based on codec
-    ffmpeg_params = []
-    if codec == "h264_nvenc":
-        # NVIDIA GPU encoding - use fast preset
-        ffmpeg_params = ["-preset", "p1", "-tune", "ll", "-rc", "vbr", "-cq", "28"]
-    else:
-        # CPU encoding
-        ffmpeg_params = ["-preset", "ultrafast"]
-
-    final_video.write_videofile(
-        str(output_path),
-        fps=settings.video.fps,
-        codec=codec,
-        audio_codec="aac",
-        ffmpeg_params=ffmpeg_params,
-        threads=4,
-        logger=None,
-    )
-
-    # Clean up
-    final_video.close()
+    ffmpeg_params = _encoder_params(codec, final=False)
 
+    fingerprint = _render_fingerprint(project, codec, ffmpeg_params)
+    if _read_fingerprint(output_path) == fingerprint:
+        return output_path
+
+    _render_edit(project, output_path, codec, ffmpeg_params)
+    _write_fingerprint(output_path, fingerprint)
     return output_path
 
 
 def render_final(project: Project) -> Path:
     """Render the final high-quality video.
 
+    Skipped when the existing final video is up to date. If
+    settings.video.reuse_preview is on and the preview was rendered from
+    the same edit, the preview is re-encoded at final quality instead of
+    rendering the edit again.
+
     Args:
         project: The project to render
 
     Returns:
         Path to final video
     """
-    final_video = assemble_video(project)
     output_path = project.final_path
     codec = _get_video_codec()
 
-    # Build ffmpeg params based on codec
-    ffmpeg_params = []
-    if codec == "h264_nvenc":
-        # NVIDIA GPU encoding - high quality
-        ffmpeg_params = ["-preset", "p5", "-tune", "hq", "-rc", "vbr", "-cq", "19", "-b:v", "8M"]
+    ffmpeg_params = _encoder_params(codec, final=True)
+
+    fingerprint = _render_fingerprint(project, codec, ffmpeg_params)
+    if _read_fingerprint(output_path) == fingerprint:
+        return output_path
+
+    preview_fingerprint = _read_fingerprint(project.preview_path)
+    if (
+        settings.video.reuse_preview
+        and preview_fingerprint
+        and preview_fingerprint["edit"] == fingerprint["edit"]
+        and project.preview_path.exists()
+    ):
+        transcode_video(project.preview_path, output_path, codec, ffmpeg_params)
     else:
-        # CPU encoding
-        ffmpeg_params = ["-preset", "medium", "-b:v", "8M"]
-
-    final_video.write_videofile(
-        str(output_path),
-        fps=settings.video.fps,
-        codec=codec,
-        audio_codec="aac",
-        ffmpeg_params=ffmpeg_params,
-        threads=4,
-        logger=None,
-    )
-
-    # Clean up
-    final_video.close()
+        _render_edit(project, output_path, codec, ffmpeg_params)
 
+    _write_fingerprint(output_path, fingerprint)
     return output_path
+
+
+def _file_stamp(path: Path) -> Optional[tuple[int, int]]:
+    """Get (mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _render_fingerprint(project: Project, codec: str, codec_params: list[str]) -> dict[str, str]:
+    """Hash everything a render depends on.
+
+    'edit' covers the inputs and layout settings (what the video shows),
+    'encoder' the codec arguments. The music pick itself isn't included,
+    since tracks are chosen at random within the mood.
+    """
+    state = project.state
+    edit = [
+        _file_stamp(project.voiceover_path),
+        _file_stamp(project.voiceover_path.with_suffix(".timestamps.json")),
+        project.get_script(),
+        state.hook_text,
+        [(clip.filename, _file_stamp(project.footage_dir / clip.filename)) for clip in state.footage_clips],
+        state.music_track,
+        state.music_mood,
+        settings.video.model_dump(exclude={"reuse_preview"}),
+        settings.captions.model_dump(),
+        settings.hook_text.model_dump(),
+        settings.music.model_dump(),
+    ]
+    return {
+        "edit": hashlib.blake2b(jsonio.dumps(edit), digest_size=16).hexdigest(),
+        "encoder": hashlib.blake2b(jsonio.dumps([codec, codec_params]), digest_size=16).hexdigest(),
+    }
+
+
+def _fingerprint_path(video_path: Path) -> Path:
+    return video_path.with_name(f"{video_path.name}.fingerprint.json")
+
+
+def _read_fingerprint(video_path: Path) -> Optional[dict[str, str]]:
+    """Load the fingerprint saved with a rendered video, if the video still exists."""
+    if not video_path.exists():
+        return None
+    try:
+        return jsonio.loads(_fingerprint_path(video_path).read_bytes())
+    except (FileNotFoundError, jsonio.JSONDecodeError):
+        return None
+
+
+def _write_fingerprint(video_path: Path, fingerprint: dict[str, str]):
+    _fingerprint_path(video_path).write_bytes(jsonio.dumps(fingerprint))
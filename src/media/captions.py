@@ -1,18 +1,29 @@
 """Generate and render animated captions."""
 
-import json
+import math
+import os
 import re
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from moviepy import (
-    CompositeVideoClip,
-    TextClip,
-)
-from moviepy.video.fx import CrossFadeIn, CrossFadeOut
+from typing import TYPE_CHECKING, Optional
 
+from ..core import jsonio
 from ..core.config import settings
 
+# MoviePy is imported by the functions that build clips (see assembler.py)
+if TYPE_CHECKING:
+    from moviepy import CompositeVideoClip, ImageClip, VideoClip
+
+# Fade in/out length of the hook text overlay, in seconds
+HOOK_FADE = 0.3
+
+# Patterns used on every word of a script
+_PARA_RE = re.compile(r"\n\n+")
+_SPLIT_RE = re.compile(r"^(.+[.!?])([A-Z].*)$")
+
 
 def load_word_timestamps(voiceover_path: Path) -> list[dict]:
     """Load word timestamps from ElevenLabs JSON file.
@@ -25,8 +36,7 @@ def load_word_timestamps(voiceover_path: Path) -> list[dict]:
     """
     timestamps_path = voiceover_path.with_suffix(".timestamps.json")
     if timestamps_path.exists():
-        with open(timestamps_path) as f:
-            return json.load(f)
+        return jsonio.loads(timestamps_path.read_bytes())
     return []
 
 
@@ -51,35 +61,22 @@ def generate_word_timestamps(
     if not words:
         return []
 
-    # Use linear timing - equal time per word
-    time_per_word = audio_duration / len(words)
-
-    timestamps = []
-    current_time = 0.0
-
-    for word in words:
-        timestamps.append(
-            {
-                "word": word,
-                "start": current_time,
-                "end": current_time + time_per_word,
-            }
-        )
-        current_time += time_per_word
+    # Use linear timing - equal time per word. Boundaries are computed from
+    # the word index, so rounding doesn't accumulate and the last word ends
+    # exactly at audio_duration
+    count = len(words)
+    bounds = [audio_duration * i / count for i in range(count + 1)]
 
-    return timestamps
+    return [
+        {"word": word, "start": start, "end": end}
+        for word, start, end in zip(words, bounds, bounds[1:])
+    ]
 
 
 def _clean_and_split(text: str) -> list[str]:
     """Clean text and split into words."""
-    # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text.strip())
-
-    # Split on whitespace
-    words = text.split()
-
-    # Filter empty strings
-    return [w for w in words if w]
+    # str.split() with no separator collapses whitespace runs and drops empties
+    return text.split()
 
 
 def _estimate_text_width(text: str, font_size: int) -> int:
@@ -93,7 +90,30 @@ def _estimate_text_width(text: str, font_size: int) -> int:
     return int(len(text) * char_width)
 
 
-def _wrap_text_by_words(text: str, font_size: int, max_width: int) -> str:
+@lru_cache(maxsize=16)
+def _load_font(font: str, font_size: int):
+    """Load a TrueType font with Pillow, or None if it can't be loaded."""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype(font, font_size)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _text_width(text: str, font_size: int, font: Optional[str] = None) -> int:
+    """Get the pixel width of text.
+
+    Measured with the caption font when it can be loaded, otherwise estimated.
+    """
+    pil_font = _load_font(font, font_size) if font else None
+    if pil_font is None:
+        return _estimate_text_width(text, font_size)
+    return math.ceil(pil_font.getlength(text))
+
+
+def _wrap_text_by_words(text: str, font_size: int, max_width: int, font: Optional[str] = None) -> str:
     """Wrap text at word boundaries to fit within max_width.
 
     This prevents mid-word breaks that can happen with auto-wrapping.
@@ -105,10 +125,10 @@ def _wrap_text_by_words(text: str, font_size: int, max_width: int) -> str:
     lines = []
     current_line = []
     current_width = 0
-    space_width = _estimate_text_width(" ", font_size)
+    space_width = _text_width(" ", font_size, font)
 
     for word in words:
-        word_width = _estimate_text_width(word, font_size)
+        word_width = _text_width(word, font_size, font)
 
         # Check if adding this word would exceed max_width
         if current_line:
@@ -134,14 +154,30 @@ def _wrap_text_by_words(text: str, font_size: int, max_width: int) -> str:
     return "\n".join(lines)
 
 
-def _preprocess_timestamps(word_timestamps: list[dict]) -> list[dict]:
+def _caption_box(text: str, font_size: int, stroke_width: int, font: str) -> tuple[int, int]:
+    """Size of the box a (pre-wrapped) caption is drawn in.
+
+    Just wide enough for the longest line and tall enough for every line,
+    with padding so the stroke and descenders aren't clipped.
+    """
+    lines = text.split("\n")
+    # Generous line height for descenders
+    line_height = int(font_size * 1.5)
+    width = max(_text_width(line, font_size, font) for line in lines) + stroke_width * 4 + 20
+    # Text is centered on its measured glyph height, which leaves the bottom
+    # of the box tighter than the top, so pad on top of the line heights
+    height = line_height * len(lines) + font_size // 10 + stroke_width * 8
+    return width, height
+
+
+def _preprocess_timestamps(word_timestamps: Iterable[dict]) -> Iterator[dict]:
     """Preprocess timestamps to split words that span paragraph breaks.
 
     ElevenLabs sometimes combines words across newlines like "customers.\n\nFinally,"
     which causes caption grouping issues. This splits them into separate entries.
+    Entries are yielded as they are produced, so callers can consume them in
+    the same pass.
     """
-    processed = []
-
     for ts in word_timestamps:
         word = ts["word"]
         start = ts["start"]
@@ -151,7 +187,7 @@ def _preprocess_timestamps(word_timestamps: list[dict]) -> list[dict]:
         # Check if word contains paragraph breaks
         if "\n\n" in word:
             # Split on paragraph breaks
-            parts = [p.strip() for p in word.split("\n\n") if p.strip()]
+            parts = [p.strip() for p in _PARA_RE.split(word) if p.strip()]
             if len(parts) > 1:
                 # Distribute time proportionally by character count
                 total_chars = sum(len(p) for p in parts)
@@ -159,51 +195,49 @@ def _preprocess_timestamps(word_timestamps: list[dict]) -> list[dict]:
 
                 for part in parts:
                     part_duration = duration * (len(part) / total_chars) if total_chars > 0 else duration / len(parts)
-                    processed.append({
+                    yield {
                         "word": part,
                         "start": current_time,
                         "end": current_time + part_duration,
-                    })
+                    }
                     current_time += part_duration
                 continue
 
         # Check if word contains sentence-ending punctuation followed by more text
         # e.g., "word.Another" should be split
-        match = re.match(r'^(.+[.!?])([A-Z].*)$', word)
+        match = _SPLIT_RE.match(word)
         if match:
             part1, part2 = match.groups()
             total_chars = len(part1) + len(part2)
             part1_duration = duration * (len(part1) / total_chars)
 
-            processed.append({
+            yield {
                 "word": part1,
                 "start": start,
                 "end": start + part1_duration,
-            })
-            processed.append({
+            }
+            yield {
                 "word": part2,
                 "start": start + part1_duration,
                 "end": end,
-            })
+            }
             continue
 
         # Clean any remaining newlines from the word
         clean_word = word.replace("\n", " ").strip()
         if clean_word:
-            processed.append({
+            yield {
                 "word": clean_word,
                 "start": start,
                 "end": end,
-            })
-
-    return processed
+            }
 
 
 def render_captions(
     video_clip,
     word_timestamps: list[dict],
     style: Optional[str] = None,
-) -> CompositeVideoClip:
+) -> "CompositeVideoClip":
     """Render captions onto a video.
 
     Args:
@@ -214,35 +248,335 @@ def render_captions(
     Returns:
         CompositeVideoClip with captions
     """
+    from moviepy import CompositeVideoClip
+
+    track = caption_track(caption_clips(word_timestamps, video_clip.w, style), video_clip.size)
+    if track is None:
+        return video_clip
+
+    return CompositeVideoClip([video_clip, track])
+
+
+def caption_clips(
+    word_timestamps: list[dict],
+    video_width: int,
+    style: Optional[str] = None,
+) -> list["ImageClip"]:
+    """Build the timed, positioned caption clips for a video.
+
+    Args:
+        word_timestamps: List of word timing dicts (from ElevenLabs or generated)
+        video_width: Width of the video the captions are laid over
+        style: Caption style ('word_by_word', 'sentence')
+
+    Returns:
+        List of caption clips with start times and positions set
+    """
     style = style or settings.captions.style
     caption_settings = settings.captions
 
     if not caption_settings.enabled or not word_timestamps:
-        return video_clip
+        return []
 
-    # Preprocess timestamps to split words that span paragraph breaks
+    # Split words that span paragraph breaks, streamed into the clip builders
     word_timestamps = _preprocess_timestamps(word_timestamps)
 
     if style == "word_by_word":
-        return _render_word_by_word(video_clip, word_timestamps, caption_settings)
+        return _word_by_word_clips(word_timestamps, video_width, caption_settings)
     else:
-        return _render_sentence(video_clip, word_timestamps, caption_settings)
+        return _sentence_clips(word_timestamps, video_width, caption_settings)
 
 
-def _render_word_by_word(
-    video_clip,
-    word_timestamps: list[dict],
-    caption_settings,
-) -> CompositeVideoClip:
-    """Render word-by-word animated captions."""
+def caption_track(
+    text_clips: list["ImageClip"],
+    video_size: tuple[int, int],
+) -> Optional["VideoClip"]:
+    """Merge caption clips into one overlay clip.
+
+    Captions are shown one at a time, so instead of compositing a layer per
+    caption, a single clip covering the area all captions occupy looks up
+    the caption active at each time and draws it onto that canvas.
+
+    Args:
+        text_clips: Caption clips from caption_clips()
+        video_size: (width, height) of the video the captions are laid over
+
+    Returns:
+        Positioned clip with a mask, or None if there are no captions
+    """
+    import numpy as np
+    from moviepy import VideoClip
+
+    if not text_clips:
+        return None
+
+    text_clips = sorted(text_clips, key=lambda clip: clip.start)
+    starts = [clip.start for clip in text_clips]
+
+    # Caption clips are centered static images; place them on a shared canvas
+    boxes = [
+        ((video_size[0] - clip.w) // 2, (video_size[1] - clip.h) // 2, clip.w, clip.h)
+        for clip in text_clips
+    ]
+    left = min(x for x, _, _, _ in boxes)
+    top = min(y for _, y, _, _ in boxes)
+    width = max(x + w for x, _, w, _ in boxes) - left
+    height = max(y + h for _, y, _, h in boxes) - top
+
+    empty = (np.zeros((height, width, 3), dtype=np.uint8), np.zeros((height, width)))
+
+    @lru_cache(maxsize=2)
+    def layer(index: Optional[int]):
+        # The frame and mask readers ask for the same caption back to back
+        if index is None:
+            return empty
+        clip = text_clips[index]
+        x, y, w, h = boxes[index]
+        rgb, alpha = np.zeros_like(empty[0]), np.zeros_like(empty[1])
+        rgb[y - top:y - top + h, x - left:x - left + w] = clip.get_frame(0)
+        alpha[y - top:y - top + h, x - left:x - left + w] = clip.mask.get_frame(0)
+        return rgb, alpha
+
+    def active(t: float) -> Optional[int]:
+        index = bisect_right(starts, t) - 1
+        if index < 0 or t >= text_clips[index].end:
+            return None
+        return index
+
+    duration = max(clip.end for clip in text_clips)
+    mask = VideoClip(lambda t: layer(active(t))[1], is_mask=True, duration=duration)
+    track = VideoClip(lambda t: layer(active(t))[0], duration=duration)
+    return track.with_mask(mask).with_position((left, top))
+
+
+# Rasterized texts, keyed by _text_bitmap() arguments; the oldest are
+# dropped first once the cache is full
+_BITMAP_CACHE_SIZE = 512
+_bitmap_cache: dict[tuple, tuple] = {}
+
+# Distinct uncached texts from which rasterizing fans out to worker processes
+_PARALLEL_MIN_TEXTS = 16
+
+
+def _text_bitmap(
+    text: str,
+    font: str,
+    font_size: int,
+    color: str,
+    stroke_color: str,
+    stroke_width: int,
+    size: tuple[int, Optional[int]],
+):
+    """Rasterize caption text once and return its (RGB, alpha) arrays.
+
+    Scripts repeat a lot of words ("the", "and", ...), so the bitmaps are
+    memoized and shared by every caption showing the same text. A height of
+    None fits the box to the text.
+    """
+    key = (text, font, font_size, color, stroke_color, stroke_width, size)
+    bitmap = _bitmap_cache.get(key)
+    if bitmap is None:
+        bitmap = _store_bitmap(key, _rasterize_text(*key))
+    return bitmap
+
+
+def _store_bitmap(key: tuple, rgba):
+    """Split an RGBA raster into cached (RGB, alpha) arrays."""
+    rgb = rgba[:, :, :3]
+    # Same scale as a MoviePy mask
+    alpha = rgba[:, :, 3] / 255
+    # Shared between clips, so make sure nobody draws into them
+    rgb.flags.writeable = False
+    alpha.flags.writeable = False
+
+    while len(_bitmap_cache) >= _BITMAP_CACHE_SIZE:
+        _bitmap_cache.pop(next(iter(_bitmap_cache)))
+    _bitmap_cache[key] = (rgb, alpha)
+    return rgb, alpha
+
+
+def _prerender_bitmaps(keys: list[tuple]):
+    """Rasterize uncached texts in parallel worker processes.
+
+    Text layout and drawing hold the GIL, so threads wouldn't help. Small
+    batches aren't worth starting workers for and are left to _text_bitmap().
+    """
+    missing = [key for key in dict.fromkeys(keys) if key not in _bitmap_cache]
+    # Storing more than the cache holds would evict bitmaps rendered earlier
+    # in this batch; the rest are rasterized on demand by _text_bitmap()
+    missing = missing[:_BITMAP_CACHE_SIZE]
+    workers = min(os.cpu_count() or 1, len(missing))
+    if len(missing) < _PARALLEL_MIN_TEXTS or workers < 2:
+        return
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rasters = list(executor.map(_try_rasterize_text, missing, chunksize=4))
+    except Exception:
+        # Workers unavailable (e.g. restricted environment); rasterize serially
+        return
+
+    for key, rgba in zip(missing, rasters):
+        if rgba is not None:
+            _store_bitmap(key, rgba)
+
+
+def _try_rasterize_text(key: tuple):
+    """Worker entry point: rasterize a text, or None if it can't be drawn."""
+    try:
+        return _rasterize_text(*key)
+    except Exception:
+        return None
+
+
+# Extra pixels between wrapped lines (MoviePy's TextClip default)
+_LINE_SPACING = 4
+
+
+def _rasterize_text(
+    text: str,
+    font: str,
+    font_size: int,
+    color: str,
+    stroke_color: str,
+    stroke_width: int,
+    size: tuple[int, Optional[int]],
+):
+    """Draw text centered in a box of the given size.
+
+    Draws straight onto a Pillow image with the same layout MoviePy's
+    TextClip uses for method="caption" (word wrapped to the box width, lines
+    centered, block centered vertically), without TextClip's per-character
+    line breaking.
+
+    Returns:
+        H x W x 4 uint8 RGBA array
+    """
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    pil_font = _load_font(font, font_size)
+    if pil_font is None:
+        raise ValueError(f"Can't load font {font!r}")
+
+    box_width, box_height = size
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+    def extent(line: str) -> tuple[float, float, float, float]:
+        return draw.multiline_textbbox(
+            (0, 0),
+            line,
+            font=pil_font,
+            spacing=_LINE_SPACING,
+            align="center",
+            stroke_width=stroke_width,
+            anchor="ls",
+        )
+
+    def fits(line: str) -> bool:
+        left, _, right, _ = extent(line)
+        return right - left < box_width
+
+    # Break lines at spaces so none overflows the box
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if line and not fits(candidate):
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    text = "\n".join(lines)
+
+    left, top, right, bottom = extent(text)
+    text_width, text_height = int(right - left), int(bottom - top)
+    if box_height is None:
+        box_height = text_height
+
+    image = Image.new("RGBA", (box_width, box_height), (0, 0, 0, 0))
+    ascent, _ = pil_font.getmetrics()
+    x = (box_width - text_width) / 2 + stroke_width
+    y = (box_height - text_height) / 2 + ascent + stroke_width
+    ImageDraw.Draw(image).multiline_text(
+        (x, y),
+        text,
+        fill=color,
+        font=pil_font,
+        spacing=_LINE_SPACING,
+        align="center",
+        stroke_width=stroke_width,
+        stroke_fill=stroke_color,
+        anchor="ls",
+    )
+    return np.asarray(image)
+
+
+def _text_style(caption_settings) -> tuple[str, int, str, str, int]:
+    """Caption font and colors as _text_bitmap() arguments.
+
+    Read once per batch of captions rather than off the settings model for
+    every word.
+    """
+    return (
+        caption_settings.font,
+        caption_settings.font_size,
+        caption_settings.color,
+        caption_settings.stroke_color,
+        caption_settings.stroke_width,
+    )
+
+
+def _caption_clip(
+    text: str,
+    size: tuple[int, int],
+    text_style: tuple[str, int, str, str, int],
+    start: float,
+    duration: float,
+) -> "ImageClip":
+    """Build a centered caption clip from the (cached) text bitmap."""
+    from moviepy import ImageClip
+
+    rgb, alpha = _text_bitmap(text, *text_style, size)
+    mask = ImageClip(alpha, is_mask=True, duration=duration)
+    txt_clip = ImageClip(rgb, duration=duration).with_mask(mask)
+    txt_clip = txt_clip.with_position(("center", "center"))
+    return txt_clip.with_start(start)
+
+
+def _build_caption_clips(
+    layouts: list[tuple[str, tuple[int, int], float, float]],
+    text_style: tuple[str, int, str, str, int],
+) -> list["ImageClip"]:
+    """Build caption clips from (text, box size, start, duration) layouts.
+
+    Captions that fail to render are skipped.
+    """
+    _prerender_bitmaps([(text, *text_style, size) for text, size, _, _ in layouts])
+
     text_clips = []
+    for text, size, start, duration in layouts:
+        try:
+            text_clips.append(_caption_clip(text, size, text_style, start, duration))
+        except Exception:
+            continue
 
-    font_size = caption_settings.font_size
-    stroke_width = caption_settings.stroke_width
+    return text_clips
 
-    # Add padding around text to prevent stroke clipping
-    # Using "caption" method with fixed size gives us control over the text box
-    text_height = int(font_size * 1.6 + stroke_width * 8)
+
+def _word_by_word_clips(
+    word_timestamps: Iterable[dict],
+    video_width: int,
+    caption_settings,
+) -> list["ImageClip"]:
+    """Build word-by-word animated caption clips."""
+    layouts = []
+
+    text_style = _text_style(caption_settings)
+    font, font_size, _, _, stroke_width = text_style
+    max_width = video_width - 100
 
     for ts in word_timestamps:
         word = ts["word"]
@@ -253,49 +587,33 @@ def _render_word_by_word(
         if duration <= 0:
             continue
 
-        try:
-            txt_clip = TextClip(
-                text=word,
-                font_size=font_size,
-                color=caption_settings.color,
-                font=caption_settings.font,
-                stroke_color=caption_settings.stroke_color,
-                stroke_width=stroke_width,
-                method="caption",
-                size=(video_clip.w - 100, text_height),  # Fixed height with stroke padding
-                text_align="center",
-                duration=duration,
-            )
-            txt_clip = txt_clip.with_position(("center", "center"))
-            txt_clip = txt_clip.with_start(start)
-            text_clips.append(txt_clip)
-        except Exception:
-            continue
+        # Using "caption" method with a fixed size gives us control over the text box
+        width, height = _caption_box(word, font_size, stroke_width, font)
+        layouts.append((word, (min(width, max_width), height), start, duration))
 
-    return CompositeVideoClip([video_clip] + text_clips)
+    return _build_caption_clips(layouts, text_style)
 
 
-def _render_sentence(
-    video_clip,
-    word_timestamps: list[dict],
+def _sentence_clips(
+    word_timestamps: Iterable[dict],
+    video_width: int,
     caption_settings,
-) -> CompositeVideoClip:
-    """Render sentence-based captions with proper timing."""
+) -> list["ImageClip"]:
+    """Build sentence-based caption clips with proper timing."""
     # Group words into sentences/chunks
     sentences = _group_into_sentences(word_timestamps)
-    text_clips = []
+    layouts = []
 
-    font_size = caption_settings.font_size
-    stroke_width = caption_settings.stroke_width
+    text_style = _text_style(caption_settings)
+    font, font_size, _, _, stroke_width = text_style
 
-    # Calculate text box dimensions with VERY generous padding
-    # Leave plenty of room on sides to prevent any clipping
+    # Keep captions well inside the frame
     horizontal_margin = 300  # Total margin (150px each side)
-    text_width = video_clip.w - horizontal_margin
+    text_width = video_width - horizontal_margin
 
-    # Allow for up to 4 lines of text plus generous padding for stroke
-    line_height = int(font_size * 1.5)  # Generous line height for descenders
-    text_height = line_height * 4 + stroke_width * 12  # Extra padding for stroke
+    # Manually wrap text at word boundaries to prevent mid-word breaks
+    # Use a smaller effective width for wrapping to ensure text fits with stroke
+    wrap_width = text_width - stroke_width * 6
 
     for sentence in sentences:
         words = [ts["word"] for ts in sentence]
@@ -307,44 +625,25 @@ def _render_sentence(
         if duration <= 0:
             continue
 
-        try:
-            # Manually wrap text at word boundaries to prevent mid-word breaks
-            # Use a smaller effective width for wrapping to ensure text fits with stroke
-            wrap_width = text_width - stroke_width * 6
-            wrapped_text = _wrap_text_by_words(text, font_size, wrap_width)
-
-            txt_clip = TextClip(
-                text=wrapped_text,
-                font_size=font_size,
-                color=caption_settings.color,
-                font=caption_settings.font,
-                stroke_color=caption_settings.stroke_color,
-                stroke_width=stroke_width,
-                method="caption",  # Use caption with size for stroke padding
-                size=(text_width, text_height),  # Fixed size includes stroke padding
-                text_align="center",
-                duration=duration,
-            )
-            txt_clip = txt_clip.with_position(("center", "center"))
-            txt_clip = txt_clip.with_start(start)
-            text_clips.append(txt_clip)
-        except Exception:
-            continue
+        wrapped_text = _wrap_text_by_words(text, font_size, wrap_width, font)
 
-    return CompositeVideoClip([video_clip] + text_clips)
+        # Box fitted to the wrapped lines, with stroke padding
+        size = _caption_box(wrapped_text, font_size, stroke_width, font)
+        layouts.append((wrapped_text, size, start, duration))
 
+    return _build_caption_clips(layouts, text_style)
 
-def _group_into_sentences(word_timestamps: list[dict], max_words: int = 4) -> list[list[dict]]:
+
+def _group_into_sentences(word_timestamps: Iterable[dict], max_words: int = 4) -> Iterator[list[dict]]:
     """Group words into sentence-like chunks for display.
 
     Args:
-        word_timestamps: List of word timing dicts
+        word_timestamps: Word timing dicts (any iterable, consumed once)
         max_words: Maximum words per caption chunk (lower = faster pacing)
 
-    Returns:
-        List of sentence groups, each containing word timestamp dicts
+    Yields:
+        Sentence groups, each containing word timestamp dicts
     """
-    sentences = []
     current_sentence = []
 
     for ts in word_timestamps:
@@ -353,21 +652,19 @@ def _group_into_sentences(word_timestamps: list[dict], max_words: int = 4) -> li
 
         # End sentence on punctuation or max words
         if word.endswith((".", "!", "?")) or len(current_sentence) >= max_words:
-            sentences.append(current_sentence)
+            yield current_sentence
             current_sentence = []
 
     # Add remaining words
     if current_sentence:
-        sentences.append(current_sentence)
-
-    return sentences
+        yield current_sentence
 
 
 def render_hook_text(
     video_clip,
     hook_text: str,
     duration: Optional[float] = None,
-) -> CompositeVideoClip:
+) -> "CompositeVideoClip":
     """Render hook text overlay at the start of video.
 
     Args:
@@ -378,43 +675,85 @@ def render_hook_text(
     Returns:
         CompositeVideoClip with hook text
     """
+    from moviepy import CompositeVideoClip
+
+    hook_clip = hook_overlay_clip(hook_text, video_clip.size, duration)
+    if hook_clip is None:
+        return video_clip
+
+    return CompositeVideoClip([video_clip, hook_clip])
+
+
+def hook_overlay_clip(
+    hook_text: str,
+    video_size: tuple[int, int],
+    duration: Optional[float] = None,
+) -> Optional["ImageClip"]:
+    """Build the hook text clip with its fade in/out applied.
+
+    Args:
+        hook_text: The hook text to display
+        video_size: (width, height) of the video the hook is laid over
+        duration: How long to show the hook (default from settings)
+
+    Returns:
+        Faded clip starting at 0, or None if the hook is disabled or fails to render
+    """
+    from moviepy.video.fx import CrossFadeIn, CrossFadeOut
+
+    hook_clip = hook_text_clip(hook_text, video_size, duration)
+    if hook_clip is None:
+        return None
+
+    # Add fade effects
+    return hook_clip.with_effects([
+        CrossFadeIn(HOOK_FADE),
+        CrossFadeOut(HOOK_FADE),
+    ])
+
+
+def hook_text_clip(
+    hook_text: str,
+    video_size: tuple[int, int],
+    duration: Optional[float] = None,
+) -> Optional["ImageClip"]:
+    """Build the positioned hook text clip, without fades.
+
+    Args:
+        hook_text: The hook text to display
+        video_size: (width, height) of the video the hook is laid over
+        duration: How long to show the hook (default from settings)
+
+    Returns:
+        Clip starting at 0, or None if the hook is disabled or fails to render
+    """
+    from moviepy import ImageClip
+
     hook_settings = settings.hook_text
 
     if not hook_settings.enabled or not hook_text:
-        return video_clip
+        return None
 
     duration = duration or hook_settings.duration
+    width, height = video_size
 
     # Calculate position
     if hook_settings.position == "top_center":
-        pos = ("center", int(video_clip.h * 0.15))
+        pos = ("center", int(height * 0.15))
     elif hook_settings.position == "center":
         pos = ("center", "center")
     else:
-        pos = ("center", int(video_clip.h * 0.2))
+        pos = ("center", int(height * 0.2))
 
     try:
-        hook_clip = TextClip(
-            text=hook_text,
-            font_size=hook_settings.font_size,
-            color="#FFFFFF",
-            font="arialbd.ttf",
-            stroke_color="#000000",
-            stroke_width=4,
-            method="caption",
-            size=(video_clip.w - 150, None),
-            text_align="center",
-            duration=duration,
+        # Same bitmap cache as the captions, so repeat renders of a hook
+        # (preview, then final) rasterize it once
+        rgb, alpha = _text_bitmap(
+            hook_text, "arialbd.ttf", hook_settings.font_size, "#FFFFFF", "#000000", 4, (width - 150, None)
         )
+        mask = ImageClip(alpha, is_mask=True, duration=duration)
+        hook_clip = ImageClip(rgb, duration=duration).with_mask(mask)
         hook_clip = hook_clip.with_position(pos)
-        hook_clip = hook_clip.with_start(0)
-
-        # Add fade effects
-        hook_clip = hook_clip.with_effects([
-            CrossFadeIn(0.3),
-            CrossFadeOut(0.3),
-        ])
-
-        return CompositeVideoClip([video_clip, hook_clip])
+        return hook_clip.with_start(0)
     except Exception:
-        return video_clip
+        return None
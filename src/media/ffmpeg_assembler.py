@@ -0,0 +1,745 @@
+"""Render videos with a single FFmpeg filter graph.
+
+Instead of compositing frames in Python through MoviePy, the whole edit -
+footage scaling, cropping, trimming and concatenation, caption and hook
+overlays, and the voiceover/music mix - is expressed as one filter_complex
+and handed to a single FFmpeg process.
+"""
+
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from ..core.cache import disk_cache
+from ..core.config import settings
+from ..core.project import Project, TimelineEntry
+from .captions import (
+    HOOK_FADE,
+    caption_clips,
+    generate_word_timestamps,
+    hook_text_clip,
+    load_word_timestamps,
+)
+from .probe import probe_media
+
+# Hardware H.264 encoders, in order of preference
+HW_ENCODERS = {
+    "h264_nvenc": "NVIDIA NVENC",
+    "h264_videotoolbox": "Apple VideoToolbox",
+    "h264_qsv": "Intel Quick Sync",
+}
+
+
+def get_ffmpeg_binary() -> str:
+    """Get the FFmpeg executable, preferring the one on PATH.
+
+    Falls back to the binary bundled with imageio-ffmpeg (a MoviePy dependency).
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        return ffmpeg
+
+    import imageio_ffmpeg
+
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
+
+def hardware_support() -> dict:
+    """Find the hardware encoders and CUDA filters FFmpeg can use here.
+
+    Probing spawns several FFmpeg processes, so the result is cached in
+    memory and on disk (for a day), keyed by the FFmpeg binary's path and
+    modification time.
+
+    Returns:
+        Dict with 'encoders' (working HW_ENCODERS, in order of preference)
+        and 'cuda' (CUDA decoding and scale_cuda available)
+    """
+    ffmpeg = get_ffmpeg_binary()
+    return _hardware_support(ffmpeg, os.stat(ffmpeg).st_mtime_ns)
+
+
+def cuda_available() -> bool:
+    """Check whether FFmpeg can decode with CUDA and scale with scale_cuda."""
+    return hardware_support()["cuda"]
+
+
+@lru_cache(maxsize=1)
+@disk_cache("hardware", max_age=24 * 60 * 60)
+def _hardware_support(ffmpeg: str, mtime_ns: int) -> dict:
+    """Probe an FFmpeg binary's hardware support (mtime only keys the cache)."""
+    encoders = _ffmpeg_output(ffmpeg, "-encoders")
+    hwaccels = _ffmpeg_output(ffmpeg, "-hwaccels")
+    filters = _ffmpeg_output(ffmpeg, "-filters")
+
+    return {
+        # Builds list encoders whether or not the hardware exists, so try each one
+        "encoders": [
+            encoder for encoder in HW_ENCODERS
+            if encoder in encoders and _encoder_works(ffmpeg, encoder)
+        ],
+        "cuda": "cuda" in hwaccels.split() and " scale_cuda " in filters,
+    }
+
+
+def _ffmpeg_output(ffmpeg: str, option: str) -> str:
+    """Get the output of an FFmpeg listing option (e.g. -encoders), or "" on failure."""
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", option], capture_output=True, text=True, timeout=10
+        )
+    except Exception:
+        return ""
+    return result.stdout
+
+
+def _encoder_works(ffmpeg: str, encoder: str) -> bool:
+    """Check that an encoder can actually open (the hardware is present)."""
+    try:
+        result = subprocess.run(
+            [
+                ffmpeg, "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                "-c:v", encoder, "-f", "null", "-",
+            ],
+            capture_output=True,
+            timeout=10,
+        )
+    except Exception:
+        return False
+    return result.returncode == 0
+
+
+def render_video(
+    project: Project,
+    output_path: Path,
+    codec: str,
+    codec_params: list[str],
+    music_path: Optional[Path] = None,
+    cuda: bool = False,
+) -> Path:
+    """Render a project to a video file with one FFmpeg invocation.
+
+    Args:
+        project: The project to render
+        output_path: Where to write the video
+        codec: FFmpeg video encoder (e.g. 'libx264', 'h264_nvenc')
+        codec_params: Extra encoder arguments (preset, rate control, bitrate)
+        music_path: Background music track, or None for voiceover only
+        cuda: Decode and scale footage on an NVIDIA GPU (see cuda_available())
+
+    Returns:
+        Path to the rendered video
+    """
+    if not project.voiceover_path.exists():
+        raise FileNotFoundError(f"Voiceover not found: {project.voiceover_path}")
+
+    duration = probe_media(project.voiceover_path)["duration"]
+
+    with tempfile.TemporaryDirectory(prefix="autoclips-") as tmp:
+        tmp_dir = Path(tmp)
+        slots = _plan_footage(project, duration)
+        overlays = _prepare_overlays(project, duration, tmp_dir)
+        groups = _split_slots(slots, settings.video.render_segments)
+
+        graph = _FilterGraph()
+        if len(groups) > 1:
+            # Picture encoded in parallel segments, joined without re-encoding
+            segment_list = _render_segments(groups, overlays, codec, codec_params, cuda, tmp_dir)
+            video_map = f"{graph.add_input(segment_list, '-f', 'concat', '-safe', '0')}:v"
+            video_args = ["-c:v", "copy"]
+        else:
+            video = _add_footage(graph, slots, duration, cuda)
+            video_map = f"[{_add_overlays(graph, video, overlays)}]"
+            video_args = ["-r", str(settings.video.fps), "-c:v", codec, *codec_params, "-pix_fmt", "yuv420p"]
+
+        audio_index = graph.add_input(project.voiceover_path)
+        audio = f"{audio_index}:a"
+        if music_path:
+            audio = _add_music(graph, audio, music_path, duration)
+
+        filter_args = ["-filter_complex", ";".join(graph.filters)] if graph.filters else []
+        cmd = [
+            get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-y",
+            *graph.input_args,
+            *filter_args,
+            "-map", video_map,
+            "-map", f"[{audio}]" if music_path else audio,
+            "-t", f"{duration:.3f}",
+            *video_args,
+            "-c:a", "aac",
+            "-movflags", "+faststart",
+            str(output_path),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg render failed: {result.stderr.strip()[-2000:]}")
+
+    return output_path
+
+
+def transcode_video(
+    source_path: Path,
+    output_path: Path,
+    codec: str,
+    codec_params: list[str],
+) -> Path:
+    """Re-encode a rendered video's picture with other encoder settings.
+
+    The audio stream is copied as-is.
+
+    Args:
+        source_path: Video to re-encode
+        output_path: Where to write the result
+        codec: FFmpeg video encoder (e.g. 'libx264', 'h264_nvenc')
+        codec_params: Extra encoder arguments (preset, rate control, bitrate)
+
+    Returns:
+        Path to the re-encoded video
+    """
+    cmd = [
+        get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-y",
+        "-i", str(source_path),
+        "-map", "0:v", "-map", "0:a",
+        "-c:v", codec, *codec_params,
+        "-pix_fmt", "yuv420p",
+        "-c:a", "copy",
+        "-movflags", "+faststart",
+        str(output_path),
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg transcode failed: {result.stderr.strip()[-2000:]}")
+
+    return output_path
+
+
+# Scale factors with small exact pixel ratios, which resamplers handle cheaply
+_SNAP_SCALES = (1 / 4, 1 / 3, 1 / 2, 2 / 3, 3 / 4, 1, 4 / 3, 3 / 2, 2, 3, 4)
+# How much extra zoom snapping to one of them may add
+_SNAP_TOLERANCE = 1.1
+
+
+def cover_size(width: int, height: int, frame_width: int, frame_height: int) -> tuple[int, int]:
+    """Size to scale a width x height source to so it covers the frame.
+
+    The exact cover scale is snapped up to a simple ratio (1/2, 2/3, 1, ...)
+    when that zooms in by no more than 10%, so sources close to the frame
+    size are only cropped and the rest get integer-friendly resampling.
+
+    Returns:
+        (width, height) to scale to before center-cropping to the frame
+    """
+    need = max(frame_width / width, frame_height / height)
+    scale = next((s for s in _SNAP_SCALES if need <= s <= need * _SNAP_TOLERANCE), need)
+    return max(frame_width, round(width * scale)), max(frame_height, round(height * scale))
+
+
+def _scale_filter(width: int, height: int, cover: tuple[int, int]) -> Optional[str]:
+    """FFmpeg scale filter for cover_size() output, or None if no scaling is needed."""
+    if cover == (width, height):
+        return None
+    if width % cover[0] == 0 and height % cover[1] == 0:
+        # Whole-number downscale: an area average is exact and cheapest
+        return f"scale={cover[0]}:{cover[1]}:flags=area"
+    return f"scale={cover[0]}:{cover[1]}"
+
+
+def resized_footage_path(clip_path: Path) -> Path:
+    """Where the frame-sized copy of a footage clip is cached."""
+    video_settings = settings.video
+    name = f"{clip_path.stem}_{video_settings.width}x{video_settings.height}.mp4"
+    return clip_path.parent / ".resized" / name
+
+
+def footage_source(clip_path: Path) -> Path:
+    """Get the file to read a footage clip from.
+
+    Returns:
+        The clip's frame-sized copy if it is up to date, else the clip itself
+    """
+    cached = resized_footage_path(clip_path)
+    try:
+        if cached.stat().st_mtime_ns >= clip_path.stat().st_mtime_ns:
+            return cached
+    except OSError:
+        pass
+    return clip_path
+
+
+def resize_footage(clip_path: Path, codec: str, codec_params: list[str]) -> Path:
+    """Cache a copy of a footage clip scaled and cropped to the video frame.
+
+    Renders then read the copy and skip the scale step, so every preview and
+    final render of a project pays for resizing each clip only once. An up
+    to date copy is left alone.
+
+    Args:
+        clip_path: Footage clip to resize
+        codec: FFmpeg video encoder (e.g. 'libx264', 'h264_nvenc')
+        codec_params: Extra encoder arguments (preset, rate control, bitrate)
+
+    Returns:
+        Path to the resized copy
+    """
+    cached = resized_footage_path(clip_path)
+    if footage_source(clip_path) == cached:
+        return cached
+
+    video_settings = settings.video
+    width, height = video_settings.width, video_settings.height
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    partial = cached.with_name(f".{cached.name}")
+
+    info = probe_media(clip_path)
+    cover = cover_size(info["width"], info["height"], width, height)
+    scale = _scale_filter(info["width"], info["height"], cover)
+    if scale and "flags=" not in scale:
+        scale += ":flags=lanczos"
+    crop = f"crop={width}:{height},setsar=1"
+
+    cmd = [
+        get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-y",
+        "-i", str(clip_path),
+        "-an",
+        "-vf", f"{scale},{crop}" if scale else crop,
+        "-c:v", codec, *codec_params,
+        "-pix_fmt", "yuv420p",
+        "-f", "mp4",
+        str(partial),
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        partial.unlink(missing_ok=True)
+        raise RuntimeError(f"FFmpeg resize failed: {result.stderr.strip()[-2000:]}")
+
+    os.replace(partial, cached)
+    return cached
+
+
+class _FilterGraph:
+    """Accumulates FFmpeg input arguments and filter_complex chains."""
+
+    def __init__(self):
+        self.input_args: list[str] = []
+        self.filters: list[str] = []
+        self._inputs = 0
+        self._labels = 0
+
+    def add_input(self, path: Path, *options: str) -> int:
+        """Add an input file (with per-input options) and return its index."""
+        self.input_args += [*options, "-i", str(path)]
+        self._inputs += 1
+        return self._inputs - 1
+
+    def label(self, prefix: str) -> str:
+        """Return a fresh pad label."""
+        self._labels += 1
+        return f"{prefix}{self._labels}"
+
+
+@dataclass
+class _Slot:
+    """A footage clip's place in the video."""
+
+    path: Path
+    info: dict
+    start: float
+    end: float
+
+
+@dataclass
+class _Overlay:
+    """A pre-rendered overlay input and where it goes in the frame."""
+
+    path: Path
+    options: list[str]
+    chain: str
+    x: int
+    y: int
+
+
+def _plan_footage(project: Project, duration: float) -> list[_Slot]:
+    """Lay the project's footage clips out back to back and record the timeline.
+
+    Returns:
+        Slots in playback order (empty if there is no usable footage)
+    """
+    # Missing files are skipped up front so the remaining clips fill the whole video
+    footage_clips = [
+        footage for footage in project.state.footage_clips
+        if (project.footage_dir / footage.filename).exists()
+    ]
+
+    if not footage_clips:
+        project.set_timeline([])
+        return []
+
+    # Each cold probe is an FFmpeg subprocess, so run them side by side
+    clip_paths = [footage_source(project.footage_dir / footage.filename) for footage in footage_clips]
+    with ThreadPoolExecutor(max_workers=min(8, len(clip_paths))) as executor:
+        infos = list(executor.map(probe_media, clip_paths))
+
+    clip_duration = duration / len(footage_clips)
+    slots = []
+    timeline = []
+
+    current_time = 0.0
+    for footage, clip_path, info in zip(footage_clips, clip_paths, infos):
+        clip_end = min(current_time + clip_duration, duration)
+        slots.append(_Slot(clip_path, info, current_time, clip_end))
+        timeline.append(
+            TimelineEntry(
+                clip_filename=footage.filename,
+                start=current_time,
+                end=clip_end,
+                keyword=footage.keyword,
+            )
+        )
+        current_time = clip_end
+
+    project.set_timeline(timeline)
+    return slots
+
+
+def _split_slots(slots: list[_Slot], count: int) -> list[list[_Slot]]:
+    """Split the slots into up to `count` runs of roughly equal length."""
+    count = max(1, min(count, len(slots)))
+    if count == 1:
+        return [slots]
+
+    end = slots[-1].end
+    groups = [[] for _ in range(count)]
+    for slot in slots:
+        groups[min(int(slot.start / end * count), count - 1)].append(slot)
+    return [group for group in groups if group]
+
+
+def _render_segments(
+    groups: list[list[_Slot]],
+    overlays: list[_Overlay],
+    codec: str,
+    codec_params: list[str],
+    cuda: bool,
+    tmp_dir: Path,
+) -> Path:
+    """Encode each run of slots to its own file, with one FFmpeg process per run.
+
+    Returns:
+        Path to a concat demuxer list of the encoded segments, in order
+    """
+    paths = [tmp_dir / f"segment_{i:02d}.mp4" for i in range(len(groups))]
+
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        futures = [
+            executor.submit(_render_segment, group, overlays, path, codec, codec_params, cuda)
+            for group, path in zip(groups, paths)
+        ]
+        for future in futures:
+            future.result()
+
+    list_path = tmp_dir / "segments.txt"
+    list_path.write_text("".join(f"file '{path}'\n" for path in paths), encoding="utf-8")
+    return list_path
+
+
+def _render_segment(
+    slots: list[_Slot],
+    overlays: list[_Overlay],
+    output_path: Path,
+    codec: str,
+    codec_params: list[str],
+    cuda: bool,
+):
+    """Encode the picture (no audio) for a run of consecutive slots."""
+    start = slots[0].start
+    duration = slots[-1].end - start
+
+    graph = _FilterGraph()
+    video = _add_footage(graph, slots, duration, cuda)
+
+    # Overlays are timed against the whole video, so place the run at its
+    # start time while they are applied, then rebase it to zero
+    if start > 0:
+        shifted = graph.label("at")
+        graph.filters.append(f"[{video}]setpts=PTS+{start:.3f}/TB[{shifted}]")
+        video = shifted
+    video = _add_overlays(graph, video, overlays)
+    if start > 0:
+        rebased = graph.label("rebase")
+        graph.filters.append(f"[{video}]setpts=PTS-STARTPTS[{rebased}]")
+        video = rebased
+
+    cmd = [
+        get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-y",
+        *graph.input_args,
+        "-filter_complex", ";".join(graph.filters),
+        "-map", f"[{video}]",
+        "-an",
+        "-t", f"{duration:.3f}",
+        "-r", str(settings.video.fps),
+        "-c:v", codec, *codec_params,
+        "-pix_fmt", "yuv420p",
+        str(output_path),
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"FFmpeg segment render failed: {result.stderr.strip()[-2000:]}")
+
+
+def _add_footage(graph: _FilterGraph, slots: list[_Slot], duration: float, cuda: bool = False) -> str:
+    """Add footage slots to the graph, concatenated back to back.
+
+    Each clip (or its resized copy, see resize_footage()) is read only up to
+    its slot length (looped at the demuxer if it is shorter), scaled to cover
+    the frame, center-cropped and trimmed. Without slots the video is black.
+
+    With `cuda`, clips are decoded by NVDEC and scaled on the GPU, so only
+    frames at the fill size are copied back for cropping and overlays.
+
+    Returns:
+        Label of the concatenated video stream
+    """
+    video_settings = settings.video
+    width, height, fps = video_settings.width, video_settings.height, video_settings.fps
+
+    if not slots:
+        out = graph.label("bg")
+        graph.filters.append(f"color=c=black:s={width}x{height}:r={fps}:d={duration:.3f}[{out}]")
+        return out
+
+    segments = []
+    for clip_slot in slots:
+        clip_path, info = clip_slot.path, clip_slot.info
+        slot = clip_slot.end - clip_slot.start
+
+        # Stop demuxing at the slot length; clips shorter than their slot are
+        # replayed by the demuxer rather than decoded into a loop filter
+        options = ["-an", "-t", f"{slot:.3f}"]
+        if info["duration"] < slot:
+            options = ["-stream_loop", "-1", *options]
+        if cuda:
+            options = ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda", *options]
+            scale = _cuda_scale(info, width, height)
+        else:
+            cover = cover_size(info["width"], info["height"], width, height)
+            scale = _scale_filter(info["width"], info["height"], cover)
+        index = graph.add_input(clip_path, *options)
+
+        segment = graph.label("seg")
+        graph.filters.append(
+            f"[{index}:v]{scale + ',' if scale else ''}"
+            f"crop={width}:{height},setsar=1,fps={fps},"
+            f"trim=duration={slot:.3f},setpts=PTS-STARTPTS[{segment}]"
+        )
+        segments.append(f"[{segment}]")
+
+    out = graph.label("video")
+    graph.filters.append(f"{''.join(segments)}concat=n={len(segments)}:v=1:a=0[{out}]")
+    return out
+
+
+def _cuda_scale(info: dict, width: int, height: int) -> str:
+    """Filter fragment that scales a GPU frame to cover width x height and downloads it."""
+    cover = cover_size(info["width"], info["height"], width, height)
+    # NV12 needs even dimensions; round up so the crop still fits
+    fill_width = 2 * math.ceil(cover[0] / 2)
+    fill_height = 2 * math.ceil(cover[1] / 2)
+    return f"scale_cuda={fill_width}:{fill_height}:format=nv12,hwdownload,format=nv12"
+
+
+def _prepare_overlays(project: Project, duration: float, tmp_dir: Path) -> list[_Overlay]:
+    """Pre-render the captions and hook text to transparent images.
+
+    Returns:
+        Overlay inputs, in the order they are laid over the footage
+    """
+    video_settings = settings.video
+    size = (video_settings.width, video_settings.height)
+    overlays = []
+
+    # Use real timestamps from ElevenLabs if available
+    word_timestamps = load_word_timestamps(project.voiceover_path)
+    if not word_timestamps:
+        script = project.get_script() or ""
+        word_timestamps = generate_word_timestamps(script, duration)
+
+    text_clips = caption_clips(word_timestamps, size[0])
+    if text_clips:
+        overlays.append(_caption_track(text_clips, size, duration, tmp_dir))
+
+    hook = project.state.hook_text
+    hook_clip = hook_text_clip(hook, size) if hook else None
+    if hook_clip is not None:
+        png_path = tmp_dir / "hook.png"
+        x, y = _write_overlay_png(hook_clip, size, png_path)
+        hook_duration = hook_clip.duration
+        overlays.append(
+            _Overlay(
+                path=png_path,
+                options=["-loop", "1", "-framerate", str(video_settings.fps), "-t", f"{hook_duration:.3f}"],
+                chain=(
+                    f"format=rgba,"
+                    f"fade=t=in:st=0:d={HOOK_FADE}:alpha=1,"
+                    f"fade=t=out:st={max(hook_duration - HOOK_FADE, 0):.3f}:d={HOOK_FADE}:alpha=1"
+                ),
+                x=x,
+                y=y,
+            )
+        )
+
+    return overlays
+
+
+def _add_overlays(graph: _FilterGraph, video: str, overlays: list[_Overlay]) -> str:
+    """Lay pre-rendered overlays over a video stream.
+
+    Returns:
+        Label of the video stream with overlays applied
+    """
+    for overlay in overlays:
+        index = graph.add_input(overlay.path, *overlay.options)
+        source = f"{index}:v"
+        if overlay.chain:
+            prepared = graph.label("ovl")
+            graph.filters.append(f"[{source}]{overlay.chain}[{prepared}]")
+            source = prepared
+
+        out = graph.label("over")
+        graph.filters.append(
+            f"[{video}][{source}]overlay=x={overlay.x}:y={overlay.y}:eof_action=pass[{out}]"
+        )
+        video = out
+
+    return video
+
+
+def _caption_track(
+    text_clips: list,
+    video_size: tuple[int, int],
+    duration: float,
+    tmp_dir: Path,
+) -> _Overlay:
+    """Pre-render all captions as a single overlay input.
+
+    Each caption is rasterized once onto a transparent canvas covering the
+    area all captions occupy, and the images are strung together with the
+    concat demuxer (transparent frames fill the gaps), so the graph blends
+    one overlay stream instead of one overlay per caption.
+
+    Returns:
+        The caption track overlay
+    """
+    import numpy as np
+    from PIL import Image
+
+    rasters = [_rasterize_clip(clip, video_size) for clip in text_clips]
+
+    # Canvas covering every caption's box
+    left = min(x for _, (x, y) in rasters)
+    top = min(y for _, (x, y) in rasters)
+    right = max(x + rgba.shape[1] for rgba, (x, y) in rasters)
+    bottom = max(y + rgba.shape[0] for rgba, (x, y) in rasters)
+    canvas_size = (bottom - top, right - left, 4)
+
+    blank_path = tmp_dir / "caption_blank.png"
+    Image.fromarray(np.zeros(canvas_size, dtype=np.uint8), "RGBA").save(blank_path, compress_level=1)
+
+    lines = []
+    current = 0.0
+    order = sorted(range(len(text_clips)), key=lambda i: text_clips[i].start)
+    for i in order:
+        clip = text_clips[i]
+        start = max(clip.start, current)
+        end = min(clip.start + clip.duration, duration)
+        if end <= start:
+            continue
+
+        if start > current:
+            lines += [f"file '{blank_path}'", f"duration {start - current:.3f}"]
+
+        rgba, (x, y) = rasters[i]
+        canvas = np.zeros(canvas_size, dtype=np.uint8)
+        canvas[y - top:y - top + rgba.shape[0], x - left:x - left + rgba.shape[1]] = rgba
+        png_path = tmp_dir / f"caption_{i:04d}.png"
+        Image.fromarray(canvas, "RGBA").save(png_path, compress_level=1)
+
+        lines += [f"file '{png_path}'", f"duration {end - start:.3f}"]
+        current = end
+
+    # The last entry's duration only applies if another file follows it
+    lines += [f"file '{blank_path}'", f"duration {max(duration - current, 0.001):.3f}", f"file '{blank_path}'"]
+
+    list_path = tmp_dir / "captions.txt"
+    list_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    return _Overlay(list_path, ["-f", "concat", "-safe", "0"], "", left, top)
+
+
+def _write_overlay_png(clip, video_size: tuple[int, int], path: Path) -> tuple[int, int]:
+    """Rasterize a static text clip to an RGBA PNG.
+
+    Returns:
+        (x, y) of the clip's top-left corner in the video frame
+    """
+    from PIL import Image
+
+    rgba, position = _rasterize_clip(clip, video_size)
+    Image.fromarray(rgba, "RGBA").save(path, compress_level=1)
+    return position
+
+
+def _rasterize_clip(clip, video_size: tuple[int, int]):
+    """Render a static text clip to an RGBA array.
+
+    Returns:
+        Tuple of (H x W x 4 uint8 array, (x, y) of its top-left corner in the frame)
+    """
+    import numpy as np
+
+    t = clip.duration / 2
+    rgb = clip.get_frame(t)
+    if clip.mask is not None:
+        alpha = (clip.mask.get_frame(t) * 255).astype(np.uint8)
+    else:
+        alpha = np.full(rgb.shape[:2], 255, dtype=np.uint8)
+
+    x, y = clip.pos(t)
+    if x == "center":
+        x = (video_size[0] - clip.w) // 2
+    if y == "center":
+        y = (video_size[1] - clip.h) // 2
+    return np.dstack([rgb.astype(np.uint8), alpha]), (int(x), int(y))
+
+
+def _add_music(graph: _FilterGraph, voiceover: str, music_path: Path, duration: float) -> str:
+    """Loop, attenuate and fade the music, then mix it under the voiceover.
+
+    Returns:
+        Label of the mixed audio stream
+    """
+    music_settings = settings.music
+    index = graph.add_input(music_path, "-stream_loop", "-1")
+
+    chain = [f"atrim=duration={duration:.3f}", f"volume={music_settings.volume}"]
+    if music_settings.fade_in > 0:
+        chain.append(f"afade=t=in:st=0:d={music_settings.fade_in}")
+    if music_settings.fade_out > 0:
+        fade_start = max(duration - music_settings.fade_out, 0)
+        chain.append(f"afade=t=out:st={fade_start:.3f}:d={music_settings.fade_out}")
+
+    music = graph.label("music")
+    graph.filters.append(f"[{index}:a]{','.join(chain)}[{music}]")
+
+    # normalize=0 sums the inputs like CompositeAudioClip instead of averaging them
+    out = graph.label("audio")
+    graph.filters.append(f"[{voiceover}][{music}]amix=inputs=2:duration=first:normalize=0[{out}]")
+    return out
@@ -1,20 +1,85 @@
 """Fetch stock footage from Pexels API."""
 
+import asyncio
+import importlib.util
+import os
 import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import httpx
 
-from ..core.config import get_niche_config, settings
+from ..core import jsonio
+from ..core.config import get_assets_dir, get_niche_config, settings
 from ..core.database import get_db
 from ..generators.llm import call_llm
 
+# Negotiate HTTP/2 with Pexels when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+PEXELS_API_URL = "https://api.pexels.com"
+
+# Shared HTTP client for Pexels API calls (created on first use)
+_search_client: Optional[httpx.Client] = None
+
+
+def _search_headers() -> dict:
+    return {"Authorization": settings.pexels_api_key}
+
+
+def _get_search_client() -> httpx.Client:
+    """Get the pooled HTTP client used for Pexels searches."""
+    global _search_client
+    if _search_client is None:
+        _search_client = httpx.Client(
+            base_url=PEXELS_API_URL,
+            headers=_search_headers(),
+            timeout=30.0,
+            http2=_HTTP2_AVAILABLE,
+        )
+    return _search_client
+
+
+def _search_params(keyword: str) -> dict:
+    return {
+        "query": keyword,
+        "orientation": settings.pexels.orientation,
+        "per_page": settings.pexels.per_page,
+    }
+
+
+# Raw Pexels responses by search parameters, so a keyword searched again
+# shortly after (fallback keywords, replacements) doesn't hit the API twice.
+# Only the response is cached; used-footage filtering runs on every call.
+SEARCH_CACHE_TTL = 300
+_SEARCH_CACHE_SIZE = 256
+_search_cache: dict[tuple, tuple[float, dict]] = {}
+
+
+def _cached_search(params: dict) -> Optional[dict]:
+    """Get a cached Pexels response for these search parameters, if still fresh."""
+    entry = _search_cache.get(tuple(params.items()))
+    if entry is None or time.monotonic() - entry[0] > SEARCH_CACHE_TTL:
+        return None
+    return entry[1]
+
+
+def _store_search(params: dict, data: dict) -> dict:
+    """Cache a Pexels search response, dropping the oldest once full."""
+    while len(_search_cache) >= _SEARCH_CACHE_SIZE:
+        _search_cache.pop(next(iter(_search_cache)))
+    _search_cache[tuple(params.items())] = (time.monotonic(), data)
+    return data
+
 
 def search_footage(
     keyword: str,
     min_duration: Optional[int] = None,
     exclude_used: bool = True,
+    max_results: Optional[int] = None,
 ) -> list[dict]:
     """Search for footage on Pexels.
 
@@ -22,35 +87,76 @@ def search_footage(
         keyword: Search keyword
         min_duration: Minimum clip duration in seconds
         exclude_used: Whether to exclude recently used clips
+        max_results: Stop after this many matching videos (default: all)
 
     Returns:
         List of video metadata dicts
     """
     min_duration = min_duration or settings.pexels.min_duration
 
-    url = "https://api.pexels.com/videos/search"
-    headers = {"Authorization": settings.pexels_api_key}
-    params = {
-        "query": keyword,
-        "orientation": settings.pexels.orientation,
-        "per_page": settings.pexels.per_page,
-    }
+    params = _search_params(keyword)
+    data = _cached_search(params)
+    if data is None:
+        response = _get_search_client().get("/videos/search", params=params)
+        response.raise_for_status()
+        data = _store_search(params, response.json())
+
+    return _parse_search_results(data, keyword, min_duration, exclude_used, max_results)
+
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.get(url, headers=headers, params=params)
+async def _search_footage_async(
+    client: httpx.AsyncClient,
+    keyword: str,
+    min_duration: Optional[int] = None,
+    exclude_used: bool = True,
+    max_results: Optional[int] = None,
+) -> list[dict]:
+    """Search for footage on Pexels using a shared async HTTP client.
+
+    Args:
+        client: Async Pexels API client (see _select_footage)
+        keyword: Search keyword
+        min_duration: Minimum clip duration in seconds
+        exclude_used: Whether to exclude recently used clips
+        max_results: Stop after this many matching videos (default: all)
+
+    Returns:
+        List of video metadata dicts
+    """
+    min_duration = min_duration or settings.pexels.min_duration
+
+    params = _search_params(keyword)
+    data = _cached_search(params)
+    if data is None:
+        response = await client.get("/videos/search", params=params)
         response.raise_for_status()
-        data = response.json()
+        data = _store_search(params, response.json())
+
+    return _parse_search_results(data, keyword, min_duration, exclude_used, max_results)
+
 
+def _parse_search_results(
+    data: dict,
+    keyword: str,
+    min_duration: int,
+    exclude_used: bool,
+    max_results: Optional[int] = None,
+) -> list[dict]:
+    """Turn a Pexels search response into video metadata dicts."""
     videos = []
-    db = get_db() if exclude_used else None
+    # One query for the whole response rather than one per video
+    used_ids = get_db().get_recently_used_footage_ids() if exclude_used else frozenset()
 
     for video in data.get("videos", []):
+        if max_results and len(videos) >= max_results:
+            break
+
         # Filter by duration
         if video.get("duration", 0) < min_duration:
             continue
 
         # Check if recently used
-        if db and db.is_footage_recently_used(video["id"]):
+        if video["id"] in used_ids:
             continue
 
         # Find best quality portrait video file
@@ -87,20 +193,41 @@ def _select_best_video_file(video_files: list[dict]) -> Optional[dict]:
     if not portrait_files:
         return None
 
-    # Sort by height (quality) descending, but cap at 1920
-    sorted_files = sorted(
-        portrait_files,
-        key=lambda f: min(f.get("height", 0), 1920),
-        reverse=True,
-    )
+    # Highest quality by height, but cap at 1920
+    return max(portrait_files, key=lambda f: min(f.get("height", 0), 1920))
+
+
+# Concurrent downloads per host (browser convention)
+DOWNLOAD_WORKERS = 6
+
+# Write downloads to disk in 1 MiB chunks
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Shared HTTP client for footage downloads (created on first use)
+_download_client: Optional[httpx.Client] = None
 
-    return sorted_files[0]
+
+def _get_download_client() -> httpx.Client:
+    """Get the pooled HTTP client used for footage downloads."""
+    global _download_client
+    if _download_client is None:
+        _download_client = httpx.Client(
+            timeout=120.0,
+            follow_redirects=True,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=DOWNLOAD_WORKERS * 2,
+                max_keepalive_connections=DOWNLOAD_WORKERS,
+            ),
+        )
+    return _download_client
 
 
 def download_clip(
     video_info: dict,
     output_dir: Path,
     filename: Optional[str] = None,
+    client: Optional[httpx.Client] = None,
 ) -> Path:
     """Download a video clip from Pexels.
 
@@ -108,6 +235,7 @@ def download_clip(
         video_info: Video metadata from search_footage
         output_dir: Directory to save the clip
         filename: Optional filename (default: generated from keyword)
+        client: Optional HTTP client (default: the shared pooled client)
 
     Returns:
         Path to downloaded file
@@ -115,23 +243,215 @@ def download_clip(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     if not filename:
-        keyword_slug = re.sub(r"[^\w\s-]", "", video_info["keyword"])
-        keyword_slug = re.sub(r"[-\s]+", "-", keyword_slug).strip("-")[:20]
-        filename = f"{video_info['pexels_id']}_{keyword_slug}.mp4"
+        filename = _default_filename(video_info)
 
     output_path = output_dir / filename
+    if _restore_from_cache(video_info, output_path):
+        return output_path
 
-    # Download the video
-    with httpx.Client(timeout=120.0, follow_redirects=True) as client:
-        response = client.get(video_info["url"])
+    # Stream the video to disk over a pooled connection
+    client = client or _get_download_client()
+    with client.stream("GET", video_info["url"]) as response:
         response.raise_for_status()
+        # Don't write through an old file, which may be linked to a cached clip
+        output_path.unlink(missing_ok=True)
+        with open(output_path, "wb") as f:
+            for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+    _store_in_cache(video_info, output_path)
+    return output_path
+
+
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_DASH_RE = re.compile(r"[-\s]+")
+
+
+def _default_filename(video_info: dict) -> str:
+    """Build a clip filename from the Pexels ID and a slug of its keyword."""
+    keyword_slug = _SLUG_DASH_RE.sub("-", _SLUG_STRIP_RE.sub("", video_info["keyword"]))
+    return f"{video_info['pexels_id']}_{keyword_slug.strip('-')[:20]}.mp4"
+
+
+def _footage_cache_dir() -> Path:
+    return get_assets_dir() / "cache" / "footage"
+
+
+def _footage_cache_path(video_info: dict) -> Optional[Path]:
+    """Location of the cached copy of a clip, or None if caching is off."""
+    if not settings.pexels.cache_downloads or "pexels_id" not in video_info:
+        return None
+    return _footage_cache_dir() / f"{video_info['pexels_id']}.mp4"
+
+
+def _link_or_copy(source: Path, target: Path):
+    """Hard-link `source` to `target` (replacing it), copying across devices.
+
+    Clips are only ever replaced or deleted, never edited in place, so the
+    cache and a project can safely share one file.
+    """
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        # Different filesystem, or one without hard links
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
+
+
+def _restore_from_cache(video_info: dict, output_path: Path) -> bool:
+    """Link a previously downloaded clip into place instead of re-downloading it."""
+    cache_path = _footage_cache_path(video_info)
+    if cache_path is None:
+        return False
+
+    try:
+        _link_or_copy(cache_path, output_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _store_in_cache(video_info: dict, output_path: Path):
+    """Keep a freshly downloaded clip for later reuse, then prune the cache."""
+    cache_path = _footage_cache_path(video_info)
+    if cache_path is None or cache_path.exists():
+        return
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    _link_or_copy(output_path, cache_path)
+    _prune_footage_cache(settings.pexels.cache_max_mb * 1024 * 1024)
+
+
+def _prune_footage_cache(max_bytes: int):
+    """Delete the oldest cached clips until the cache fits in max_bytes.
+
+    Age is the download time: touching a clip would also touch every
+    project's hard link to it and make their resized copies look stale.
+    """
+    entries = []
+    for path in _footage_cache_dir().glob("*.mp4"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def download_clips(
+    downloads: list[tuple[dict, str]],
+    output_dir: Path,
+    max_workers: int = DOWNLOAD_WORKERS,
+) -> list[Path]:
+    """Download several clips concurrently over the shared HTTP client.
 
+    Args:
+        downloads: List of (video_info, filename) pairs
+        output_dir: Directory to save the clips
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        Paths to the downloaded files, in the same order as `downloads`
+    """
+    if not downloads:
+        return []
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = min(max_workers, len(downloads))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(download_clip, video_info, output_dir, filename)
+            for video_info, filename in downloads
+        ]
+        return [future.result() for future in futures]
+
+
+async def adownload_clip(
+    video_info: dict,
+    output_dir: Path,
+    filename: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> Path:
+    """Download a video clip from Pexels without blocking the event loop.
+
+    Args:
+        video_info: Video metadata from search_footage
+        output_dir: Directory to save the clip
+        filename: Optional filename (default: generated from keyword)
+        client: Optional shared async HTTP client
+
+    Returns:
+        Path to downloaded file
+    """
+    if client is None:
+        async with httpx.AsyncClient(timeout=120.0, follow_redirects=True) as own_client:
+            return await adownload_clip(video_info, output_dir, filename, own_client)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if not filename:
+        filename = _default_filename(video_info)
+
+    output_path = output_dir / filename
+    if await asyncio.to_thread(_restore_from_cache, video_info, output_path):
+        return output_path
+
+    async with client.stream("GET", video_info["url"]) as response:
+        response.raise_for_status()
+        # Don't write through an old file, which may be linked to a cached clip
+        output_path.unlink(missing_ok=True)
         with open(output_path, "wb") as f:
-            f.write(response.content)
+            async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
 
+    await asyncio.to_thread(_store_in_cache, video_info, output_path)
     return output_path
 
 
+async def adownload_clips(
+    downloads: list[tuple[dict, str]],
+    output_dir: Path,
+    max_connections: int = 16,
+) -> list[Path]:
+    """Download several clips concurrently on the running event loop.
+
+    Args:
+        downloads: List of (video_info, filename) pairs
+        output_dir: Directory to save the clips
+        max_connections: Maximum number of open connections
+
+    Returns:
+        Paths to the downloaded files, in the same order as `downloads`
+    """
+    if not downloads:
+        return []
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    limits = httpx.Limits(max_connections=max_connections)
+
+    async with httpx.AsyncClient(
+        timeout=120.0,
+        follow_redirects=True,
+        limits=limits,
+        http2=_HTTP2_AVAILABLE,
+    ) as client:
+        return await asyncio.gather(
+            *(
+                adownload_clip(video_info, output_dir, filename, client)
+                for video_info, filename in downloads
+            )
+        )
+
+
 def get_footage_for_script(
     script: str,
     niche: Optional[str] = None,
@@ -150,42 +470,71 @@ def get_footage_for_script(
     # Get keywords from script using AI
     keywords = _extract_keywords(script, niche, clips_needed)
 
-    # Search for each keyword
-    all_footage = []
-    used_ids = set()
+    return asyncio.run(_select_footage(keywords, clips_needed))
 
-    for keyword in keywords:
-        results = search_footage(keyword, exclude_used=True)
 
-        for video in results:
-            if video["pexels_id"] not in used_ids:
-                video["matched_keyword"] = keyword
-                all_footage.append(video)
-                used_ids.add(video["pexels_id"])
+# Keywords searched at once. Usually one or two keywords supply every clip,
+# so small waves keep the latency win without spending much of the Pexels
+# hourly request quota on searches whose results go unused.
+SEARCH_WAVE_SIZE = 3
 
-                if len(all_footage) >= clips_needed:
-                    break
+# Searched only if the script's own keywords don't yield enough clips
+GENERIC_KEYWORDS = ["abstract", "nature", "city", "technology", "people"]
 
-        if len(all_footage) >= clips_needed:
-            break
 
-    # If not enough footage, try generic keywords
-    if len(all_footage) < clips_needed:
-        generic_keywords = ["abstract", "nature", "city", "technology", "people"]
-        for keyword in generic_keywords:
-            results = search_footage(keyword, exclude_used=True)
-            for video in results:
-                if video["pexels_id"] not in used_ids:
-                    video["matched_keyword"] = keyword
-                    all_footage.append(video)
-                    used_ids.add(video["pexels_id"])
+async def _select_footage(keywords: list[str], clips_needed: int) -> list[dict]:
+    """Pick unused clips for keywords in order, searching in concurrent waves.
 
-                    if len(all_footage) >= clips_needed:
-                        break
-            if len(all_footage) >= clips_needed:
-                break
+    Stops searching as soon as enough clips are collected, and falls back to
+    GENERIC_KEYWORDS only when the given keywords come up short.
+    """
+    all_footage = []
+    used_ids = set()
 
-    return all_footage[:clips_needed]
+    async with httpx.AsyncClient(
+        base_url=PEXELS_API_URL,
+        headers=_search_headers(),
+        timeout=30.0,
+        http2=_HTTP2_AVAILABLE,
+    ) as client:
+        for group in (keywords, GENERIC_KEYWORDS):
+            for i in range(0, len(group), SEARCH_WAVE_SIZE):
+                wave = group[i:i + SEARCH_WAVE_SIZE]
+                # A single keyword never needs to supply more than the whole batch
+                searches = await asyncio.gather(
+                    *(
+                        _search_footage_async(client, keyword, max_results=clips_needed)
+                        for keyword in wave
+                    )
+                )
+
+                for keyword, results in zip(wave, searches):
+                    for video in results:
+                        if video["pexels_id"] not in used_ids:
+                            video["matched_keyword"] = keyword
+                            all_footage.append(video)
+                            used_ids.add(video["pexels_id"])
+
+                            if len(all_footage) >= clips_needed:
+                                return all_footage
+
+    return all_footage
+
+
+# A flat JSON array anywhere in an LLM response (code fences, preamble, ...)
+_JSON_ARRAY_RE = re.compile(r"\[[^\[\]]*\]")
+
+
+def _parse_json_array(response: str) -> list:
+    """Parse the first JSON array in an LLM response.
+
+    Raises:
+        jsonio.JSONDecodeError: If the response contains no valid array
+    """
+    match = _JSON_ARRAY_RE.search(response)
+    if match is None:
+        raise jsonio.JSONDecodeError("No JSON array in response", response, 0)
+    return jsonio.loads(match.group(0))
 
 
 def _extract_keywords(
@@ -236,20 +585,14 @@ Requirements:
 
 Return ONLY a JSON array of keywords, e.g.: ["US dollars cash", "american businessman", "laptop typing", ...]"""
 
-    response = call_llm(prompt, temperature=0.7)
+    # Same script, same keywords: re-fetching footage for a project reuses them
+    response = call_llm(prompt, temperature=0.7, cache=True)
 
     # Parse response
     try:
-        import json
-
-        response = response.strip()
-        if response.startswith("```"):
-            response = response.split("\n", 1)[1]
-            response = response.rsplit("```", 1)[0]
-
-        keywords = json.loads(response)
+        keywords = _parse_json_array(response)
         return keywords[: count + 2]
-    except (json.JSONDecodeError, IndexError):
+    except jsonio.JSONDecodeError:
         # Fallback: extract nouns from script
         words = script.lower().split()
         # Return unique words longer than 4 chars
@@ -286,13 +629,8 @@ Return ONLY a JSON array, e.g.: ["alt1", "alt2", "alt3"]"""
 
     try:
         response = call_llm(prompt, temperature=0.8)
-        import json
 
-        response = response.strip()
-        if response.startswith("```"):
-            response = response.split("\n", 1)[1]
-            response = response.rsplit("```", 1)[0]
-        alternatives = json.loads(response)
+        alternatives = _parse_json_array(response)
 
         for alt_keyword in alternatives:
             results = search_footage(alt_keyword, exclude_used=True)
@@ -300,7 +638,7 @@ Return ONLY a JSON array, e.g.: ["alt1", "alt2", "alt3"]"""
                 if video["pexels_id"] not in exclude_ids:
                     video["matched_keyword"] = alt_keyword
                     return video
-    except (json.JSONDecodeError, Exception):
+    except Exception:
         pass
 
     return None
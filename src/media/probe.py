@@ -0,0 +1,38 @@
+"""Cached media probing (duration and frame size)."""
+
+from pathlib import Path
+
+from ..core.cache import disk_cache
+
+
+def probe_media(path: Path) -> dict:
+    """Get the duration and video frame size of a media file.
+
+    Results are cached on disk keyed by path, modification time and size,
+    so re-rendering a project doesn't spawn ffmpeg to re-read headers of
+    files that haven't changed.
+
+    Args:
+        path: Path to an audio or video file
+
+    Returns:
+        Dict with 'duration' (seconds) and 'width'/'height' (None for audio)
+    """
+    stat = path.stat()
+    return _probe(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@disk_cache("probe")
+def _probe(path: str, mtime_ns: int, size: int) -> dict:
+    """Read a file's headers with ffmpeg (mtime and size only key the cache)."""
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+    infos = ffmpeg_parse_infos(path)
+    width = height = None
+    if infos.get("video_found"):
+        width, height = infos["video_size"]
+        # Rotated videos are decoded upright, so report the displayed size
+        if abs(infos.get("video_rotation", 0)) in (90, 270):
+            width, height = height, width
+
+    return {"duration": infos["duration"], "width": width, "height": height}